@@ -1,7 +1,8 @@
 """Intent parsing and command extraction."""
 
+import functools
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum, auto
 
 
@@ -16,17 +17,80 @@ class IntentType(Enum):
     UNKNOWN = auto()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Intent:
-    """Parsed intent from user input."""
+    """Parsed intent from user input.
+
+    Immutable and hashable; parameters are stored as (name, value) pairs.
+    """
 
     type: IntentType
     action: str | None = None
     target: str | None = None
-    parameters: dict[str, str] = field(default_factory=dict)
+    params: tuple[tuple[str, str], ...] = ()
     confidence: float = 1.0
     raw_text: str = ""
 
+    @property
+    def parameters(self) -> dict[str, str]:
+        """Parameters as a new dict."""
+        return dict(self.params)
+
+
+_Branch = tuple[str, list[str], int]
+_Params = tuple[tuple[str, str], ...]
+_IntentTemplate = tuple[IntentType, str | None, _Params]
+
+
+def _fuse(
+    patterns: list[tuple[str, str, list[str]]],
+) -> tuple[re.Pattern[str], dict[str, _Branch]]:
+    """Fuse a category's patterns into one case-insensitive regex.
+
+    Each pattern becomes a named branch of a single anchored alternation, so a
+    single ``match`` call dispatches the whole category in C. Every branch is
+    prefixed with a lazy ``.*?`` scan, which preserves the original semantics of
+    trying the patterns in order: the first pattern that matches anywhere in
+    the text wins, at its leftmost position.
+
+    Returns:
+        The compiled regex and a map of branch name -> (action, param_names,
+        index of the branch's first capturing group).
+    """
+    branches: list[str] = []
+    table: dict[str, _Branch] = {}
+    group = 0
+    for i, (pattern, action, param_names) in enumerate(patterns):
+        name = f"p{i}_{action}"
+        n_groups = re.compile(pattern).groups
+        if n_groups != len(param_names):
+            raise ValueError(f"Pattern {pattern!r} does not capture {param_names}")
+        table[name] = (action, param_names, group + 2)
+        branches.append(f"(?s:.*?)(?P<{name}>{pattern})")
+        group += 1 + n_groups
+    return re.compile("|".join(branches), re.IGNORECASE), table
+
+
+def _match(
+    regex: re.Pattern[str], table: dict[str, _Branch], text: str
+) -> tuple[str, _Params] | None:
+    """Match text against a fused category regex.
+
+    Patterns match case-insensitively against the original text, so captured
+    values are lowercased here to keep parameters normalized.
+
+    Returns:
+        Tuple of (action, parameters) for the branch that fired, or None.
+    """
+    match = regex.match(text)
+    if match is None or match.lastgroup is None:
+        return None
+    action, param_names, first = table[match.lastgroup]
+    params = tuple(
+        (name, match.group(first + i).lower()) for i, name in enumerate(param_names)
+    )
+    return action, params
+
 
 class IntentParser:
     """Parses user input to extract structured intents.
@@ -35,7 +99,9 @@ class IntentParser:
     This provides fast response for simple commands.
     """
 
-    # Pattern-based intent matching for speed
+    # Pattern-based intent matching for speed. Each category's patterns are
+    # fused into one compiled regex at class creation (see _fuse), and matched
+    # case-insensitively so parse() never builds a lowercased copy of the input.
     HOME_PATTERNS = [
         (r"turn (on|off) (?:the )?(.+)", "power", ["state", "device"]),
         (r"set (?:the )?(.+) to (\d+)%?", "set_level", ["device", "level"]),
@@ -56,56 +122,73 @@ class IntentParser:
         (r"is (?:there )?anyone (?:there|here)", "detect_people", []),
     ]
 
+    # Words at least one of which every pattern above requires. Text with
+    # none of them can't match any category, so it skips the pattern regexes
+    # (and the parse cache) entirely. Substring match, like the patterns.
+    TRIGGER_RE = re.compile(
+        r"turn|set|dim|brighten|lock|mute|pause|play|stop|next|previous|see|who|anyone",
+        re.IGNORECASE,
+    )
+
+    # Prefix match (no word boundary) so "does" and "isn't" still count
+    QUESTION_RE = re.compile(
+        r"\s*(?:what|who|where|when|why|how|is|are|can|do)", re.IGNORECASE
+    )
+
+    HOME_RE, _HOME_BRANCHES = _fuse(HOME_PATTERNS)
+    SYSTEM_RE, _SYSTEM_BRANCHES = _fuse(SYSTEM_PATTERNS)
+    VISION_RE, _VISION_BRANCHES = _fuse(VISION_PATTERNS)
+
     def parse(self, text: str) -> Intent:
         """Parse text into an Intent.
 
         First tries pattern matching for speed, then falls back to
         indicating CONVERSATION intent for LLM handling.
         """
-        text_lower = text.lower().strip()
+        if self.TRIGGER_RE.search(text) is None:
+            return Intent(type=IntentType.CONVERSATION, raw_text=text)
+
+        intent_type, action, params = self._parse_cached(text.strip())
+        target = None
+        if intent_type is IntentType.HOME_CONTROL:
+            target = dict(params).get("device")
+        return Intent(
+            type=intent_type,
+            action=action,
+            target=target,
+            params=params,
+            raw_text=text,
+        )
 
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def _parse_cached(cls, text: str) -> _IntentTemplate:
+        """Run the pattern categories over text.
+
+        Users repeat the same short commands constantly, so results (including
+        misses) are cached. The cached template holds no reference to the raw
+        text; parse() builds a fresh Intent from it on every call.
+        """
         # Try home automation patterns
-        for pattern, action, param_names in self.HOME_PATTERNS:
-            if match := re.search(pattern, text_lower):
-                params = dict(zip(param_names, match.groups()))
-                return Intent(
-                    type=IntentType.HOME_CONTROL,
-                    action=action,
-                    target=params.get("device"),
-                    parameters=params,
-                    raw_text=text,
-                )
+        if result := _match(cls.HOME_RE, cls._HOME_BRANCHES, text):
+            return (IntentType.HOME_CONTROL, *result)
 
         # Try system patterns
-        for pattern, action, param_names in self.SYSTEM_PATTERNS:
-            if match := re.search(pattern, text_lower):
-                params = dict(zip(param_names, match.groups()))
-                return Intent(
-                    type=IntentType.SYSTEM,
-                    action=action,
-                    parameters=params,
-                    raw_text=text,
-                )
+        if result := _match(cls.SYSTEM_RE, cls._SYSTEM_BRANCHES, text):
+            return (IntentType.SYSTEM, *result)
 
         # Try vision patterns
-        for pattern, action, param_names in self.VISION_PATTERNS:
-            if match := re.search(pattern, text_lower):
-                params = dict(zip(param_names, match.groups()))
-                return Intent(
-                    type=IntentType.VISION,
-                    action=action,
-                    parameters=params,
-                    raw_text=text,
-                )
+        if result := _match(cls.VISION_RE, cls._VISION_BRANCHES, text):
+            return (IntentType.VISION, *result)
 
         # Default to conversation - let LLM handle it
-        return Intent(
-            type=IntentType.CONVERSATION,
-            raw_text=text,
-        )
+        return (IntentType.CONVERSATION, None, ())
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear cached parse results, e.g. after patterns are changed."""
+        cls._parse_cached.cache_clear()
 
     def is_question(self, text: str) -> bool:
         """Check if text is a question."""
-        question_words = ["what", "who", "where", "when", "why", "how", "is", "are", "can", "do"]
-        text_lower = text.lower().strip()
-        return text_lower.endswith("?") or any(text_lower.startswith(w) for w in question_words)
+        return text.rstrip().endswith("?") or self.QUESTION_RE.match(text) is not None
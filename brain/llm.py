@@ -1,9 +1,16 @@
 """Multi-provider LLM client."""
 
+import asyncio
+import functools
+import hashlib
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 from typing import Any
 
-from brain.providers.base import LLMProviderBase
+import httpx
+import orjson
+
+from brain.providers.base import LLMProviderBase, create_http_client
 from brain.providers.anthropic import AnthropicProvider
 from brain.providers.google import GoogleProvider
 from brain.providers.ollama import OllamaProvider
@@ -18,13 +25,27 @@ Keep responses brief and conversational unless asked for detail."""
 
 # Default models for each provider
 DEFAULT_MODELS: dict[LLMProvider, str] = {
-    LLMProvider.OLLAMA: "llama3.2",
+    LLMProvider.OLLAMA: "llama3.2:3b-instruct-q4_K_M",
     LLMProvider.OPENAI: "gpt-4o",
     LLMProvider.ANTHROPIC: "claude-sonnet-4-20250514",
     LLMProvider.GOOGLE: "gemini-1.5-flash",
     LLMProvider.XAI: "grok-2-latest",
 }
 
+# Provider implementation for each provider
+PROVIDER_CLASSES: dict[LLMProvider, type[LLMProviderBase]] = {
+    LLMProvider.OLLAMA: OllamaProvider,
+    LLMProvider.OPENAI: OpenAIProvider,
+    LLMProvider.ANTHROPIC: AnthropicProvider,
+    LLMProvider.GOOGLE: GoogleProvider,
+    LLMProvider.XAI: XAIProvider,
+}
+
+# Response cache size, and the temperature above which replies are too
+# varied to be worth replaying
+RESPONSE_CACHE_SIZE = 256
+CACHEABLE_TEMPERATURE = 0.1
+
 
 class LLMClient:
     """Multi-provider LLM client.
@@ -33,32 +54,33 @@ class LLMClient:
     (OpenAI, Anthropic, Google, xAI) with a unified interface.
     """
 
-    def __init__(self, settings: LLMSettings) -> None:
+    def __init__(
+        self,
+        settings: LLMSettings,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         self.settings = settings
-        self._provider: LLMProviderBase | None = None
+        # One HTTP/2 connection pool is shared by every cloud provider
+        self._owns_http_client = http_client is None
+        self._http_client = http_client or create_http_client()
+        # Providers are kept alive once created so switching back and forth
+        # reuses their warm HTTP connection pools.
+        self._providers: dict[LLMProvider, LLMProviderBase] = {}
+        self._response_cache: OrderedDict[bytes, str] = OrderedDict()
+        self._in_flight: dict[bytes, asyncio.Task[str]] = {}
 
     def _get_provider(self) -> LLMProviderBase:
         """Get or create the configured provider."""
-        if self._provider is None:
-            provider_class: type[LLMProviderBase]
-
-            match self.settings.provider:
-                case LLMProvider.OLLAMA:
-                    provider_class = OllamaProvider
-                case LLMProvider.OPENAI:
-                    provider_class = OpenAIProvider
-                case LLMProvider.ANTHROPIC:
-                    provider_class = AnthropicProvider
-                case LLMProvider.GOOGLE:
-                    provider_class = GoogleProvider
-                case LLMProvider.XAI:
-                    provider_class = XAIProvider
-                case _:
-                    raise ValueError(f"Unknown provider: {self.settings.provider}")
-
-            self._provider = provider_class(self.settings)
-
-        return self._provider
+        provider = self._providers.get(self.settings.provider)
+        if provider is None:
+            provider_class = PROVIDER_CLASSES.get(self.settings.provider)
+            if provider_class is None:
+                raise ValueError(f"Unknown provider: {self.settings.provider}")
+
+            provider = provider_class(self.settings, self._http_client)
+            self._providers[self.settings.provider] = provider
+
+        return provider
 
     async def generate(
         self,
@@ -76,12 +98,64 @@ class LLMClient:
         Returns:
             The assistant's response text
         """
-        provider = self._get_provider()
-        return await provider.generate(
-            messages=messages,
-            system=system or SYSTEM_PROMPT,
-            tools=tools,
-        )
+        system = system or SYSTEM_PROMPT
+        key = self._cache_key(messages, system, tools)
+        cacheable = self.settings.temperature <= CACHEABLE_TEMPERATURE
+        if cacheable:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                self._response_cache.move_to_end(key)
+                return cached
+
+        # Identical concurrent requests share a single provider call
+        task = self._in_flight.get(key)
+        if task is None:
+            provider = self._get_provider()
+            task = asyncio.create_task(
+                provider.generate(messages=messages, system=system, tools=tools)
+            )
+            self._in_flight[key] = task
+            task.add_done_callback(functools.partial(self._request_done, key))
+
+        # Shielded so one caller's cancellation doesn't fail the others
+        response = await asyncio.shield(task)
+
+        if cacheable:
+            self._response_cache[key] = response
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+        return response
+
+    def _request_done(self, key: bytes, task: asyncio.Task[str]) -> None:
+        """Forget a finished in-flight request."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved in case every waiter was cancelled
+            task.exception()
+
+    def _cache_key(
+        self,
+        messages: list[dict[str, str]],
+        system: str,
+        tools: list[dict[str, Any]] | None,
+    ) -> bytes:
+        """Hash everything that determines a response into a cache key."""
+        blob = orjson.dumps((
+            self.settings.provider,
+            self.settings.model,
+            self.settings.temperature,
+            self.settings.max_tokens,
+            system,
+            messages,
+            tools,
+        ))
+        return hashlib.blake2b(blob, digest_size=16).digest()
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached responses."""
+        self._response_cache.clear()
 
     async def generate_stream(
         self,
@@ -99,6 +173,54 @@ class LLMClient:
         ):
             yield chunk
 
+    async def generate_speculative(
+        self,
+        partial_messages: AsyncIterator[list[dict[str, str]]],
+        system: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream a response while the user's turn is still being transcribed.
+
+        Each time a newer partial conversation arrives, the in-flight
+        generation is cancelled and restarted with it, so inference overlaps
+        end-of-turn detection. When ``partial_messages`` is exhausted the
+        turn is committed and the latest generation is yielded.
+
+        Args:
+            partial_messages: Successive versions of the conversation, ending
+                with the final one
+            system: Optional system prompt override
+
+        Yields:
+            Text chunks of the response to the final conversation
+        """
+        task: asyncio.Task[None] | None = None
+        queue: asyncio.Queue[str | None] = asyncio.Queue()
+
+        async def run(messages: list[dict[str, str]], out: asyncio.Queue[str | None]) -> None:
+            try:
+                async for chunk in self.generate_stream(messages, system):
+                    out.put_nowait(chunk)
+            finally:
+                out.put_nowait(None)
+
+        try:
+            async for messages in partial_messages:
+                if task is not None:
+                    task.cancel()
+                queue = asyncio.Queue()
+                task = asyncio.create_task(run(messages, queue))
+
+            if task is None:
+                return
+
+            while (chunk := await queue.get()) is not None:
+                yield chunk
+            # Surface any provider error from the committed generation
+            await task
+        finally:
+            if task is not None and not task.done():
+                task.cancel()
+
     async def switch_provider(self, provider: LLMProvider, model: str | None = None) -> None:
         """Switch to a different provider at runtime.
 
@@ -106,20 +228,20 @@ class LLMClient:
             provider: The new provider to use
             model: Optional model name (uses default if not specified)
         """
-        # Close existing provider
-        if self._provider:
-            await self._provider.close()
-            self._provider = None
-
-        # Update settings
+        # Existing providers stay open, so only the settings change
         self.settings.provider = provider
         if model:
             self.settings.model = model
         else:
             self.settings.model = DEFAULT_MODELS.get(provider, "")
+        for cached in self._providers.values():
+            cached.refresh_skeleton()
 
     async def close(self) -> None:
         """Cleanup resources."""
-        if self._provider:
-            await self._provider.close()
-            self._provider = None
+        providers = list(self._providers.values())
+        self._providers.clear()
+        for provider in providers:
+            await provider.close()
+        if self._owns_http_client:
+            await self._http_client.aclose()
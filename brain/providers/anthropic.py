@@ -4,25 +4,35 @@ from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
+import orjson
 
-from brain.providers.base import LLMProviderBase
+from brain.providers.base import LLMProviderBase, iter_sse_data
 from core.config import LLMSettings
 
 
 class AnthropicProvider(LLMProviderBase):
     """Anthropic Claude API provider."""
 
-    def __init__(self, settings: LLMSettings) -> None:
-        super().__init__(settings)
-        self._client = httpx.AsyncClient(
-            base_url=settings.anthropic_base_url,
-            headers={
-                "x-api-key": settings.anthropic_api_key,
-                "Content-Type": "application/json",
-                "anthropic-version": "2023-06-01",
-            },
-            timeout=60.0,
-        )
+    def __init__(
+        self,
+        settings: LLMSettings,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        super().__init__(settings, http_client)
+        self._url = f"{settings.anthropic_base_url.rstrip('/')}/v1/messages"
+        self._headers = {
+            "x-api-key": settings.anthropic_api_key,
+            "Content-Type": "application/json",
+            "anthropic-version": "2023-06-01",
+        }
+
+    def _build_payload(self) -> dict[str, Any]:
+        """Build the request fields shared by every call."""
+        return {
+            "model": self.settings.model,
+            "max_tokens": self.settings.max_tokens,
+            "temperature": self.settings.temperature,
+        }
 
     async def generate(
         self,
@@ -31,20 +41,8 @@ class AnthropicProvider(LLMProviderBase):
         tools: list[dict[str, Any]] | None = None,
     ) -> str:
         """Generate a response using Anthropic API."""
-        # Anthropic uses a different message format
-        anthropic_messages = []
-        for msg in messages:
-            anthropic_messages.append({
-                "role": msg["role"],
-                "content": msg["content"],
-            })
-
-        payload: dict[str, Any] = {
-            "model": self.settings.model,
-            "messages": anthropic_messages,
-            "max_tokens": self.settings.max_tokens,
-            "temperature": self.settings.temperature,
-        }
+        # {role, content} dicts are already in Anthropic's message format
+        payload: dict[str, Any] = {**self._payload, "messages": messages}
 
         if system:
             payload["system"] = system
@@ -61,17 +59,12 @@ class AnthropicProvider(LLMProviderBase):
                 if "function" in t
             ]
 
-        response = await self._client.post("/v1/messages", json=payload)
-        response.raise_for_status()
-        data = response.json()
+        data = await self._post_json(self._url, payload, self._headers)
 
         # Extract text from content blocks
-        text_parts = []
-        for block in data.get("content", []):
-            if block["type"] == "text":
-                text_parts.append(block["text"])
-
-        return "".join(text_parts)
+        return "".join(
+            block["text"] for block in data.get("content", ()) if block["type"] == "text"
+        )
 
     async def generate_stream(
         self,
@@ -79,35 +72,18 @@ class AnthropicProvider(LLMProviderBase):
         system: str | None = None,
     ) -> AsyncIterator[str]:
         """Stream a response from Anthropic API."""
-        anthropic_messages = []
-        for msg in messages:
-            anthropic_messages.append({
-                "role": msg["role"],
-                "content": msg["content"],
-            })
-
-        payload: dict[str, Any] = {
-            "model": self.settings.model,
-            "messages": anthropic_messages,
-            "max_tokens": self.settings.max_tokens,
-            "temperature": self.settings.temperature,
-            "stream": True,
-        }
+        payload: dict[str, Any] = {**self._payload, "messages": messages, "stream": True}
 
         if system:
             payload["system"] = system
 
-        async with self._client.stream("POST", "/v1/messages", json=payload) as response:
+        async with self._stream_json(self._url, payload, self._headers) as response:
             response.raise_for_status()
-            async for line in response.aiter_lines():
-                if line.startswith("data: "):
-                    import json
-
-                    data = json.loads(line[6:])
-                    if data["type"] == "content_block_delta":
-                        if data["delta"]["type"] == "text_delta":
-                            yield data["delta"]["text"]
-
-    async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+            async for raw in iter_sse_data(response):
+                # Skip pings and other control events without parsing them
+                if b'"text_delta"' not in raw:
+                    continue
+                data = orjson.loads(raw)
+                if data["type"] == "content_block_delta":
+                    if data["delta"]["type"] == "text_delta":
+                        yield data["delta"]["text"]
@@ -2,16 +2,131 @@
 
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager
 from typing import Any
 
+import httpx
+import orjson
+
 from core.config import LLMSettings
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create an HTTP/2 client suitable for sharing between providers and skills.
+
+    Callers pass their base URL and auth headers per request, so a single
+    connection pool can serve every cloud API.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=60.0,
+        limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=120),
+    )
+
+
+async def iter_sse_data(response: httpx.Response) -> AsyncIterator[bytes]:
+    """Yield the raw ``data:`` payload of each server-sent event line.
+
+    Works on the byte stream directly, so a streamed token costs a buffer
+    search and a slice instead of a text decode and line split.
+
+    Args:
+        response: A streaming response with an SSE body
+
+    Yields:
+        The bytes after ``data:`` for every data line, in order
+    """
+    buffer = bytearray()
+    async for chunk in response.aiter_bytes():
+        buffer += chunk.replace(b"\r\n", b"\n")
+        start = 0
+        while (end := buffer.find(b"\n\n", start)) != -1:
+            for line in buffer[start:end].split(b"\n"):
+                if line.startswith(b"data:"):
+                    yield bytes(line[5:].strip())
+            start = end + 2
+        del buffer[:start]
+
+    # A final event may arrive without the trailing blank line
+    for line in buffer.split(b"\n"):
+        if line.startswith(b"data:"):
+            yield bytes(line[5:].strip())
+
 
 class LLMProviderBase(ABC):
     """Abstract base class for LLM providers."""
 
-    def __init__(self, settings: LLMSettings) -> None:
+    def __init__(
+        self,
+        settings: LLMSettings,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         self.settings = settings
+        self._http_client = http_client
+        self._owns_http_client = False
+        self._payload: dict[str, Any] = {}
+        self.refresh_skeleton()
+
+    def refresh_skeleton(self) -> None:
+        """Rebuild the settings-derived part of each request.
+
+        Request fields that only depend on settings are built once here rather
+        than on every call. Must be called after the settings change.
+        """
+        self._payload = self._build_payload()
+
+    def _build_payload(self) -> dict[str, Any]:
+        """Build the request fields shared by every call."""
+        return {}
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """HTTP client for API requests.
+
+        Uses the client passed at construction time, or lazily creates a
+        private one that is closed along with the provider.
+        """
+        if self._http_client is None:
+            self._http_client = create_http_client()
+            self._owns_http_client = True
+        return self._http_client
+
+    async def _post_json(
+        self,
+        url: str,
+        payload: dict[str, Any],
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        """POST a JSON payload and return the decoded JSON response.
+
+        Serializes with orjson rather than httpx's stdlib json encoder.
+
+        Args:
+            url: Absolute request URL
+            payload: Request body
+            headers: Request headers (defaults to a JSON content type)
+
+        Returns:
+            The parsed response body
+        """
+        response = await self.http.post(
+            url, content=orjson.dumps(payload), headers=headers or _JSON_HEADERS
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def _stream_json(
+        self,
+        url: str,
+        payload: dict[str, Any],
+        headers: dict[str, str] | None = None,
+    ) -> AbstractAsyncContextManager[httpx.Response]:
+        """Open a streaming POST with an orjson-encoded payload."""
+        return self.http.stream(
+            "POST", url, content=orjson.dumps(payload), headers=headers or _JSON_HEADERS
+        )
 
     @abstractmethod
     async def generate(
@@ -46,4 +161,7 @@ class LLMProviderBase(ABC):
 
     async def close(self) -> None:
         """Cleanup resources."""
-        pass
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self._owns_http_client = False
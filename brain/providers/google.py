@@ -4,21 +4,40 @@ from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
+import orjson
 
-from brain.providers.base import LLMProviderBase
+from brain.providers.base import LLMProviderBase, iter_sse_data
 from core.config import LLMSettings
 
 
 class GoogleProvider(LLMProviderBase):
     """Google Gemini API provider."""
 
-    def __init__(self, settings: LLMSettings) -> None:
-        super().__init__(settings)
-        self._client = httpx.AsyncClient(
-            base_url=settings.google_base_url,
-            timeout=60.0,
-        )
-        self._api_key = settings.google_api_key
+    def __init__(
+        self,
+        settings: LLMSettings,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self._generate_url = ""
+        self._stream_url = ""
+        super().__init__(settings, http_client)
+
+    def refresh_skeleton(self) -> None:
+        """Rebuild the cached payload fields and model-specific URLs."""
+        super().refresh_skeleton()
+        model_url = f"{self.settings.google_base_url.rstrip('/')}/models/{self.settings.model}"
+        key = self.settings.google_api_key
+        self._generate_url = f"{model_url}:generateContent?key={key}"
+        self._stream_url = f"{model_url}:streamGenerateContent?key={key}&alt=sse"
+
+    def _build_payload(self) -> dict[str, Any]:
+        """Build the request fields shared by every call."""
+        return {
+            "generationConfig": {
+                "temperature": self.settings.temperature,
+                "maxOutputTokens": self.settings.max_tokens,
+            },
+        }
 
     def _convert_messages(
         self, messages: list[dict[str, str]], system: str | None
@@ -44,29 +63,18 @@ class GoogleProvider(LLMProviderBase):
         """Generate a response using Gemini API."""
         contents, system_instruction = self._convert_messages(messages, system)
 
-        payload: dict[str, Any] = {
-            "contents": contents,
-            "generationConfig": {
-                "temperature": self.settings.temperature,
-                "maxOutputTokens": self.settings.max_tokens,
-            },
-        }
+        payload: dict[str, Any] = {**self._payload, "contents": contents}
 
         if system_instruction:
             payload["systemInstruction"] = {"parts": [{"text": system_instruction}]}
 
-        url = f"/models/{self.settings.model}:generateContent?key={self._api_key}"
-        response = await self._client.post(url, json=payload)
-        response.raise_for_status()
-        data = response.json()
+        data = await self._post_json(self._generate_url, payload)
 
-        # Extract text from response
-        candidates = data.get("candidates", [])
+        # Extract text from every part of the first candidate
+        candidates = data.get("candidates", ())
         if candidates:
-            content = candidates[0].get("content", {})
-            parts = content.get("parts", [])
-            if parts:
-                return parts[0].get("text", "")
+            parts = candidates[0].get("content", {}).get("parts", ())
+            return "".join(part.get("text", "") for part in parts)
 
         return ""
 
@@ -78,33 +86,17 @@ class GoogleProvider(LLMProviderBase):
         """Stream a response from Gemini API."""
         contents, system_instruction = self._convert_messages(messages, system)
 
-        payload: dict[str, Any] = {
-            "contents": contents,
-            "generationConfig": {
-                "temperature": self.settings.temperature,
-                "maxOutputTokens": self.settings.max_tokens,
-            },
-        }
+        payload: dict[str, Any] = {**self._payload, "contents": contents}
 
         if system_instruction:
             payload["systemInstruction"] = {"parts": [{"text": system_instruction}]}
 
-        url = f"/models/{self.settings.model}:streamGenerateContent?key={self._api_key}&alt=sse"
-
-        async with self._client.stream("POST", url, json=payload) as response:
+        async with self._stream_json(self._stream_url, payload) as response:
             response.raise_for_status()
-            async for line in response.aiter_lines():
-                if line.startswith("data: "):
-                    import json
-
-                    data = json.loads(line[6:])
-                    candidates = data.get("candidates", [])
-                    if candidates:
-                        content = candidates[0].get("content", {})
-                        parts = content.get("parts", [])
-                        if parts:
-                            yield parts[0].get("text", "")
-
-    async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+            async for raw in iter_sse_data(response):
+                data = orjson.loads(raw)
+                candidates = data.get("candidates", ())
+                if candidates:
+                    for part in candidates[0].get("content", {}).get("parts", ()):
+                        if text := part.get("text"):
+                            yield text
@@ -13,8 +13,13 @@ from core.config import LLMSettings
 class OllamaProvider(LLMProviderBase):
     """Local LLM provider using Ollama."""
 
-    def __init__(self, settings: LLMSettings) -> None:
-        super().__init__(settings)
+    def __init__(
+        self,
+        settings: LLMSettings,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        super().__init__(settings, http_client)
+        # The ollama library manages its own connection to the local daemon
         self._client = AsyncClient(host=settings.ollama_base_url)
         self._available_models: list[str] | None = None
 
@@ -28,9 +33,38 @@ class OllamaProvider(LLMProviderBase):
                 self._available_models = []
         return self._available_models
 
+    def _build_payload(self) -> dict[str, Any]:
+        """Build the generation options shared by every call."""
+        return {
+            "temperature": self.settings.temperature,
+            "num_predict": self.settings.max_tokens,
+        }
+
+    def _resolve_quantized(self, models: list[str]) -> str:
+        """Map an untagged model name to an installed quantized variant.
+
+        ``llama3.2`` resolves to e.g. ``llama3.2:3b-instruct-q4_K_M`` when such
+        a tag is installed. Tagged names and names with no matching variant
+        are returned unchanged.
+        """
+        model = self.settings.model
+        if ":" in model:
+            return model
+        suffix = f"-{self.settings.ollama_quantization}".lower()
+        for name in models:
+            if name.startswith(f"{model}:") and name.lower().endswith(suffix):
+                return name
+        return model
+
     async def ensure_model(self) -> bool:
-        """Ensure the configured model is available."""
+        """Ensure the configured model is available.
+
+        Untagged model names are first resolved to an installed variant with
+        the configured quantization.
+        """
         models = await self.list_models()
+        self.settings.model = self._resolve_quantized(models)
+        self.refresh_skeleton()
         if self.settings.model not in models:
             try:
                 await self._client.pull(self.settings.model)
@@ -46,19 +80,19 @@ class OllamaProvider(LLMProviderBase):
         system: str | None = None,
         tools: list[dict[str, Any]] | None = None,
     ) -> str:
-        """Generate a response using Ollama."""
-        full_messages = []
-        if system:
-            full_messages.append({"role": "system", "content": system})
-        full_messages.extend(messages)
+        """Generate a response using Ollama.
+
+        The system prompt always leads and turns are only ever appended, so
+        consecutive requests share a token prefix that Ollama can serve from
+        its KV cache while the model stays loaded.
+        """
+        full_messages = [{"role": "system", "content": system}, *messages] if system else messages
 
         response = await self._client.chat(
             model=self.settings.model,
             messages=full_messages,
-            options={
-                "temperature": self.settings.temperature,
-                "num_predict": self.settings.max_tokens,
-            },
+            options=self._payload,
+            keep_alive=self.settings.ollama_keep_alive,
         )
 
         return response["message"]["content"]
@@ -69,19 +103,14 @@ class OllamaProvider(LLMProviderBase):
         system: str | None = None,
     ) -> AsyncIterator[str]:
         """Stream a response from Ollama."""
-        full_messages = []
-        if system:
-            full_messages.append({"role": "system", "content": system})
-        full_messages.extend(messages)
+        full_messages = [{"role": "system", "content": system}, *messages] if system else messages
 
         async for chunk in await self._client.chat(
             model=self.settings.model,
             messages=full_messages,
             stream=True,
-            options={
-                "temperature": self.settings.temperature,
-                "num_predict": self.settings.max_tokens,
-            },
+            options=self._payload,
+            keep_alive=self.settings.ollama_keep_alive,
         ):
             if "message" in chunk and "content" in chunk["message"]:
                 yield chunk["message"]["content"]
@@ -4,8 +4,9 @@ from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
+import orjson
 
-from brain.providers.base import LLMProviderBase
+from brain.providers.base import LLMProviderBase, iter_sse_data
 from core.config import LLMSettings
 
 
@@ -15,16 +16,25 @@ class XAIProvider(LLMProviderBase):
     Uses OpenAI-compatible API format.
     """
 
-    def __init__(self, settings: LLMSettings) -> None:
-        super().__init__(settings)
-        self._client = httpx.AsyncClient(
-            base_url=settings.xai_base_url,
-            headers={
-                "Authorization": f"Bearer {settings.xai_api_key}",
-                "Content-Type": "application/json",
-            },
-            timeout=60.0,
-        )
+    def __init__(
+        self,
+        settings: LLMSettings,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        super().__init__(settings, http_client)
+        self._url = f"{settings.xai_base_url.rstrip('/')}/chat/completions"
+        self._headers = {
+            "Authorization": f"Bearer {settings.xai_api_key}",
+            "Content-Type": "application/json",
+        }
+
+    def _build_payload(self) -> dict[str, Any]:
+        """Build the request fields shared by every call."""
+        return {
+            "model": self.settings.model,
+            "temperature": self.settings.temperature,
+            "max_tokens": self.settings.max_tokens,
+        }
 
     async def generate(
         self,
@@ -33,24 +43,14 @@ class XAIProvider(LLMProviderBase):
         tools: list[dict[str, Any]] | None = None,
     ) -> str:
         """Generate a response using xAI API."""
-        full_messages = []
-        if system:
-            full_messages.append({"role": "system", "content": system})
-        full_messages.extend(messages)
+        full_messages = [{"role": "system", "content": system}, *messages] if system else messages
 
-        payload: dict[str, Any] = {
-            "model": self.settings.model,
-            "messages": full_messages,
-            "temperature": self.settings.temperature,
-            "max_tokens": self.settings.max_tokens,
-        }
+        payload: dict[str, Any] = {**self._payload, "messages": full_messages}
 
         if tools:
             payload["tools"] = tools
 
-        response = await self._client.post("/chat/completions", json=payload)
-        response.raise_for_status()
-        data = response.json()
+        data = await self._post_json(self._url, payload, self._headers)
 
         return data["choices"][0]["message"]["content"]
 
@@ -60,32 +60,15 @@ class XAIProvider(LLMProviderBase):
         system: str | None = None,
     ) -> AsyncIterator[str]:
         """Stream a response from xAI API."""
-        full_messages = []
-        if system:
-            full_messages.append({"role": "system", "content": system})
-        full_messages.extend(messages)
+        full_messages = [{"role": "system", "content": system}, *messages] if system else messages
 
-        payload = {
-            "model": self.settings.model,
-            "messages": full_messages,
-            "temperature": self.settings.temperature,
-            "max_tokens": self.settings.max_tokens,
-            "stream": True,
-        }
+        payload = {**self._payload, "messages": full_messages, "stream": True}
 
-        async with self._client.stream("POST", "/chat/completions", json=payload) as response:
+        async with self._stream_json(self._url, payload, self._headers) as response:
             response.raise_for_status()
-            async for line in response.aiter_lines():
-                if line.startswith("data: "):
-                    data = line[6:]
-                    if data == "[DONE]":
-                        break
-                    import json
-
-                    chunk = json.loads(data)
-                    if chunk["choices"][0]["delta"].get("content"):
-                        yield chunk["choices"][0]["delta"]["content"]
-
-    async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+            async for raw in iter_sse_data(response):
+                if raw == b"[DONE]":
+                    break
+                chunk = orjson.loads(raw)
+                if chunk["choices"][0]["delta"].get("content"):
+                    yield chunk["choices"][0]["delta"]["content"]
@@ -0,0 +1,79 @@
+"""Response caching for repeated user utterances."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+
+
+def normalize_utterance(text: str) -> str:
+    """Normalize an utterance so trivially different phrasings share a key.
+
+    Lowercases, collapses whitespace and drops trailing punctuation, so
+    "What time is it?" and "what  time is it" are the same entry.
+    """
+    return " ".join(text.lower().split()).rstrip(".!?")
+
+
+def history_key(history: Sequence[dict[str, str]]) -> int:
+    """Hash the conversation that came before an utterance.
+
+    Replies to follow-ups like "why?" depend on what was said before, so
+    the same words in a different conversation must not share an entry.
+    """
+    return hash(tuple((message["role"], message["content"]) for message in history))
+
+
+class ResponseCache:
+    """Bounded LRU of responses keyed by normalized utterance and history.
+
+    Entries expire after ``ttl`` seconds so answers about changing state
+    (device status, weather) don't go stale indefinitely.
+    """
+
+    def __init__(self, max_size: int = 128, ttl: float = 300.0) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, int], tuple[float, str]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is turned on."""
+        return self.max_size > 0 and self.ttl > 0
+
+    def get(self, text: str, history: Sequence[dict[str, str]] = ()) -> str | None:
+        """Get the cached response for an utterance, if still fresh.
+
+        Args:
+            text: The user's utterance
+            history: LLM messages that came before it
+        """
+        if not self.enabled:
+            return None
+
+        key = (normalize_utterance(text), history_key(history))
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, response = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, text: str, response: str, history: Sequence[dict[str, str]] = ()) -> None:
+        """Cache the response to an utterance made after the given history."""
+        if not self.enabled:
+            return
+
+        key = (normalize_utterance(text), history_key(history))
+        self._entries[key] = (time.monotonic(), response)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
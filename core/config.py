@@ -31,8 +31,10 @@ class LLMSettings(BaseSettings):
     # Provider selection
     provider: LLMProvider = LLMProvider.OLLAMA
 
-    # Model name (provider-specific)
-    model: str = "llama3.2"
+    # Model name (provider-specific). The Ollama default is an explicitly
+    # 4-bit quantized build: decoding is memory-bandwidth bound, so q4_K_M
+    # runs several times faster than fp16 in a fraction of the VRAM.
+    model: str = "llama3.2:3b-instruct-q4_K_M"
 
     # Generation parameters
     temperature: float = 0.7
@@ -40,6 +42,12 @@ class LLMSettings(BaseSettings):
 
     # Ollama settings
     ollama_base_url: str = "http://localhost:11434"
+    # Preferred quantization when an untagged Ollama model name is given.
+    # q4_K_M is fastest; q8_0 is near-lossless at roughly twice the memory.
+    ollama_quantization: str = "q4_K_M"
+    # How long Ollama keeps the model (and its KV cache) loaded between
+    # requests, so the shared conversation prefix isn't re-evaluated.
+    ollama_keep_alive: str = "30m"
 
     # API keys (set via environment variables)
     openai_api_key: str = ""
@@ -67,6 +75,16 @@ class VisionSettings(BaseSettings):
     model: str = "yolov8n"  # nano model for speed
     camera_index: int = 0
     confidence_threshold: float = 0.5
+    # Inference precision: fp32 runs the PyTorch weights as-is; fp16 and int8
+    # export a TensorRT engine once (cached next to the weights) and load
+    # that, roughly doubling throughput on NVIDIA GPUs. int8 falls back to
+    # fp16 without calibration data, and both to ONNX on CPU-only machines.
+    precision: str = "fp32"  # fp32, fp16, int8
+    # Ultralytics dataset YAML whose images calibrate int8 quantization
+    calibration_data: str = ""
+    # On a Jetson with fp16/int8, also build an engine for DLA core 0 and
+    # split streamed batches between it and the GPU
+    use_dla: bool = False
 
 
 class HomeAssistantSettings(BaseSettings):
@@ -75,6 +93,7 @@ class HomeAssistantSettings(BaseSettings):
     url: str = "http://homeassistant.local:8123"
     token: str = ""
     enabled: bool = False
+    websocket: bool = True  # Follow state changes live instead of polling
 
 
 class MQTTSettings(BaseSettings):
@@ -121,6 +140,12 @@ class Settings(BaseSettings):
 
     # Performance
     use_gpu: bool = True
+    use_uvloop: bool = True  # Faster event loop where uvloop is available
+    # Replay responses to utterances repeated after the same conversation,
+    # when the LLM temperature is at most 0.1 (0 size or TTL disables).
+    # Off by default: answers about time or device state would be replayed.
+    response_cache_size: int = 0
+    response_cache_ttl: float = 300.0  # seconds
     max_context_messages: int = 20
 
     def ensure_data_dir(self) -> Path:
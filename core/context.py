@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """A single message in a conversation."""
 
@@ -26,14 +26,35 @@ class ConversationContext:
     max_messages: int = 20
     messages: deque[Message] = field(default_factory=deque)
     state: dict[str, Any] = field(default_factory=dict)
+    # Most recent message per role, kept up to date by add_message()
+    _last_by_role: dict[str, Message] = field(default_factory=dict, init=False, repr=False)
+    # {role, content} dicts mirroring messages, so the LLM payload isn't rebuilt
+    _llm_view: deque[dict[str, str]] = field(default_factory=deque, init=False, repr=False)
+    # Snapshot of _llm_view returned until the conversation next changes
+    _llm_list: list[dict[str, str]] | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.messages = deque(self.messages, maxlen=self.max_messages)
+        self._llm_view = deque(
+            ({"role": m.role, "content": m.content} for m in self.messages),
+            maxlen=self.max_messages,
+        )
+        for msg in self.messages:
+            self._last_by_role[msg.role] = msg
 
     def add_message(self, role: str, content: str, **metadata: Any) -> Message:
         """Add a message to the conversation history."""
         msg = Message(role=role, content=content, metadata=metadata)
+        if len(self.messages) == self.messages.maxlen:
+            # The oldest message is about to be evicted. If it is still the
+            # latest of its role, no other message of that role remains.
+            evicted = self.messages[0]
+            if self._last_by_role.get(evicted.role) is evicted:
+                del self._last_by_role[evicted.role]
         self.messages.append(msg)
+        self._llm_view.append({"role": role, "content": content})
+        self._llm_list = None
+        self._last_by_role[role] = msg
         return msg
 
     def add_user_message(self, content: str, **metadata: Any) -> Message:
@@ -45,12 +66,21 @@ class ConversationContext:
         return self.add_message("assistant", content, **metadata)
 
     def get_messages_for_llm(self) -> list[dict[str, str]]:
-        """Get messages formatted for LLM API."""
-        return [{"role": m.role, "content": m.content} for m in self.messages]
+        """Get messages formatted for LLM API.
+
+        The same list is returned until a message is added or the history is
+        cleared. It is shared with the context and must not be modified.
+        """
+        if self._llm_list is None:
+            self._llm_list = list(self._llm_view)
+        return self._llm_list
 
     def clear(self) -> None:
         """Clear conversation history."""
         self.messages.clear()
+        self._llm_view.clear()
+        self._llm_list = None
+        self._last_by_role.clear()
 
     def set_state(self, key: str, value: Any) -> None:
         """Set a state value."""
@@ -63,15 +93,9 @@ class ConversationContext:
     @property
     def last_user_message(self) -> Message | None:
         """Get the last user message."""
-        for msg in reversed(self.messages):
-            if msg.role == "user":
-                return msg
-        return None
+        return self._last_by_role.get("user")
 
     @property
     def last_assistant_message(self) -> Message | None:
         """Get the last assistant message."""
-        for msg in reversed(self.messages):
-            if msg.role == "assistant":
-                return msg
-        return None
+        return self._last_by_role.get("assistant")
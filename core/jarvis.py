@@ -1,12 +1,20 @@
 """Main J.A.R.V.I.S. coordinator."""
 
 import asyncio
+import re
 import signal
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from core.cache import ResponseCache
 from core.config import Settings
 from core.context import ConversationContext
 
+if TYPE_CHECKING:
+    import httpx
+
+# Where streamed text can be cut into separately spoken pieces
+SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+
 
 class Jarvis:
     """Central orchestrator for J.A.R.V.I.S.
@@ -18,8 +26,31 @@ class Jarvis:
     def __init__(self, settings: Settings | None = None) -> None:
         self.settings = settings or Settings()
         self.context = ConversationContext(max_messages=self.settings.max_context_messages)
+        # Like the LLM client's cache, replies are only replayed when the
+        # model is near-deterministic
+        from brain.llm import CACHEABLE_TEMPERATURE
+
+        cacheable = self.settings.llm.temperature <= CACHEABLE_TEMPERATURE
+        self.response_cache = ResponseCache(
+            max_size=self.settings.response_cache_size if cacheable else 0,
+            ttl=self.settings.response_cache_ttl,
+        )
         self._running = False
         self._subsystems: dict[str, Any] = {}
+        self._http_client: httpx.AsyncClient | None = None
+
+    @property
+    def http_client(self) -> "httpx.AsyncClient":
+        """HTTP client shared by the LLM providers and skills.
+
+        Callers pass their own URLs, headers and timeouts per request, so a
+        single connection pool serves every outside API.
+        """
+        if self._http_client is None:
+            from brain.providers.base import create_http_client
+
+            self._http_client = create_http_client()
+        return self._http_client
 
     async def initialize(self) -> None:
         """Initialize all subsystems."""
@@ -33,7 +64,7 @@ class Jarvis:
 
         # Initialize core subsystems
         print("Initializing LLM client...")
-        self._subsystems["llm"] = LLMClient(self.settings.llm)
+        self._subsystems["llm"] = LLMClient(self.settings.llm, self.http_client)
         print("Initializing speech recognition...")
         self._subsystems["stt"] = SpeechRecognizer(self.settings.whisper)
         print("Initializing text-to-speech...")
@@ -57,6 +88,26 @@ class Jarvis:
                 self.settings.mqtt,
             )
 
+        # Load models and open connections concurrently; loaders run in
+        # worker threads, so startup takes about as long as the slowest one
+        print("Loading models...")
+        warmups = {}
+        for name, subsystem in self._subsystems.items():
+            if hasattr(subsystem, "preload"):
+                warmups[name] = subsystem.preload()
+            elif hasattr(subsystem, "connect"):
+                warmups[name] = subsystem.connect()
+
+        home = self._subsystems.get("home")
+        if home and self.settings.mqtt.enabled:
+            warmups["mqtt"] = home.connect_mqtt()
+
+        results = await asyncio.gather(*warmups.values(), return_exceptions=True)
+        for name, result in zip(warmups, results, strict=True):
+            if isinstance(result, Exception):
+                # Leave it to load lazily (and report again) on first use
+                print(f"Warning: {name} failed to load: {result}")
+
     async def process_voice_input(self, audio_data: bytes) -> str | None:
         """Process voice input and return response."""
         stt = self._subsystems.get("stt")
@@ -75,15 +126,7 @@ class Jarvis:
         if not self.context.messages and self.settings.wake_word.lower() not in text.lower():
             return None
 
-        # Add to context and get LLM response
-        self.context.add_user_message(text)
-        response = await llm.generate(self.context.get_messages_for_llm())
-        self.context.add_assistant_message(response)
-
-        # Speak response
-        await tts.speak(response)
-
-        return response
+        return await self._respond_aloud(llm, tts, text)
 
     async def process_text_input(self, text: str) -> str:
         """Process text input and return response."""
@@ -91,10 +134,73 @@ class Jarvis:
         if not llm:
             return "LLM not initialized"
 
+        return await self._respond(llm, text)
+
+    async def _respond(self, llm: Any, text: str) -> str:
+        """Record a user utterance and produce the assistant's reply.
+
+        Utterances repeated after the same conversation are answered from
+        the response cache; the exchange is added to the conversation
+        either way.
+        """
+        # Not modified by adding messages; a new list is built instead
+        history = self.context.get_messages_for_llm()
         self.context.add_user_message(text)
-        response = await llm.generate(self.context.get_messages_for_llm())
+
+        response = self.response_cache.get(text, history)
+        if response is None:
+            response = await llm.generate(self.context.get_messages_for_llm())
+            self.response_cache.put(text, response, history)
+
+        self.context.add_assistant_message(response)
+        return response
+
+    async def _respond_aloud(self, llm: Any, tts: Any, text: str) -> str:
+        """Like _respond, but speaks the reply while it is being generated.
+
+        The LLM response is streamed and each complete sentence is queued
+        for speech as soon as it arrives, so audio starts after the first
+        sentence instead of after the whole reply.
+        """
+        history = self.context.get_messages_for_llm()
+        self.context.add_user_message(text)
+
+        cached = self.response_cache.get(text, history)
+        if cached is not None:
+            self.context.add_assistant_message(cached)
+            await tts.speak(cached)
+            return cached
+
+        # A single speaker task keeps sentences in order
+        sentences: asyncio.Queue[str | None] = asyncio.Queue()
+
+        async def speak_sentences() -> None:
+            while (sentence := await sentences.get()) is not None:
+                await tts.speak(sentence)
+
+        speaker = asyncio.create_task(speak_sentences())
+        chunks: list[str] = []
+        pending = ""
+        try:
+            async for chunk in llm.generate_stream(self.context.get_messages_for_llm()):
+                chunks.append(chunk)
+                *complete, pending = SENTENCE_END_RE.split(pending + chunk)
+                for sentence in complete:
+                    if sentence.strip():
+                        sentences.put_nowait(sentence.strip())
+        except BaseException:
+            speaker.cancel()
+            raise
+
+        if pending.strip():
+            sentences.put_nowait(pending.strip())
+        sentences.put_nowait(None)
+
+        response = "".join(chunks)
+        self.response_cache.put(text, response, history)
         self.context.add_assistant_message(response)
 
+        await speaker
         return response
 
     async def run(self) -> None:
@@ -130,16 +236,11 @@ class Jarvis:
                     if text:
                         print(f"You said: {text}")
 
-                        # Get LLM response
-                        self.context.add_user_message(text)
+                        # Get the LLM response, speaking it as it streams in
                         print("Thinking...")
-                        response = await llm.generate(self.context.get_messages_for_llm())
-                        self.context.add_assistant_message(response)
+                        response = await self._respond_aloud(llm, tts, text)
 
                         print(f"{self.settings.name}: {response}")
-
-                        # Speak the response
-                        await tts.speak(response)
                     else:
                         print("(No speech detected after wake word)")
                 else:
@@ -161,17 +262,39 @@ class Jarvis:
             if hasattr(subsystem, "close"):
                 await subsystem.close()
 
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
 
-async def async_main() -> None:
+async def async_main(settings: Settings | None = None) -> None:
     """Async entry point."""
-    jarvis = Jarvis()
+    jarvis = Jarvis(settings)
     await jarvis.initialize()
     await jarvis.run()
 
 
+def _install_uvloop() -> bool:
+    """Use uvloop's libuv-based event loop if it is installed.
+
+    Returns:
+        True if uvloop was installed, False if unavailable (e.g. on Windows)
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 def main() -> None:
     """Entry point."""
-    asyncio.run(async_main())
+    settings = Settings()
+    if settings.use_uvloop:
+        _install_uvloop()
+    asyncio.run(async_main(settings))
 
 
 if __name__ == "__main__":
@@ -1,11 +1,15 @@
 """Home automation integration with Home Assistant and MQTT."""
 
 import asyncio
+import contextlib
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any
 
 import aiohttp
+import orjson
+from rapidfuzz import fuzz, process
 
 from core.config import HomeAssistantSettings, MQTTSettings
 
@@ -29,6 +33,78 @@ class DeviceType(Enum):
     UNKNOWN = auto()
 
 
+# Home Assistant entity domain -> device type
+DOMAIN_TYPES: dict[str, DeviceType] = {
+    "light": DeviceType.LIGHT,
+    "switch": DeviceType.SWITCH,
+    "lock": DeviceType.LOCK,
+    "climate": DeviceType.THERMOSTAT,
+    "sensor": DeviceType.SENSOR,
+    "binary_sensor": DeviceType.SENSOR,
+    "media_player": DeviceType.MEDIA_PLAYER,
+    "cover": DeviceType.COVER,
+    "fan": DeviceType.FAN,
+    "camera": DeviceType.CAMERA,
+    "vacuum": DeviceType.VACUUM,
+    "scene": DeviceType.SCENE,
+    "automation": DeviceType.AUTOMATION,
+    "script": DeviceType.SCRIPT,
+}
+
+# Device command -> (service domain, service). A None domain means the
+# device's own domain, for generic services like turn_on.
+DEVICE_COMMANDS: dict[str, tuple[str | None, str]] = {
+    "turn_on": (None, "turn_on"),
+    "turn_off": (None, "turn_off"),
+    "toggle": (None, "toggle"),
+    "lock": ("lock", "lock"),
+    "unlock": ("lock", "unlock"),
+    "set_temperature": ("climate", "set_temperature"),
+    "set_hvac_mode": ("climate", "set_hvac_mode"),
+    "media_play": ("media_player", "media_play"),
+    "media_pause": ("media_player", "media_pause"),
+    "media_stop": ("media_player", "media_stop"),
+    "media_next": ("media_player", "media_next_track"),
+    "media_previous": ("media_player", "media_previous_track"),
+    "set_volume": ("media_player", "volume_set"),
+    "open_cover": ("cover", "open_cover"),
+    "close_cover": ("cover", "close_cover"),
+    "set_cover_position": ("cover", "set_cover_position"),
+    "vacuum_start": ("vacuum", "start"),
+    "vacuum_stop": ("vacuum", "stop"),
+    "vacuum_return_home": ("vacuum", "return_to_base"),
+}
+
+# RGB values for color names accepted by set_color
+NAMED_COLORS: dict[str, tuple[int, int, int]] = {
+    "red": (255, 0, 0),
+    "green": (0, 255, 0),
+    "blue": (0, 0, 255),
+    "yellow": (255, 255, 0),
+    "purple": (128, 0, 128),
+    "orange": (255, 165, 0),
+    "pink": (255, 192, 203),
+    "white": (255, 255, 255),
+    "warm": (255, 180, 100),
+    "cool": (200, 220, 255),
+}
+
+# Internal Home Assistant entities that aren't user-facing devices
+SKIPPED_ENTITY_PREFIXES = ("persistent_notification.", "zone.")
+
+# Seconds to wait before reconnecting a dropped state stream
+STATE_STREAM_RETRY_DELAY = 5.0
+
+# Number of resolved scene phrases to remember
+SCENE_CACHE_SIZE = 64
+
+# Minimum rapidfuzz WRatio score (0-100) for a fuzzy device name match
+DEVICE_MATCH_CUTOFF = 60
+
+# Number of fuzzily resolved device names to remember
+DEVICE_CACHE_SIZE = 128
+
+
 @dataclass
 class Device:
     """A smart home device."""
@@ -38,11 +114,14 @@ class Device:
     device_type: DeviceType
     state: str
     attributes: dict[str, Any] = field(default_factory=dict)
+    # Domain (first part of entity_id) and lowercased name, derived once
+    # at construction
+    domain: str = field(init=False)
+    name_lower: str = field(init=False)
 
-    @property
-    def domain(self) -> str:
-        """Get the domain (first part of entity_id)."""
-        return self.entity_id.split(".")[0]
+    def __post_init__(self) -> None:
+        self.domain = self.entity_id.partition(".")[0]
+        self.name_lower = self.name.lower()
 
     @property
     def is_on(self) -> bool:
@@ -91,12 +170,27 @@ class HomeAutomation:
     ) -> None:
         self.ha_settings = ha_settings
         self.mqtt_settings = mqtt_settings
+        self._api_url = f"{ha_settings.url.rstrip('/')}/api/"
         self._session: aiohttp.ClientSession | None = None
         self._mqtt_client: Any = None
+        self._mqtt_publish: Any = None
         self._devices: dict[str, Device] = {}
         self._scenes: dict[str, Scene] = {}
+        # Lowercased scene name -> entity_id, and recently resolved phrases
+        self._scene_names: dict[str, str] = {}
+        self._scene_cache: OrderedDict[str, str] = OrderedDict()
         self._areas: dict[str, Area] = {}
+        # Lowercased friendly name -> device, and entity_id -> lowercased name
+        # for fuzzy matching (rebuilt lazily after devices are added/removed)
+        self._name_index: dict[str, Device] = {}
+        self._fuzzy_choices: dict[str, str] | None = None
+        # Lowercased query -> entity_id of its fuzzy match, so follow-up
+        # commands naming the same device skip the fuzzy scan
+        self._device_cache: OrderedDict[str, str] = OrderedDict()
+        # Device type -> {entity_id: device}
+        self._by_type: dict[DeviceType, dict[str, Device]] = {}
         self._last_refresh: float = 0
+        self._ws_task: asyncio.Task[None] | None = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session."""
@@ -105,22 +199,95 @@ class HomeAutomation:
                 "Authorization": f"Bearer {self.ha_settings.token}",
                 "Content-Type": "application/json",
             }
-            self._session = aiohttp.ClientSession(headers=headers)
+            # Keep connections to Home Assistant open between commands so
+            # each service call skips the TCP/TLS handshake.
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
         return self._session
 
-    async def _ha_request(
-        self,
-        method: str,
-        endpoint: str,
-        data: dict[str, Any] | None = None,
-    ) -> Any:
-        """Make a request to Home Assistant API."""
+    async def connect(self) -> None:
+        """Open the Home Assistant session ahead of the first request.
+
+        Also starts following state changes over the websocket API if enabled.
+        """
+        await self._get_session()
+        if self.ha_settings.websocket and (self._ws_task is None or self._ws_task.done()):
+            self._ws_task = asyncio.create_task(self._follow_states())
+            self._ws_task.add_done_callback(self._follow_states_done)
+
+    @staticmethod
+    def _follow_states_done(task: asyncio.Task[None]) -> None:
+        """Log why the state stream stopped, if it wasn't cancelled."""
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Home Assistant state stream stopped: {task.exception()!r}")
+
+    async def _follow_states(self) -> None:
+        """Keep device state current from Home Assistant's websocket API.
+
+        Seeds the devices with get_states, then applies each state_changed
+        event in place. Reconnects after any error other than a failed login.
+        """
+        url = self.ha_settings.url.rstrip("/")
+        if url.startswith("http"):
+            url = "ws" + url[4:]
+        url = f"{url}/api/websocket"
+
+        while True:
+            try:
+                session = await self._get_session()
+                async with session.ws_connect(url, heartbeat=30) as ws:
+                    await ws.receive_json(loads=orjson.loads)  # auth_required
+                    await ws.send_json({"type": "auth", "access_token": self.ha_settings.token})
+                    reply = await ws.receive_json(loads=orjson.loads)
+                    if reply.get("type") != "auth_ok":
+                        print(f"Home Assistant websocket auth failed: {reply.get('message')}")
+                        return
+
+                    await ws.send_json({"id": 1, "type": "get_states"})
+                    await ws.send_json({
+                        "id": 2,
+                        "type": "subscribe_events",
+                        "event_type": "state_changed",
+                    })
+
+                    async for message in ws:
+                        if message.type != aiohttp.WSMsgType.TEXT:
+                            break
+                        data = message.json(loads=orjson.loads)
+                        if data.get("type") == "event":
+                            self._apply_state_change(data["event"]["data"])
+                        elif data.get("id") == 1 and data.get("success"):
+                            self._load_states(data["result"])
+            except Exception as e:
+                # Anything unexpected in a message must not end the stream
+                # and leave device state silently stale
+                print(f"Home Assistant websocket error: {e!r}")
+
+            await asyncio.sleep(STATE_STREAM_RETRY_DELAY)
+
+    async def _ha_get(self, endpoint: str) -> Any:
+        """GET a Home Assistant API endpoint and return the decoded JSON."""
         session = await self._get_session()
-        url = f"{self.ha_settings.url}/api/{endpoint}"
+        async with session.get(self._api_url + endpoint) as response:
+            response.raise_for_status()
+            return orjson.loads(await response.read())
 
-        async with session.request(method, url, json=data) as response:
+    async def _ha_post(self, endpoint: str, data: dict[str, Any]) -> Any:
+        """POST JSON to a Home Assistant API endpoint and return the decoded reply."""
+        session = await self._get_session()
+        # The session already sends a JSON content type
+        async with session.post(self._api_url + endpoint, data=orjson.dumps(data)) as response:
             response.raise_for_status()
-            return await response.json()
+            return orjson.loads(await response.read())
 
     async def connect_mqtt(self) -> None:
         """Connect to MQTT broker."""
@@ -136,60 +303,105 @@ class HomeAutomation:
             password=self.mqtt_settings.password or None,
         )
         await self._mqtt_client.__aenter__()
+        self._mqtt_publish = self._mqtt_client.publish
 
     async def refresh_devices(self) -> list[Device]:
-        """Fetch all devices from Home Assistant."""
-        import time
+        """Fetch all devices from Home Assistant.
+
+        Not needed while the websocket state stream is running, but still
+        works as a full resync.
+        """
+        states = await self._ha_get("states")
+        self._load_states(states)
+        return list(self._devices.values())
 
-        states = await self._ha_request("GET", "states")
+    def _load_states(self, states: list[dict[str, Any]]) -> None:
+        """Replace all known devices with the given entity states."""
+        import time
 
         self._devices.clear()
         self._scenes.clear()
-
-        domain_mapping = {
-            "light": DeviceType.LIGHT,
-            "switch": DeviceType.SWITCH,
-            "lock": DeviceType.LOCK,
-            "climate": DeviceType.THERMOSTAT,
-            "sensor": DeviceType.SENSOR,
-            "binary_sensor": DeviceType.SENSOR,
-            "media_player": DeviceType.MEDIA_PLAYER,
-            "cover": DeviceType.COVER,
-            "fan": DeviceType.FAN,
-            "camera": DeviceType.CAMERA,
-            "vacuum": DeviceType.VACUUM,
-            "scene": DeviceType.SCENE,
-            "automation": DeviceType.AUTOMATION,
-            "script": DeviceType.SCRIPT,
-        }
+        self._scene_names.clear()
+        self._scene_cache.clear()
+        self._name_index.clear()
+        self._fuzzy_choices = None
+        self._device_cache.clear()
+        self._by_type.clear()
 
         for state in states:
-            entity_id = state["entity_id"]
-            domain = entity_id.split(".")[0]
-            device_type = domain_mapping.get(domain, DeviceType.UNKNOWN)
+            self._add_device(state)
+
+        self._last_refresh = time.time()
+
+    def _add_device(self, state: dict[str, Any]) -> None:
+        """Create and register a device from an entity state."""
+        entity_id = state["entity_id"]
 
-            # Skip internal entities
-            if entity_id.startswith(("persistent_notification.", "zone.")):
-                continue
+        # Skip internal entities
+        if entity_id.startswith(SKIPPED_ENTITY_PREFIXES):
+            return
 
-            device = Device(
+        self._remove_device(entity_id)
+
+        device = Device(
+            entity_id=entity_id,
+            name=state["attributes"].get("friendly_name", entity_id),
+            device_type=DOMAIN_TYPES.get(entity_id.partition(".")[0], DeviceType.UNKNOWN),
+            state=state["state"],
+            attributes=state["attributes"],
+        )
+        self._devices[entity_id] = device
+        self._name_index.setdefault(device.name_lower, device)
+        self._by_type.setdefault(device.device_type, {})[entity_id] = device
+        self._fuzzy_choices = None
+        self._device_cache.clear()
+
+        # Track scenes separately
+        if device.device_type == DeviceType.SCENE:
+            self._scenes[entity_id] = Scene(
                 entity_id=entity_id,
-                name=state["attributes"].get("friendly_name", entity_id),
-                device_type=device_type,
-                state=state["state"],
-                attributes=state["attributes"],
+                name=device.name,
             )
-            self._devices[entity_id] = device
+            self._scene_names.setdefault(device.name_lower, entity_id)
+            self._scene_cache.clear()
 
-            # Track scenes separately
-            if device_type == DeviceType.SCENE:
-                self._scenes[entity_id] = Scene(
-                    entity_id=entity_id,
-                    name=device.name,
-                )
+    def _apply_state_change(self, event: dict[str, Any]) -> None:
+        """Apply a state_changed event to the known devices."""
+        entity_id = event["entity_id"]
+        new_state = event.get("new_state")
 
-        self._last_refresh = time.time()
-        return list(self._devices.values())
+        if new_state is None:
+            # Entity was removed
+            self._remove_device(entity_id)
+            return
+
+        device = self._devices.get(entity_id)
+        name = new_state["attributes"].get("friendly_name", entity_id)
+        if device is None or device.name != name:
+            self._add_device(new_state)
+            return
+
+        # Update in place so references held elsewhere stay current
+        device.state = new_state["state"]
+        device.attributes = new_state["attributes"]
+
+    def _remove_device(self, entity_id: str) -> None:
+        """Unregister a device and drop it from the lookup indexes."""
+        device = self._devices.pop(entity_id, None)
+        if device is None:
+            return
+
+        name = device.name_lower
+        if self._name_index.get(name) is device:
+            del self._name_index[name]
+        self._by_type[device.device_type].pop(entity_id, None)
+        self._fuzzy_choices = None
+        self._device_cache.clear()
+
+        if self._scenes.pop(entity_id, None):
+            if self._scene_names.get(name) == entity_id:
+                del self._scene_names[name]
+            self._scene_cache.clear()
 
     async def get_device(self, name_or_id: str) -> Device | None:
         """Find a device by name or entity_id."""
@@ -197,46 +409,45 @@ class HomeAutomation:
         if name_or_id in self._devices:
             return self._devices[name_or_id]
 
-        # Search by friendly name (fuzzy)
+        # Exact friendly name
         name_lower = name_or_id.lower()
-        best_match: Device | None = None
-        best_score = 0
-
-        for device in self._devices.values():
-            device_name_lower = device.name.lower()
-
-            # Exact match
-            if name_lower == device_name_lower:
-                return device
-
-            # Partial match
-            if name_lower in device_name_lower:
-                score = len(name_lower) / len(device_name_lower)
-                if score > best_score:
-                    best_score = score
-                    best_match = device
-
-            # Words match
-            name_words = set(name_lower.split())
-            device_words = set(device_name_lower.split())
-            if name_words & device_words:
-                score = len(name_words & device_words) / len(name_words)
-                if score > best_score:
-                    best_score = score
-                    best_match = device
-
-        return best_match
+        if device := self._name_index.get(name_lower):
+            return device
+
+        if entity_id := self._device_cache.get(name_lower):
+            self._device_cache.move_to_end(name_lower)
+            return self._devices[entity_id]
+
+        # Fuzzy friendly name
+        if self._fuzzy_choices is None:
+            self._fuzzy_choices = {
+                entity_id: device.name_lower for entity_id, device in self._devices.items()
+            }
+        match = process.extractOne(
+            name_lower,
+            self._fuzzy_choices,
+            scorer=fuzz.WRatio,
+            score_cutoff=DEVICE_MATCH_CUTOFF,
+        )
+        if match is None:
+            return None
+
+        self._device_cache[name_lower] = match[2]
+        if len(self._device_cache) > DEVICE_CACHE_SIZE:
+            self._device_cache.popitem(last=False)
+        return self._devices[match[2]]
 
     async def get_devices_by_type(self, device_type: DeviceType) -> list[Device]:
         """Get all devices of a specific type."""
-        return [d for d in self._devices.values() if d.device_type == device_type]
+        return list(self._by_type.get(device_type, {}).values())
 
     async def get_devices_by_area(self, area_name: str) -> list[Device]:
         """Get all devices in an area/room."""
         area_lower = area_name.lower()
+        # Home Assistant entity_ids are always lowercase
         return [
             d for d in self._devices.values()
-            if area_lower in d.name.lower() or area_lower in d.entity_id.lower()
+            if area_lower in d.name_lower or area_lower in d.entity_id
         ]
 
     async def call_service(
@@ -250,43 +461,74 @@ class HomeAutomation:
         data = {**kwargs}
         if entity_id:
             data["entity_id"] = entity_id
-        await self._ha_request("POST", f"services/{domain}/{service}", data)
+        await self._ha_post(f"services/{domain}/{service}", data)
 
-    # === Light Controls ===
-
-    async def turn_on(self, device: Device | str, **kwargs: Any) -> None:
-        """Turn on a device."""
+    async def call_services(
+        self,
+        calls: list[tuple[str, str, str | None, dict[str, Any]]],
+    ) -> None:
+        """Call several Home Assistant services concurrently.
+
+        Args:
+            calls: (domain, service, entity_id, data) for each call
+        """
+        await asyncio.gather(*(
+            self.call_service(domain, service, entity_id, **data)
+            for domain, service, entity_id, data in calls
+        ))
+
+    async def _resolve_device(self, device: Device | str) -> Device:
+        """Look up a device given by name or entity_id.
+
+        Raises:
+            ValueError: If no matching device is found
+        """
         if isinstance(device, str):
             found = await self.get_device(device)
             if not found:
                 raise ValueError(f"Device not found: {device}")
-            device = found
+            return found
+        return device
+
+    async def _dispatch(self, command: str, device: Device | str, **kwargs: Any) -> None:
+        """Resolve a device and call the service for a DEVICE_COMMANDS entry."""
+        device = await self._resolve_device(device)
+        domain, service = DEVICE_COMMANDS[command]
+        await self.call_service(domain or device.domain, service, device.entity_id, **kwargs)
+
+    # === Light Controls ===
 
-        await self.call_service(device.domain, "turn_on", device.entity_id, **kwargs)
+    async def turn_on(self, device: Device | str, **kwargs: Any) -> None:
+        """Turn on a device."""
+        await self._dispatch("turn_on", device, **kwargs)
 
     async def turn_off(self, device: Device | str) -> None:
         """Turn off a device."""
-        if isinstance(device, str):
-            found = await self.get_device(device)
-            if not found:
-                raise ValueError(f"Device not found: {device}")
-            device = found
-
-        await self.call_service(device.domain, "turn_off", device.entity_id)
+        await self._dispatch("turn_off", device)
 
     async def toggle(self, device: Device | str) -> None:
         """Toggle a device."""
-        if isinstance(device, str):
-            found = await self.get_device(device)
-            if not found:
-                raise ValueError(f"Device not found: {device}")
-            device = found
+        await self._dispatch("toggle", device)
+
+    async def turn_off_all(self, device_type: DeviceType = DeviceType.LIGHT) -> None:
+        """Turn off every device of a type that is currently on.
 
-        await self.call_service(device.domain, "toggle", device.entity_id)
+        Home Assistant accepts a list of entity_ids, so this is one service
+        call per domain rather than one per device.
+        """
+        by_domain: dict[str, list[str]] = {}
+        for device in self._by_type.get(device_type, {}).values():
+            if device.is_on:
+                by_domain.setdefault(device.domain, []).append(device.entity_id)
+
+        await asyncio.gather(*(
+            self._ha_post(f"services/{domain}/turn_off", {"entity_id": entity_ids})
+            for domain, entity_ids in by_domain.items()
+        ))
 
     async def set_brightness(self, device: Device | str, brightness: int) -> None:
         """Set light brightness (0-100)."""
-        brightness_255 = int(brightness * 255 / 100)
+        brightness_255 = brightness * 255 // 100
         await self.turn_on(device, brightness=brightness_255)
 
     async def set_color(
@@ -294,44 +536,20 @@ class HomeAutomation:
     ) -> None:
         """Set light color (RGB tuple or color name)."""
         if isinstance(color, str):
-            # Named colors
-            color_map = {
-                "red": (255, 0, 0),
-                "green": (0, 255, 0),
-                "blue": (0, 0, 255),
-                "yellow": (255, 255, 0),
-                "purple": (128, 0, 128),
-                "orange": (255, 165, 0),
-                "pink": (255, 192, 203),
-                "white": (255, 255, 255),
-                "warm": (255, 180, 100),
-                "cool": (200, 220, 255),
-            }
-            color = color_map.get(color.lower(), (255, 255, 255))
+            color = NAMED_COLORS.get(color.lower(), NAMED_COLORS["white"])
 
-        await self.turn_on(device, rgb_color=list(color))
+        # orjson encodes the tuple as a JSON array
+        await self.turn_on(device, rgb_color=color)
 
     # === Lock Controls ===
 
     async def lock(self, device: Device | str) -> None:
         """Lock a lock."""
-        if isinstance(device, str):
-            found = await self.get_device(device)
-            if not found:
-                raise ValueError(f"Device not found: {device}")
-            device = found
-
-        await self.call_service("lock", "lock", device.entity_id)
+        await self._dispatch("lock", device)
 
     async def unlock(self, device: Device | str) -> None:
         """Unlock a lock."""
-        if isinstance(device, str):
-            found = await self.get_device(device)
-            if not found:
-                raise ValueError(f"Device not found: {device}")
-            device = found
-
-        await self.call_service("lock", "unlock", device.entity_id)
+        await self._dispatch("unlock", device)
 
     # === Climate/Thermostat Controls ===
 
@@ -343,38 +561,21 @@ class HomeAutomation:
         target_temp_low: float | None = None,
     ) -> None:
         """Set thermostat temperature."""
-        if isinstance(device, str):
-            found = await self.get_device(device)
-            if not found:
-                raise ValueError(f"Device not found: {device}")
-            device = found
-
         data: dict[str, Any] = {"temperature": temperature}
         if target_temp_high is not None:
             data["target_temp_high"] = target_temp_high
         if target_temp_low is not None:
             data["target_temp_low"] = target_temp_low
 
-        await self.call_service("climate", "set_temperature", device.entity_id, **data)
+        await self._dispatch("set_temperature", device, **data)
 
     async def set_hvac_mode(self, device: Device | str, mode: str) -> None:
         """Set HVAC mode (heat, cool, auto, off)."""
-        if isinstance(device, str):
-            found = await self.get_device(device)
-            if not found:
-                raise ValueError(f"Device not found: {device}")
-            device = found
-
-        await self.call_service("climate", "set_hvac_mode", device.entity_id, hvac_mode=mode)
+        await self._dispatch("set_hvac_mode", device, hvac_mode=mode)
 
     async def get_temperature(self, device: Device | str) -> dict[str, Any]:
         """Get current thermostat state."""
-        if isinstance(device, str):
-            found = await self.get_device(device)
-            if not found:
-                raise ValueError(f"Device not found: {device}")
-            device = found
-
+        device = await self._resolve_device(device)
         return {
             "current_temperature": device.attributes.get("current_temperature"),
             "target_temperature": device.attributes.get("temperature"),
@@ -386,97 +587,41 @@ class HomeAutomation:
 
     async def media_play(self, device: Device | str) -> None:
         """Play media."""
-        if isinstance(device, str):
-            found = await self.get_device(device)
-            if not found:
-                raise ValueError(f"Device not found: {device}")
-            device = found
-
-        await self.call_service("media_player", "media_play", device.entity_id)
+        await self._dispatch("media_play", device)
 
     async def media_pause(self, device: Device | str) -> None:
         """Pause media."""
-        if isinstance(device, str):
-            found = await self.get_device(device)
-            if not found:
-                raise ValueError(f"Device not found: {device}")
-            device = found
-
-        await self.call_service("media_player", "media_pause", device.entity_id)
+        await self._dispatch("media_pause", device)
 
     async def media_stop(self, device: Device | str) -> None:
         """Stop media."""
-        if isinstance(device, str):
-            found = await self.get_device(device)
-            if not found:
-                raise ValueError(f"Device not found: {device}")
-            device = found
-
-        await self.call_service("media_player", "media_stop", device.entity_id)
+        await self._dispatch("media_stop", device)
 
     async def media_next(self, device: Device | str) -> None:
         """Skip to next track."""
-        if isinstance(device, str):
-            found = await self.get_device(device)
-            if not found:
-                raise ValueError(f"Device not found: {device}")
-            device = found
-
-        await self.call_service("media_player", "media_next_track", device.entity_id)
+        await self._dispatch("media_next", device)
 
     async def media_previous(self, device: Device | str) -> None:
         """Go to previous track."""
-        if isinstance(device, str):
-            found = await self.get_device(device)
-            if not found:
-                raise ValueError(f"Device not found: {device}")
-            device = found
-
-        await self.call_service("media_player", "media_previous_track", device.entity_id)
+        await self._dispatch("media_previous", device)
 
     async def set_volume(self, device: Device | str, volume: float) -> None:
         """Set volume (0-100)."""
-        if isinstance(device, str):
-            found = await self.get_device(device)
-            if not found:
-                raise ValueError(f"Device not found: {device}")
-            device = found
-
-        await self.call_service(
-            "media_player", "volume_set", device.entity_id, volume_level=volume / 100
-        )
+        await self._dispatch("set_volume", device, volume_level=volume / 100)
 
     # === Cover Controls (blinds, garage doors) ===
 
     async def open_cover(self, device: Device | str) -> None:
         """Open a cover (blinds, garage door)."""
-        if isinstance(device, str):
-            found = await self.get_device(device)
-            if not found:
-                raise ValueError(f"Device not found: {device}")
-            device = found
-
-        await self.call_service("cover", "open_cover", device.entity_id)
+        await self._dispatch("open_cover", device)
 
     async def close_cover(self, device: Device | str) -> None:
         """Close a cover."""
-        if isinstance(device, str):
-            found = await self.get_device(device)
-            if not found:
-                raise ValueError(f"Device not found: {device}")
-            device = found
-
-        await self.call_service("cover", "close_cover", device.entity_id)
+        await self._dispatch("close_cover", device)
 
     async def set_cover_position(self, device: Device | str, position: int) -> None:
         """Set cover position (0-100)."""
-        if isinstance(device, str):
-            found = await self.get_device(device)
-            if not found:
-                raise ValueError(f"Device not found: {device}")
-            device = found
-
-        await self.call_service("cover", "set_cover_position", device.entity_id, position=position)
+        await self._dispatch("set_cover_position", device, position=position)
 
     # === Scenes and Automations ===
 
@@ -487,14 +632,29 @@ class HomeAutomation:
             await self.call_service("scene", "turn_on", scene)
             return
 
-        # Search by name
-        scene_lower = scene.lower()
+        entity_id = self._resolve_scene(scene.lower())
+        if entity_id is None:
+            raise ValueError(f"Scene not found: {scene}")
+
+        await self.call_service("scene", "turn_on", entity_id)
+
+    def _resolve_scene(self, scene_lower: str) -> str | None:
+        """Find a scene's entity_id from a lowercased name or name fragment."""
+        if entity_id := self._scene_names.get(scene_lower):
+            return entity_id
+
+        if entity_id := self._scene_cache.get(scene_lower):
+            self._scene_cache.move_to_end(scene_lower)
+            return entity_id
+
         for s in self._scenes.values():
             if scene_lower in s.name.lower():
-                await self.call_service("scene", "turn_on", s.entity_id)
-                return
+                self._scene_cache[scene_lower] = s.entity_id
+                if len(self._scene_cache) > SCENE_CACHE_SIZE:
+                    self._scene_cache.popitem(last=False)
+                return s.entity_id
 
-        raise ValueError(f"Scene not found: {scene}")
+        return None
 
     async def list_scenes(self) -> list[Scene]:
         """Get all available scenes."""
@@ -519,40 +679,22 @@ class HomeAutomation:
 
     async def vacuum_start(self, device: Device | str) -> None:
         """Start vacuum."""
-        if isinstance(device, str):
-            found = await self.get_device(device)
-            if not found:
-                raise ValueError(f"Device not found: {device}")
-            device = found
-
-        await self.call_service("vacuum", "start", device.entity_id)
+        await self._dispatch("vacuum_start", device)
 
     async def vacuum_stop(self, device: Device | str) -> None:
         """Stop vacuum."""
-        if isinstance(device, str):
-            found = await self.get_device(device)
-            if not found:
-                raise ValueError(f"Device not found: {device}")
-            device = found
-
-        await self.call_service("vacuum", "stop", device.entity_id)
+        await self._dispatch("vacuum_stop", device)
 
     async def vacuum_return_home(self, device: Device | str) -> None:
         """Send vacuum home."""
-        if isinstance(device, str):
-            found = await self.get_device(device)
-            if not found:
-                raise ValueError(f"Device not found: {device}")
-            device = found
-
-        await self.call_service("vacuum", "return_to_base", device.entity_id)
+        await self._dispatch("vacuum_return_home", device)
 
     # === MQTT ===
 
     async def publish_mqtt(self, topic: str, payload: str) -> None:
         """Publish a message to MQTT topic."""
-        if self._mqtt_client:
-            await self._mqtt_client.publish(topic, payload)
+        if self._mqtt_publish:
+            await self._mqtt_publish(topic, payload)
 
     async def subscribe_mqtt(self, topic: str) -> Any:
         """Subscribe to MQTT topic."""
@@ -565,21 +707,20 @@ class HomeAutomation:
 
     async def get_state_summary(self) -> dict[str, Any]:
         """Get a summary of all device states."""
-        lights_on = sum(1 for d in self._devices.values() if d.device_type == DeviceType.LIGHT and d.is_on)
-        total_lights = sum(1 for d in self._devices.values() if d.device_type == DeviceType.LIGHT)
-
-        locks_locked = sum(1 for d in self._devices.values() if d.device_type == DeviceType.LOCK and d.state == "locked")
-        total_locks = sum(1 for d in self._devices.values() if d.device_type == DeviceType.LOCK)
-
-        # Get thermostat info
-        thermostats = await self.get_devices_by_type(DeviceType.THERMOSTAT)
+        lights = self._by_type.get(DeviceType.LIGHT, {})
+        locks = self._by_type.get(DeviceType.LOCK, {})
+        lights_on = sum(d.is_on for d in lights.values())
+        locks_locked = sum(d.state == "locked" for d in locks.values())
+        total_lights = len(lights)
+        total_locks = len(locks)
+
+        thermostat = next(iter(self._by_type.get(DeviceType.THERMOSTAT, {}).values()), None)
         thermostat_info = None
-        if thermostats:
-            t = thermostats[0]
+        if thermostat:
             thermostat_info = {
-                "current": t.attributes.get("current_temperature"),
-                "target": t.attributes.get("temperature"),
-                "mode": t.state,
+                "current": thermostat.attributes.get("current_temperature"),
+                "target": thermostat.attributes.get("temperature"),
+                "mode": thermostat.state,
             }
 
         return {
@@ -591,6 +732,12 @@ class HomeAutomation:
 
     async def close(self) -> None:
         """Cleanup connections."""
+        if self._ws_task:
+            self._ws_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._ws_task
+            self._ws_task = None
+
         if self._session:
             await self._session.close()
             self._session = None
@@ -598,3 +745,4 @@ class HomeAutomation:
         if self._mqtt_client:
             await self._mqtt_client.__aexit__(None, None, None)
             self._mqtt_client = None
+            self._mqtt_publish = None
@@ -1,11 +1,17 @@
 """ArgusAI Camera Skill - AI-powered home security camera integration."""
 
+import asyncio
+import functools
+import random
 import re
-from dataclasses import dataclass
-from datetime import datetime
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 import httpx
+import orjson
 
 from skills.base import Skill, SkillResult
 
@@ -13,8 +19,102 @@ if TYPE_CHECKING:
     from core.context import ConversationContext
     from core.jarvis import Jarvis
 
+# Seconds to reuse /health and /cameras responses before asking again
+HEALTH_CACHE_TTL = 5.0
+CAMERAS_CACHE_TTL = 30.0
 
-@dataclass
+REQUEST_TIMEOUT = httpx.Timeout(15.0, connect=3.0)
+
+# Idempotent requests are retried after connection errors and 5xx replies,
+# waiting RETRY_BASE_DELAY * 2**n seconds (plus jitter) before retry n+1
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.1
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+# Camera name patterns, tried in order
+LOCATION_PATTERNS = (
+    re.compile(r"(?:the |my )?(\w+(?:\s+\w+)?)\s+camera"),
+    re.compile(r"camera\s+(?:at|on|in|for)\s+(?:the\s+)?(\w+(?:\s+\w+)?)"),
+    re.compile(r"(?:at|on|in)\s+(?:the\s+)?(\w+(?:\s+\w+)?)\s*\??$"),
+)
+
+
+def keyword_re(keywords: Iterable[str]) -> re.Pattern[str]:
+    """Compile keywords into one pattern that finds any of them as a substring.
+
+    One regex scan replaces a Python-level ``in`` test per keyword.
+    """
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+def parse_timestamp(value: Any) -> datetime:
+    """Parse an ArgusAI event timestamp, falling back to now.
+
+    fromisoformat accepts a trailing "Z" natively since Python 3.11.
+    """
+    if not value:
+        return datetime.now()
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return datetime.now()
+
+
+# Keywords that suggest camera/security context
+CONTEXT_RE = keyword_re([
+    "camera", "cameras", "security", "motion", "movement", "activity",
+    "surveillance", "recording", "monitoring", "watching", "detect",
+    "event", "events", "alert", "alerts", "notification",
+])
+# Location keywords that often refer to cameras, in priority order
+LOCATION_KEYWORDS = (
+    "driveway", "front door", "back door", "backyard", "front yard",
+    "garage", "porch", "patio", "entrance", "gate", "sidewalk",
+    "street", "yard", "garden", "pool", "basement", "attic",
+)
+LOCATION_RE = keyword_re(LOCATION_KEYWORDS)
+# Action keywords
+ACTION_RE = keyword_re([
+    "check", "look", "see", "show", "happening", "going on",
+    "anyone", "someone", "anything", "visitor", "package",
+    "delivery", "car", "person", "people", "animal", "dog", "cat",
+])
+CONTROL_RE = keyword_re([
+    "start", "stop", "enable", "disable", "turn on", "turn off",
+    "activate", "deactivate", "pause", "resume",
+])
+
+# Phrases for each intent in _detect_intent, checked in this order
+START_RE = keyword_re(["start", "turn on", "enable", "activate", "begin monitoring", "watch"])
+STOP_RE = keyword_re(["stop", "turn off", "disable", "deactivate", "stop monitoring", "pause"])
+REANALYZE_RE = keyword_re(["reanalyze", "re-analyze", "analyze again", "look again"])
+LIST_CAMERAS_RE = keyword_re([
+    "how many cameras", "list cameras", "show cameras", "what cameras", "which cameras",
+    "all cameras", "my cameras",
+])
+CHECK_RE = keyword_re([
+    "anyone", "someone", "anything", "something",
+    "what's happening", "what is happening", "going on",
+    "check", "look at", "show me", "see",
+    "who's at", "who is at", "is there",
+    "any activity", "any motion", "any movement",
+    "visitor", "package", "delivery", "car",
+])
+EVENTS_RE = keyword_re([
+    "any events", "recent events", "what happened", "what did you see",
+    "any alerts", "notifications", "detected anything", "motion detected",
+    "any activity", "anything unusual", "anything suspicious",
+])
+QUESTION_RE = keyword_re(["what", "who", "is there", "any"])
+
+# Replies for camera intents that arrive without a camera name
+MISSING_CAMERA_PROMPTS = {
+    "start_camera": "Which camera would you like me to start?",
+    "stop_camera": "Which camera would you like me to stop?",
+}
+
+
+@dataclass(slots=True)
 class Camera:
     """Camera representation."""
 
@@ -24,8 +124,12 @@ class Camera:
     is_active: bool
     status: str
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for skill result data."""
+        return asdict(self)
 
-@dataclass
+
+@dataclass(slots=True)
 class Event:
     """Security event representation."""
 
@@ -37,6 +141,10 @@ class Event:
     entities: list[str]
     confidence: float
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for skill result data."""
+        return asdict(self)
+
 
 class ArgusCameraSkill(Skill):
     """Integrates with ArgusAI for AI-powered security camera monitoring.
@@ -71,37 +179,32 @@ class ArgusCameraSkill(Skill):
 
     def __init__(self, jarvis: "Jarvis") -> None:
         super().__init__(jarvis)
-        # Keywords that suggest camera/security context
-        self._context_keywords = [
-            "camera", "cameras", "security", "motion", "movement", "activity",
-            "surveillance", "recording", "monitoring", "watching", "detect",
-            "event", "events", "alert", "alerts", "notification",
-        ]
-        # Location keywords that often refer to cameras
-        self._location_keywords = [
-            "driveway", "front door", "back door", "backyard", "front yard",
-            "garage", "porch", "patio", "entrance", "gate", "sidewalk",
-            "street", "yard", "garden", "pool", "basement", "attic",
-        ]
-        # Action keywords
-        self._check_keywords = [
-            "check", "look", "see", "show", "happening", "going on",
-            "anyone", "someone", "anything", "visitor", "package",
-            "delivery", "car", "person", "people", "animal", "dog", "cat",
-        ]
-        self._control_keywords = [
-            "start", "stop", "enable", "disable", "turn on", "turn off",
-            "activate", "deactivate", "pause", "resume",
-        ]
+        # Intent -> handler. Location handlers take the camera name; without
+        # one, the intent falls back to its plain handler or a prompt.
+        self._location_handlers = {
+            "start_camera": self._handle_start_camera,
+            "stop_camera": self._handle_stop_camera,
+            "check_location": self._handle_camera_events,
+        }
+        self._handlers = {
+            "list_cameras": self._handle_list_cameras,
+            "status": self._handle_status,
+            "reanalyze": self._handle_reanalyze,
+            "check_location": self._handle_recent_events,
+            "recent_events": self._handle_recent_events,
+        }
 
         settings = jarvis.settings.argus_ai
         self._base_url = settings.base_url.rstrip("/")
         self._api_key = settings.api_key
         self._enabled = settings.enabled
-        self._client = httpx.AsyncClient(
-            timeout=15.0,
-            headers={"X-API-Key": self._api_key} if self._api_key else {},
-        )
+        self._client = jarvis.http_client
+        self._headers = {"X-API-Key": self._api_key} if self._api_key else {}
+        # Endpoint -> (fetched at, response) for rarely changing lookups
+        self._cache: dict[str, tuple[float, Any]] = {}
+        # GET URL -> (conditional request headers, decoded body) for
+        # responses that carried an ETag or Last-Modified
+        self._validated: dict[str, tuple[dict[str, str], Any]] = {}
 
     async def can_handle(self, text: str, context: "ConversationContext") -> bool:
         """Check if this is a camera-related request using natural language understanding."""
@@ -111,35 +214,79 @@ class ArgusCameraSkill(Skill):
         text_lower = text.lower()
 
         # Direct camera/security mentions
-        if any(kw in text_lower for kw in self._context_keywords):
+        if CONTEXT_RE.search(text_lower):
             return True
 
-        # Location + check action (e.g., "is anyone at the front door?")
-        has_location = any(loc in text_lower for loc in self._location_keywords)
-        has_check = any(kw in text_lower for kw in self._check_keywords)
-        if has_location and has_check:
-            return True
+        # Everything below needs a location
+        if not LOCATION_RE.search(text_lower):
+            return False
 
-        # Location + control action (e.g., "turn on the garage camera")
-        has_control = any(kw in text_lower for kw in self._control_keywords)
-        if has_location and has_control:
-            return True
+        # Location + check action (e.g., "is anyone at the front door?"),
+        # location + control action (e.g., "turn on the garage camera"),
+        # or questions about what's happening outside/at locations
+        return bool(
+            ACTION_RE.search(text_lower)
+            or CONTROL_RE.search(text_lower)
+            or QUESTION_RE.search(text_lower)
+        )
 
-        # Questions about what's happening outside/at locations
-        if has_location and any(q in text_lower for q in ["what", "who", "is there", "any"]):
-            return True
+    async def _send(
+        self, method: str, url: str, headers: dict[str, str], **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request, retrying idempotent ones on transient failures.
 
-        return False
+        Raises:
+            httpx.TransportError: If the last attempt could not connect
+        """
+        retries = RETRY_ATTEMPTS - 1 if method in IDEMPOTENT_METHODS else 0
+        for retry in range(retries):
+            try:
+                response = await self._client.request(
+                    method, url, headers=headers, timeout=REQUEST_TIMEOUT, **kwargs
+                )
+                if response.status_code < 500:
+                    return response
+            except httpx.TransportError:
+                pass
+            delay = RETRY_BASE_DELAY * 2**retry
+            await asyncio.sleep(delay + random.uniform(0, delay / 2))
+
+        return await self._client.request(
+            method, url, headers=headers, timeout=REQUEST_TIMEOUT, **kwargs
+        )
 
     async def _api_request(
         self, method: str, endpoint: str, **kwargs: Any
     ) -> dict[str, Any] | list[Any] | None:
-        """Make an API request to ArgusAI."""
+        """Make an API request to ArgusAI.
+
+        GETs are revalidated with If-None-Match/If-Modified-Since when the
+        server sent validators, and a 304 reuses the previously decoded body.
+        """
         try:
             url = f"{self._base_url}{endpoint}"
-            response = await self._client.request(method, url, **kwargs)
+            headers = self._headers
+            key = validated = None
+            if method == "GET":
+                key = str(httpx.URL(url, params=kwargs.get("params")))
+                if validated := self._validated.get(key):
+                    headers = {**headers, **validated[0]}
+
+            response = await self._send(method, url, headers, **kwargs)
+            if response.status_code == 304 and validated:
+                return validated[1]
             response.raise_for_status()
-            return response.json()
+            data = orjson.loads(response.content)
+
+            if key is not None:
+                conditions = {}
+                if etag := response.headers.get("ETag"):
+                    conditions["If-None-Match"] = etag
+                if last_modified := response.headers.get("Last-Modified"):
+                    conditions["If-Modified-Since"] = last_modified
+                if conditions:
+                    self._validated[key] = (conditions, data)
+            return data
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 return None
@@ -147,41 +294,75 @@ class ArgusCameraSkill(Skill):
         except Exception:
             return None
 
+    async def _api_request_ok(self, method: str, endpoint: str, **kwargs: Any) -> bool:
+        """Make an API request to ArgusAI where only success matters.
+
+        The response body is not decoded, so an empty reply still counts
+        as success.
+        """
+        try:
+            url = f"{self._base_url}{endpoint}"
+            response = await self._send(method, url, self._headers, **kwargs)
+            response.raise_for_status()
+            return True
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return False
+            raise
+        except Exception:
+            return False
+
+    async def _cached(
+        self, key: str, ttl: float, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return a cached response for key if younger than ttl, else fetch it.
+
+        Failed requests (None) are not cached.
+        """
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+
+        result = await fetch()
+        if result is not None:
+            self._cache[key] = (now, result)
+        return result
+
     async def _get_cameras(self) -> list[Camera]:
         """Fetch all cameras."""
-        data = await self._api_request("GET", "/cameras")
+        data = await self._cached(
+            "/cameras", CAMERAS_CACHE_TTL, lambda: self._api_request("GET", "/cameras")
+        )
         if not data:
             return []
 
-        cameras = []
-        for cam in data if isinstance(data, list) else data.get("cameras", []):
-            cameras.append(
-                Camera(
-                    id=cam.get("id", ""),
-                    name=cam.get("name", "Unknown"),
-                    source_type=cam.get("source_type", "unknown"),
-                    is_active=cam.get("is_active", False),
-                    status=cam.get("status", "unknown"),
-                )
+        return [
+            Camera(
+                id=cam.get("id", ""),
+                name=cam.get("name", "Unknown"),
+                source_type=cam.get("source_type", "unknown"),
+                is_active=cam.get("is_active", False),
+                status=cam.get("status", "unknown"),
             )
-        return cameras
+            for cam in (data if isinstance(data, list) else data.get("cameras", []))
+        ]
 
     async def _get_camera_by_name(self, name: str) -> Camera | None:
         """Find a camera by name (fuzzy match)."""
         cameras = await self._get_cameras()
         name_lower = name.lower().strip()
 
-        # Exact match first
+        # Exact match wins; otherwise the first partial match
+        partial = None
         for cam in cameras:
-            if cam.name.lower() == name_lower:
+            cam_lower = cam.name.lower()
+            if cam_lower == name_lower:
                 return cam
+            if partial is None and (name_lower in cam_lower or cam_lower in name_lower):
+                partial = cam
 
-        # Partial match
-        for cam in cameras:
-            if name_lower in cam.name.lower() or cam.name.lower() in name_lower:
-                return cam
-
-        return None
+        return partial
 
     async def _get_events(
         self, camera_id: str | None = None, limit: int = 5
@@ -195,38 +376,32 @@ class ArgusCameraSkill(Skill):
         if not data:
             return []
 
-        events = []
-        event_list = data if isinstance(data, list) else data.get("events", [])
-        for evt in event_list:
-            try:
-                timestamp = datetime.fromisoformat(
-                    evt.get("timestamp", "").replace("Z", "+00:00")
-                )
-            except (ValueError, TypeError):
-                timestamp = datetime.now()
-
-            events.append(
-                Event(
-                    id=evt.get("id", ""),
-                    camera_id=evt.get("camera_id", ""),
-                    camera_name=evt.get("camera_name", "Unknown"),
-                    timestamp=timestamp,
-                    description=evt.get("description", "No description"),
-                    entities=evt.get("entities", []),
-                    confidence=evt.get("confidence", 0.0),
-                )
+        return [
+            Event(
+                id=evt.get("id", ""),
+                camera_id=evt.get("camera_id", ""),
+                camera_name=evt.get("camera_name", "Unknown"),
+                timestamp=parse_timestamp(evt.get("timestamp")),
+                description=evt.get("description", "No description"),
+                entities=evt.get("entities", []),
+                confidence=evt.get("confidence", 0.0),
             )
-        return events
+            for evt in (data if isinstance(data, list) else data.get("events", []))
+        ]
 
     async def _start_camera(self, camera_id: str) -> bool:
         """Start a camera."""
-        result = await self._api_request("POST", f"/cameras/{camera_id}/start")
-        return result is not None
+        if not await self._api_request_ok("POST", f"/cameras/{camera_id}/start"):
+            return False
+        self._cache.pop("/cameras", None)
+        return True
 
     async def _stop_camera(self, camera_id: str) -> bool:
         """Stop a camera."""
-        result = await self._api_request("POST", f"/cameras/{camera_id}/stop")
-        return result is not None
+        if not await self._api_request_ok("POST", f"/cameras/{camera_id}/stop"):
+            return False
+        self._cache.pop("/cameras", None)
+        return True
 
     async def _reanalyze_event(self, event_id: str) -> dict[str, Any] | None:
         """Re-analyze an event with AI."""
@@ -234,44 +409,46 @@ class ArgusCameraSkill(Skill):
 
     async def _check_health(self) -> bool:
         """Check if ArgusAI is healthy."""
-        result = await self._api_request("GET", "/health")
+        result = await self._cached(
+            "/health", HEALTH_CACHE_TTL, lambda: self._api_request("GET", "/health")
+        )
         return result is not None and result.get("status") == "healthy"
 
-    def _format_time_ago(self, dt: datetime) -> str:
-        """Format a datetime as time ago."""
-        now = datetime.now(dt.tzinfo) if dt.tzinfo else datetime.now()
-        diff = now - dt
+    def _format_time_ago(self, dt: datetime, now: datetime | None = None) -> str:
+        """Format a datetime as time ago.
 
-        seconds = diff.total_seconds()
+        Args:
+            dt: Time to describe
+            now: Current time, so callers formatting several events fetch it
+                once. Ignored if only one of now and dt is timezone-aware.
+        """
+        if now is None or (now.tzinfo is None) != (dt.tzinfo is None):
+            now = datetime.now(dt.tzinfo) if dt.tzinfo else datetime.now()
+
+        seconds = int((now - dt).total_seconds())
         if seconds < 60:
             return "just now"
         elif seconds < 3600:
-            minutes = int(seconds / 60)
+            minutes = seconds // 60
             return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
         elif seconds < 86400:
-            hours = int(seconds / 3600)
+            hours = seconds // 3600
             return f"{hours} hour{'s' if hours != 1 else ''} ago"
         else:
-            days = int(seconds / 86400)
+            days = seconds // 86400
             return f"{days} day{'s' if days != 1 else ''} ago"
 
-    def _extract_location(self, text: str) -> str | None:
-        """Extract a location/camera name from natural language."""
-        text_lower = text.lower()
-
+    @staticmethod
+    def _extract_location(text_lower: str) -> str | None:
+        """Extract a location/camera name from lowercased natural language."""
         # Check for explicit camera mentions like "the driveway camera"
-        for loc in self._location_keywords:
+        for loc in LOCATION_KEYWORDS:
             if loc in text_lower:
                 return loc
 
         # Try to find camera name patterns
-        patterns = [
-            r"(?:the |my )?(\w+(?:\s+\w+)?)\s+camera",
-            r"camera\s+(?:at|on|in|for)\s+(?:the\s+)?(\w+(?:\s+\w+)?)",
-            r"(?:at|on|in)\s+(?:the\s+)?(\w+(?:\s+\w+)?)\s*\??$",
-        ]
-        for pattern in patterns:
-            if match := re.search(pattern, text_lower):
+        for pattern in LOCATION_PATTERNS:
+            if match := pattern.search(text_lower):
                 return match.group(1).strip()
 
         return None
@@ -282,25 +459,30 @@ class ArgusCameraSkill(Skill):
         Returns:
             Tuple of (intent, location/camera_name or None)
         """
-        text_lower = text.lower()
-        location = self._extract_location(text)
+        return self._detect_intent_cached(text.lower())
 
-        # Control intents - start/stop cameras
-        start_phrases = ["start", "turn on", "enable", "activate", "begin monitoring", "watch"]
-        stop_phrases = ["stop", "turn off", "disable", "deactivate", "stop monitoring", "pause"]
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def _detect_intent_cached(cls, text_lower: str) -> tuple[str, str | None]:
+        """Detect intent from lowercased text.
 
-        if any(phrase in text_lower for phrase in start_phrases):
+        Pure in its input, so repeated queries ("is anyone at the front
+        door?") are answered from the cache.
+        """
+        location = cls._extract_location(text_lower)
+
+        # Control intents - start/stop cameras
+        if START_RE.search(text_lower):
             return ("start_camera", location)
-        if any(phrase in text_lower for phrase in stop_phrases):
+        if STOP_RE.search(text_lower):
             return ("stop_camera", location)
 
         # Re-analyze intent
-        if any(kw in text_lower for kw in ["reanalyze", "re-analyze", "analyze again", "look again"]):
+        if REANALYZE_RE.search(text_lower):
             return ("reanalyze", None)
 
         # List cameras intent
-        list_phrases = ["how many cameras", "list cameras", "show cameras", "what cameras", "which cameras", "all cameras", "my cameras"]
-        if any(phrase in text_lower for phrase in list_phrases):
+        if LIST_CAMERAS_RE.search(text_lower):
             return ("list_cameras", None)
 
         # Status intent
@@ -308,24 +490,11 @@ class ArgusCameraSkill(Skill):
             return ("status", None)
 
         # Check specific location - questions about what's happening
-        check_phrases = [
-            "anyone", "someone", "anything", "something",
-            "what's happening", "what is happening", "going on",
-            "check", "look at", "show me", "see",
-            "who's at", "who is at", "is there",
-            "any activity", "any motion", "any movement",
-            "visitor", "package", "delivery", "car",
-        ]
-        if location and any(phrase in text_lower for phrase in check_phrases):
+        if location and CHECK_RE.search(text_lower):
             return ("check_location", location)
 
         # General event queries
-        event_phrases = [
-            "any events", "recent events", "what happened", "what did you see",
-            "any alerts", "notifications", "detected anything", "motion detected",
-            "any activity", "anything unusual", "anything suspicious",
-        ]
-        if any(phrase in text_lower for phrase in event_phrases):
+        if EVENTS_RE.search(text_lower):
             return ("recent_events", None)
 
         # If we have a location mentioned, default to checking it
@@ -359,35 +528,11 @@ class ArgusCameraSkill(Skill):
         # Detect intent from natural language
         intent, location = self._detect_intent(text)
 
-        match intent:
-            case "list_cameras":
-                return await self._handle_list_cameras()
-            case "status":
-                return await self._handle_status()
-            case "start_camera":
-                if location:
-                    return await self._handle_start_camera(location)
-                return SkillResult(
-                    success=False,
-                    response="Which camera would you like me to start?",
-                )
-            case "stop_camera":
-                if location:
-                    return await self._handle_stop_camera(location)
-                return SkillResult(
-                    success=False,
-                    response="Which camera would you like me to stop?",
-                )
-            case "reanalyze":
-                return await self._handle_reanalyze()
-            case "check_location":
-                if location:
-                    return await self._handle_camera_events(location)
-                return await self._handle_recent_events()
-            case "recent_events":
-                return await self._handle_recent_events()
-            case _:
-                return await self._handle_status()
+        if location and (handler := self._location_handlers.get(intent)):
+            return await handler(location)
+        if prompt := MISSING_CAMERA_PROMPTS.get(intent):
+            return SkillResult(success=False, response=prompt)
+        return await self._handlers.get(intent, self._handle_status)()
 
     async def _handle_list_cameras(self) -> SkillResult:
         """List all cameras."""
@@ -400,27 +545,26 @@ class ArgusCameraSkill(Skill):
                 data={"cameras": []},
             )
 
-        active = [c for c in cameras if c.is_active]
-        inactive = [c for c in cameras if not c.is_active]
+        active: list[str] = []
+        inactive: list[str] = []
+        for c in cameras:
+            (active if c.is_active else inactive).append(c.name)
 
         response = f"You have {len(cameras)} camera{'s' if len(cameras) != 1 else ''}. "
         if active:
-            names = ", ".join(c.name for c in active)
-            response += f"{len(active)} active: {names}. "
+            response += f"{len(active)} active: {', '.join(active)}. "
         if inactive:
-            names = ", ".join(c.name for c in inactive)
-            response += f"{len(inactive)} inactive: {names}."
+            response += f"{len(inactive)} inactive: {', '.join(inactive)}."
 
         return SkillResult(
             success=True,
             response=response.strip(),
-            data={"cameras": [vars(c) for c in cameras]},
+            data={"cameras": [c.to_dict() for c in cameras]},
         )
 
     async def _handle_status(self) -> SkillResult:
         """Get overall security status."""
-        cameras = await self._get_cameras()
-        events = await self._get_events(limit=3)
+        cameras, events = await asyncio.gather(self._get_cameras(), self._get_events(limit=3))
 
         active_count = sum(1 for c in cameras if c.is_active)
         response = f"Security status: {active_count} of {len(cameras)} cameras active. "
@@ -436,8 +580,8 @@ class ArgusCameraSkill(Skill):
             success=True,
             response=response,
             data={
-                "cameras": [vars(c) for c in cameras],
-                "recent_events": [vars(e) for e in events],
+                "cameras": [c.to_dict() for c in cameras],
+                "recent_events": [e.to_dict() for e in events],
             },
         )
 
@@ -509,18 +653,19 @@ class ArgusCameraSkill(Skill):
             return SkillResult(
                 success=True,
                 response=f"No recent events on the {camera.name} camera. It's {status}.",
-                data={"camera": vars(camera), "events": []},
+                data={"camera": camera.to_dict(), "events": []},
             )
 
         response = f"Recent events on {camera.name}: "
+        now = datetime.now(UTC)
         for evt in events[:3]:
-            time_ago = self._format_time_ago(evt.timestamp)
+            time_ago = self._format_time_ago(evt.timestamp, now)
             response += f"{time_ago}: {evt.description}. "
 
         return SkillResult(
             success=True,
             response=response.strip(),
-            data={"camera": vars(camera), "events": [vars(e) for e in events]},
+            data={"camera": camera.to_dict(), "events": [e.to_dict() for e in events]},
         )
 
     async def _handle_recent_events(self) -> SkillResult:
@@ -535,8 +680,9 @@ class ArgusCameraSkill(Skill):
             )
 
         response = "Recent security events: "
+        now = datetime.now(UTC)
         for evt in events[:3]:
-            time_ago = self._format_time_ago(evt.timestamp)
+            time_ago = self._format_time_ago(evt.timestamp, now)
             response += f"{evt.camera_name} ({time_ago}): {evt.description}. "
 
         if len(events) > 3:
@@ -545,7 +691,7 @@ class ArgusCameraSkill(Skill):
         return SkillResult(
             success=True,
             response=response.strip(),
-            data={"events": [vars(e) for e in events]},
+            data={"events": [e.to_dict() for e in events]},
         )
 
     async def _handle_reanalyze(self) -> SkillResult:
@@ -566,14 +712,10 @@ class ArgusCameraSkill(Skill):
             return SkillResult(
                 success=True,
                 response=f"Re-analyzed the last event from {event.camera_name}. New analysis: {new_description}",
-                data={"event": vars(event), "new_analysis": result},
+                data={"event": event.to_dict(), "new_analysis": result},
             )
         else:
             return SkillResult(
                 success=False,
                 response="Failed to re-analyze the event. The AI service may be unavailable.",
             )
-
-    async def close(self) -> None:
-        """Cleanup."""
-        await self._client.aclose()
@@ -1,5 +1,7 @@
 """Base skill interface and registry."""
 
+import asyncio
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
@@ -65,26 +67,49 @@ class SkillRegistry:
 
     def __init__(self) -> None:
         self._skills: list[Skill] = []
+        # Skill name -> pattern matching any of its trigger words
+        self._triggers: dict[str, re.Pattern[str]] = {}
 
     def register(self, skill: Skill) -> None:
         """Register a skill."""
         self._skills.append(skill)
+        if skill.triggers:
+            self._triggers[skill.name] = re.compile(
+                "|".join(map(re.escape, skill.triggers)), re.IGNORECASE
+            )
 
     def unregister(self, skill_name: str) -> bool:
         """Unregister a skill by name."""
         for i, skill in enumerate(self._skills):
             if skill.name == skill_name:
                 self._skills.pop(i)
+                self._triggers.pop(skill_name, None)
                 return True
         return False
 
     async def find_skill(
         self, text: str, context: "ConversationContext"
     ) -> Skill | None:
-        """Find a skill that can handle the given input."""
+        """Find a skill that can handle the given input.
+
+        Skills whose trigger words appear in the text are asked first. The
+        rest are still asked afterwards, since can_handle may accept more
+        than the trigger words. Each group is asked concurrently and the
+        first willing skill in registration order wins.
+        """
+        triggered: list[Skill] = []
+        others: list[Skill] = []
         for skill in self._skills:
-            if await skill.can_handle(text, context):
-                return skill
+            pattern = self._triggers.get(skill.name)
+            (triggered if pattern and pattern.search(text) else others).append(skill)
+
+        for candidates in (triggered, others):
+            results = await asyncio.gather(
+                *(skill.can_handle(text, context) for skill in candidates)
+            )
+            for skill, accepted in zip(candidates, results, strict=True):
+                if accepted:
+                    return skill
         return None
 
     async def execute(
@@ -1,18 +1,55 @@
 """Calendar skill - manages calendar events."""
 
-import json
+import bisect
 import re
+from collections.abc import Iterator
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
-from pathlib import Path
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
+import orjson
+
 from skills.base import Skill, SkillResult
+from skills.formatting import format_time, format_weekday
+from skills.storage import DebouncedSave, write_json
+from skills.timeparse import parse_clock, parse_weekday
 
 if TYPE_CHECKING:
     from core.context import ConversationContext
     from core.jarvis import Jarvis
 
+# Requests this skill handles, as one alternation so can_handle is a single scan
+QUERY_RE = re.compile("|".join(f"(?:{pattern})" for pattern in (
+    r"(?:what(?:'s| is) )?(?:on )?my (?:calendar|schedule|agenda)",
+    r"(?:what )?(?:do i have|am i doing) (?:today|tomorrow|this week)",
+    r"(?:add|create|schedule|set up) (?:a |an )?(?:event|meeting|appointment)",
+    r"(?:remind me about|what(?:'s| is) happening)",
+    r"(?:cancel|delete|remove) (?:the |my )?(?:event|meeting|appointment)",
+    r"(?:when is|what time is) (?:the |my )?",
+)))
+# Every QUERY_RE match contains one of these; a plain substring check rules
+# out most unrelated utterances before the regex runs
+QUERY_WORDS = (
+    "calendar", "schedule", "agenda", "event", "meeting", "appointment",
+    "do i have", "am i doing", "happening", "remind me about", "when is", "what time is",
+)
+# Words that pick the add and delete actions (substring match)
+ADD_RE = re.compile("add|create|schedule|set up")
+DELETE_RE = re.compile("cancel|delete|remove")
+TITLE_RE = re.compile(r'(?:called |titled |named )"?([^"]+)"?')
+# Fallback: the words after "add an event" etc.
+TITLE_FALLBACK_RE = re.compile(
+    r"(?:add|create|schedule|set up) (?:a |an )?(?:event|meeting|appointment)"
+    r"(?: (?:for|about|called))? (.+?)(?:\s+(?:on|at|for|tomorrow|today)|\s*$)"
+)
+
+# Recurrence -> fixed step, and recurrence -> step in calendar months
+RECURRENCE_STEPS = {"daily": timedelta(days=1), "weekly": timedelta(weeks=1)}
+RECURRENCE_MONTHS = {"monthly": 1, "yearly": 12}
+# Sort key for the one-off event index
+BY_START = attrgetter("start")
+
 
 @dataclass
 class CalendarEvent:
@@ -28,11 +65,43 @@ class CalendarEvent:
     recurring: str = ""  # daily, weekly, monthly, yearly, or empty
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        data = asdict(self)
-        data["start"] = self.start.isoformat()
-        data["end"] = self.end.isoformat() if self.end else None
-        return data
+        """Convert to dictionary for skill result data."""
+        return asdict(self)
+
+    def occurrences(self, start: datetime, end: datetime) -> Iterator[datetime]:
+        """Yield the start of each occurrence within [start, end].
+
+        Recurring events jump straight to the first period at or after start
+        instead of stepping from the original date. Months without the
+        event's day (e.g. the 31st) are skipped.
+        """
+        first = self.start
+        if first > end:
+            return
+
+        if step := RECURRENCE_STEPS.get(self.recurring):
+            if first < start:
+                first += -((first - start) // step) * step
+            while first <= end:
+                yield first
+                first += step
+        elif months := RECURRENCE_MONTHS.get(self.recurring):
+            elapsed = (start.year - first.year) * 12 + start.month - first.month
+            index = max(0, elapsed // months) * months
+            while True:
+                year, month = divmod(first.month - 1 + index, 12)
+                year += first.year
+                if (year, month + 1) > (end.year, end.month):
+                    return
+                try:
+                    when = first.replace(year=year, month=month + 1)
+                except ValueError:
+                    when = None
+                if when is not None and start <= when <= end:
+                    yield when
+                index += months
+        elif start <= first:
+            yield first
 
     @classmethod
     def from_dict(cls, data: dict) -> "CalendarEvent":
@@ -56,54 +125,71 @@ class CalendarSkill(Skill):
 
     def __init__(self, jarvis: "Jarvis") -> None:
         super().__init__(jarvis)
-        self._patterns = [
-            r"(?:what(?:'s| is) )?(?:on )?my (?:calendar|schedule|agenda)",
-            r"(?:what )?(?:do i have|am i doing) (?:today|tomorrow|this week)",
-            r"(?:add|create|schedule|set up) (?:a |an )?(?:event|meeting|appointment)",
-            r"(?:remind me about|what(?:'s| is) happening)",
-            r"(?:cancel|delete|remove) (?:the |my )?(?:event|meeting|appointment)",
-            r"(?:when is|what time is) (?:the |my )?",
-        ]
-        self._events: list[CalendarEvent] = []
-        self._storage_path: Path | None = None
+        # id -> event, in creation order
+        self._events: dict[str, CalendarEvent] = {}
+        # One-off events sorted by start, so range queries can bisect, and
+        # recurring events, which are expanded on every query
+        self._one_off: list[CalendarEvent] = []
+        self._recurring: dict[str, CalendarEvent] = {}
+        # Jarvis creates the data directory on startup
+        self._storage_path = jarvis.settings.data_dir / "calendar.json"
         self._loaded = False
-
-    def _ensure_storage(self) -> Path:
-        """Ensure storage path exists."""
-        if self._storage_path is None:
-            data_dir = self.jarvis.settings.ensure_data_dir()
-            self._storage_path = data_dir / "calendar.json"
-        return self._storage_path
+        self._saver = DebouncedSave(self._write_events)
 
     def _load_events(self) -> None:
         """Load events from storage."""
         if self._loaded:
             return
 
-        path = self._ensure_storage()
+        path = self._storage_path
         if path.exists():
             try:
-                data = json.loads(path.read_text())
-                self._events = [CalendarEvent.from_dict(e) for e in data]
+                data = orjson.loads(path.read_bytes())
+                events = (CalendarEvent.from_dict(e) for e in data)
+                self._events = {e.id: e for e in events}
             except Exception:
-                self._events = []
+                self._events = {}
+        for event in self._events.values():
+            self._index_event(event)
         self._loaded = True
 
+    def _index_event(self, event: CalendarEvent) -> None:
+        """Add an event to the range query index."""
+        if event.recurring:
+            self._recurring[event.id] = event
+        else:
+            bisect.insort_right(self._one_off, event, key=BY_START)
+
+    def _unindex_event(self, event: CalendarEvent) -> None:
+        """Remove an event from the range query index."""
+        if event.recurring:
+            del self._recurring[event.id]
+            return
+
+        i = bisect.bisect_left(self._one_off, event.start, key=BY_START)
+        while self._one_off[i] is not event:
+            i += 1
+        del self._one_off[i]
+
     def _save_events(self) -> None:
-        """Save events to storage."""
-        path = self._ensure_storage()
-        data = [e.to_dict() for e in self._events]
-        path.write_text(json.dumps(data, indent=2))
+        """Save events to storage, coalescing changes made close together."""
+        self._saver.schedule()
+
+    def _write_events(self) -> None:
+        """Write events to storage."""
+        write_json(self._storage_path, list(self._events.values()))
 
     async def can_handle(self, text: str, context: "ConversationContext") -> bool:
         """Check if asking about calendar."""
         text_lower = text.lower()
-        return any(re.search(pattern, text_lower) for pattern in self._patterns)
+        for word in QUERY_WORDS:
+            if word in text_lower:
+                return QUERY_RE.search(text_lower) is not None
+        return False
 
-    def _parse_datetime(self, text: str) -> datetime | None:
-        """Parse a datetime from natural language."""
+    def _parse_datetime(self, text_lower: str) -> datetime | None:
+        """Parse a datetime from lowercased natural language."""
         now = datetime.now()
-        text_lower = text.lower()
 
         # Relative dates
         if "today" in text_lower:
@@ -112,28 +198,19 @@ class CalendarSkill(Skill):
             return (now + timedelta(days=1)).replace(hour=9, minute=0, second=0, microsecond=0)
 
         # Day names
-        days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-        for i, day in enumerate(days):
-            if day in text_lower:
-                days_ahead = i - now.weekday()
-                if days_ahead <= 0:
-                    days_ahead += 7
-                return (now + timedelta(days=days_ahead)).replace(
-                    hour=9, minute=0, second=0, microsecond=0
-                )
+        weekday = parse_weekday(text_lower)
+        if weekday is not None:
+            days_ahead = weekday - now.weekday()
+            if days_ahead <= 0:
+                days_ahead += 7
+            return (now + timedelta(days=days_ahead)).replace(
+                hour=9, minute=0, second=0, microsecond=0
+            )
 
         # Time patterns
-        time_match = re.search(r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)?", text_lower)
-        if time_match:
-            hour = int(time_match.group(1))
-            minute = int(time_match.group(2) or 0)
-            ampm = time_match.group(3)
-
-            if ampm == "pm" and hour < 12:
-                hour += 12
-            elif ampm == "am" and hour == 12:
-                hour = 0
-
+        clock = parse_clock(text_lower)
+        if clock:
+            hour, minute = clock
             return now.replace(hour=hour, minute=minute, second=0, microsecond=0)
 
         return None
@@ -143,44 +220,30 @@ class CalendarSkill(Skill):
     ) -> list[CalendarEvent]:
         """Get events within a date range."""
         self._load_events()
-        events = []
-
-        for event in self._events:
-            if start <= event.start <= end:
-                events.append(event)
-            elif event.recurring:
-                # Check recurring events
-                check_date = event.start
-                while check_date <= end:
-                    if start <= check_date <= end:
-                        # Create instance of recurring event
-                        instance = CalendarEvent(
-                            id=f"{event.id}_{check_date.isoformat()}",
-                            title=event.title,
-                            start=check_date,
-                            end=event.end,
-                            location=event.location,
-                            description=event.description,
-                            all_day=event.all_day,
-                        )
-                        events.append(instance)
-                        break
-
-                    if event.recurring == "daily":
-                        check_date += timedelta(days=1)
-                    elif event.recurring == "weekly":
-                        check_date += timedelta(weeks=1)
-                    elif event.recurring == "monthly":
-                        check_date = check_date.replace(
-                            month=check_date.month + 1 if check_date.month < 12 else 1,
-                            year=check_date.year if check_date.month < 12 else check_date.year + 1,
-                        )
-                    elif event.recurring == "yearly":
-                        check_date = check_date.replace(year=check_date.year + 1)
-                    else:
-                        break
-
-        return sorted(events, key=lambda e: e.start)
+        lo = bisect.bisect_left(self._one_off, start, key=BY_START)
+        hi = bisect.bisect_right(self._one_off, end, key=BY_START)
+        events = self._one_off[lo:hi]
+
+        for event in self._recurring.values():
+            for when in event.occurrences(start, end):
+                if when == event.start:
+                    events.append(event)
+                    continue
+
+                # Create instance of recurring event
+                events.append(
+                    CalendarEvent(
+                        id=f"{event.id}_{when.isoformat()}",
+                        title=event.title,
+                        start=when,
+                        end=event.end,
+                        location=event.location,
+                        description=event.description,
+                        all_day=event.all_day,
+                    )
+                )
+
+        return sorted(events, key=BY_START)
 
     async def execute(self, text: str, context: "ConversationContext") -> SkillResult:
         """Handle calendar requests."""
@@ -188,20 +251,19 @@ class CalendarSkill(Skill):
         self._load_events()
 
         # Check for add/create intent
-        if any(word in text_lower for word in ["add", "create", "schedule", "set up"]):
-            return await self._add_event(text)
+        if ADD_RE.search(text_lower):
+            return await self._add_event(text_lower)
 
         # Check for delete/cancel intent
-        if any(word in text_lower for word in ["cancel", "delete", "remove"]):
-            return await self._delete_event(text)
+        if DELETE_RE.search(text_lower):
+            return await self._delete_event(text_lower)
 
         # Default: list events
-        return await self._list_events(text)
+        return await self._list_events(text_lower)
 
-    async def _list_events(self, text: str) -> SkillResult:
+    async def _list_events(self, text_lower: str) -> SkillResult:
         """List upcoming events."""
         now = datetime.now()
-        text_lower = text.lower()
 
         # Determine date range
         if "today" in text_lower:
@@ -230,28 +292,25 @@ class CalendarSkill(Skill):
                 response=f"You have nothing scheduled for {period}.",
             )
 
-        response = f"Here's what's on your calendar for {period}: "
+        parts = [f"Here's what's on your calendar for {period}: "]
         for event in events:
-            time_str = event.start.strftime("%I:%M %p") if not event.all_day else "All day"
-            date_str = event.start.strftime("%A")
-            response += f"{event.title} on {date_str} at {time_str}. "
+            time_str = format_time(event.start) if not event.all_day else "All day"
+            date_str = format_weekday(event.start)
+            parts.append(f"{event.title} on {date_str} at {time_str}. ")
 
         return SkillResult(
             success=True,
-            response=response.strip(),
+            response="".join(parts).strip(),
             data={"events": [e.to_dict() for e in events]},
         )
 
-    async def _add_event(self, text: str) -> SkillResult:
+    async def _add_event(self, text_lower: str) -> SkillResult:
         """Add a new event."""
         # Extract event title (text after "called" or between quotes)
-        title_match = re.search(r'(?:called |titled |named )"?([^"]+)"?', text.lower())
+        title_match = TITLE_RE.search(text_lower)
         if not title_match:
             # Try to extract from the general structure
-            title_match = re.search(
-                r"(?:add|create|schedule|set up) (?:a |an )?(?:event|meeting|appointment)(?: (?:for|about|called))? (.+?)(?:\s+(?:on|at|for|tomorrow|today)|\s*$)",
-                text.lower(),
-            )
+            title_match = TITLE_FALLBACK_RE.search(text_lower)
 
         if not title_match:
             return SkillResult(
@@ -262,7 +321,7 @@ class CalendarSkill(Skill):
         title = title_match.group(1).strip()
 
         # Parse date/time
-        event_time = self._parse_datetime(text)
+        event_time = self._parse_datetime(text_lower)
         if not event_time:
             event_time = datetime.now() + timedelta(hours=1)
             event_time = event_time.replace(minute=0, second=0, microsecond=0)
@@ -277,24 +336,24 @@ class CalendarSkill(Skill):
             end=event_time + timedelta(hours=1),
         )
 
-        self._events.append(event)
+        self._events[event.id] = event
+        self._index_event(event)
         self._save_events()
 
-        time_str = event_time.strftime("%A at %I:%M %p")
+        time_str = f"{format_weekday(event_time)} at {format_time(event_time)}"
         return SkillResult(
             success=True,
             response=f"I've added '{event.title}' to your calendar for {time_str}.",
             data={"event": event.to_dict()},
         )
 
-    async def _delete_event(self, text: str) -> SkillResult:
+    async def _delete_event(self, text_lower: str) -> SkillResult:
         """Delete an event."""
         # Try to find event by title
-        text_lower = text.lower()
-
-        for event in self._events:
+        for event in self._events.values():
             if event.title.lower() in text_lower:
-                self._events.remove(event)
+                del self._events[event.id]
+                self._unindex_event(event)
                 self._save_events()
                 return SkillResult(
                     success=True,
@@ -305,3 +364,7 @@ class CalendarSkill(Skill):
             success=False,
             response="I couldn't find that event on your calendar.",
         )
+
+    async def close(self) -> None:
+        """Write pending changes."""
+        self._saver.flush()
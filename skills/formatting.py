@@ -0,0 +1,28 @@
+"""Date and time formatting for spoken skill responses.
+
+Lookups into fixed English names are cheaper than strftime when building
+responses that list many events or reminders.
+"""
+
+from datetime import datetime
+
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+
+def format_time(dt: datetime) -> str:
+    """Format a time like "09:30 AM" (strftime "%I:%M %p")."""
+    return f"{dt.hour % 12 or 12:02d}:{dt.minute:02d} {'AM' if dt.hour < 12 else 'PM'}"
+
+
+def format_weekday(dt: datetime) -> str:
+    """Format the day of the week like "Monday" (strftime "%A")."""
+    return WEEKDAYS[dt.weekday()]
+
+
+def format_date(dt: datetime) -> str:
+    """Format a date like "Monday, March 04" (strftime "%A, %B %d")."""
+    return f"{WEEKDAYS[dt.weekday()]}, {MONTHS[dt.month - 1]} {dt.day:02d}"
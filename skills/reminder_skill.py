@@ -1,20 +1,75 @@
 """Reminder skill - manages reminders with notifications."""
 
 import asyncio
-import json
+import contextlib
+import heapq
 import re
 import uuid
+from collections.abc import Callable
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import orjson
+
 from skills.base import Skill, SkillResult
+from skills.formatting import format_date, format_time, format_weekday
+from skills.storage import DebouncedSave, write_json
+from skills.timeparse import AT_CLOCK_RE, parse_clock
 
 if TYPE_CHECKING:
     from core.context import ConversationContext
     from core.jarvis import Jarvis
 
+# Requests this skill handles, as one alternation so can_handle is a single scan
+QUERY_RE = re.compile("|".join(f"(?:{pattern})" for pattern in (
+    r"remind me (?:to |about )?",
+    r"set (?:a )?reminder",
+    r"(?:don't forget|remember) to",
+    r"(?:what are |show |list )(?:my )?reminders",
+    r"(?:cancel|delete|remove|clear) (?:the |my )?reminder",
+    r"alert me (?:to |about |when )?",
+)))
+# Every QUERY_RE match contains one of these; a plain substring check rules
+# out most unrelated utterances before the regex runs
+QUERY_WORDS = ("remind", "remember", "don't forget", "alert me")
+# Relative times -> offset from now, given the captured number (0 if none)
+DURATION_PATTERNS: tuple[tuple[re.Pattern[str], Callable[[int], timedelta]], ...] = (
+    (re.compile(r"in (\d+) minutes?"), lambda n: timedelta(minutes=n)),
+    (re.compile(r"in (\d+) hours?"), lambda n: timedelta(hours=n)),
+    (re.compile(r"in (\d+) days?"), lambda n: timedelta(days=n)),
+    (re.compile(r"in half an hour"), lambda n: timedelta(minutes=30)),
+    (re.compile(r"in an hour"), lambda n: timedelta(hours=1)),
+)
+# Words that pick the list and delete actions (substring match)
+LIST_RE = re.compile("what are|show|list")
+DELETE_RE = re.compile("cancel|delete|remove|clear")
+# Trigger and time phrases stripped from the reminder message
+MESSAGE_NOISE_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            r"remind me (?:to |about )?",
+            r"set (?:a )?reminder (?:to |for |about )?",
+            r"(?:don't forget|remember) to ",
+            r"alert me (?:to |about )?",
+            r"in \d+ (?:minutes?|hours?|days?)",
+            r"at \d{1,2}(?::\d{2})?\s*(?:am|pm)?",
+            r"tomorrow",
+            r"today",
+            r"(?:this )?(?:morning|afternoon|evening|night)",
+            r"every (?:day|week|month)",
+        )
+    )
+)
+WHITESPACE_RE = re.compile(r"\s+")
+
+# Longest and shortest wait (seconds) between background reminder checks
+MAX_CHECK_INTERVAL = 30.0
+MIN_CHECK_INTERVAL = 0.5
+# Period between occurrences of each kind of recurring reminder
+RECURRENCE_PERIODS = {"daily": timedelta(days=1), "weekly": timedelta(weeks=1)}
+
 
 @dataclass
 class Reminder:
@@ -29,11 +84,8 @@ class Reminder:
     notified: bool = False
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        data = asdict(self)
-        data["trigger_time"] = self.trigger_time.isoformat()
-        data["created_at"] = self.created_at.isoformat()
-        return data
+        """Convert to dictionary for skill result data."""
+        return asdict(self)
 
     @classmethod
     def from_dict(cls, data: dict) -> "Reminder":
@@ -55,74 +107,68 @@ class ReminderSkill(Skill):
 
     def __init__(self, jarvis: "Jarvis") -> None:
         super().__init__(jarvis)
-        self._patterns = [
-            r"remind me (?:to |about )?",
-            r"set (?:a )?reminder",
-            r"(?:don't forget|remember) to",
-            r"(?:what are |show |list )(?:my )?reminders",
-            r"(?:cancel|delete|remove|clear) (?:the |my )?reminder",
-            r"alert me (?:to |about |when )?",
-        ]
-        self._reminders: list[Reminder] = []
-        self._storage_path: Path | None = None
+        # id -> reminder, in creation order, and a min-heap of
+        # (trigger_time, id) so the background check only looks at reminders
+        # that are due. Heap entries for deleted or rescheduled reminders are
+        # skipped when popped.
+        self._reminders: dict[str, Reminder] = {}
+        self._due: list[tuple[datetime, str]] = []
+        # Jarvis creates the data directory on startup
+        self._storage_path = jarvis.settings.data_dir / "reminders.json"
         self._loaded = False
+        self._saver = DebouncedSave(self._write_reminders)
         self._check_task: asyncio.Task[Any] | None = None
+        # Set when a reminder is added so the background check re-plans its sleep
+        self._wake = asyncio.Event()
         self._running = False
 
-    def _ensure_storage(self) -> Path:
-        """Ensure storage path exists."""
-        if self._storage_path is None:
-            data_dir = self.jarvis.settings.ensure_data_dir()
-            self._storage_path = data_dir / "reminders.json"
-        return self._storage_path
-
     def _load_reminders(self) -> None:
         """Load reminders from storage."""
         if self._loaded:
             return
 
-        path = self._ensure_storage()
+        path = self._storage_path
         if path.exists():
             try:
-                data = json.loads(path.read_text())
-                self._reminders = [Reminder.from_dict(r) for r in data]
+                data = orjson.loads(path.read_bytes())
+                reminders = [Reminder.from_dict(r) for r in data]
                 # Filter out completed non-recurring reminders
-                self._reminders = [
-                    r for r in self._reminders
+                self._reminders = {
+                    r.id: r for r in reminders
                     if not r.completed or r.recurring
-                ]
+                }
             except Exception:
-                self._reminders = []
+                self._reminders = {}
+        self._due = [
+            (r.trigger_time, r.id) for r in self._reminders.values() if not r.completed
+        ]
+        heapq.heapify(self._due)
         self._loaded = True
 
     def _save_reminders(self) -> None:
-        """Save reminders to storage."""
-        path = self._ensure_storage()
-        data = [r.to_dict() for r in self._reminders]
-        path.write_text(json.dumps(data, indent=2))
+        """Save reminders to storage, coalescing changes made close together."""
+        self._saver.schedule()
+
+    def _write_reminders(self) -> None:
+        """Write reminders to storage."""
+        write_json(self._storage_path, list(self._reminders.values()))
 
     async def can_handle(self, text: str, context: "ConversationContext") -> bool:
         """Check if asking about reminders."""
         text_lower = text.lower()
-        return any(re.search(pattern, text_lower) for pattern in self._patterns)
+        for word in QUERY_WORDS:
+            if word in text_lower:
+                return QUERY_RE.search(text_lower) is not None
+        return False
 
-    def _parse_time(self, text: str) -> datetime | None:
-        """Parse time from natural language."""
+    def _parse_time(self, text_lower: str) -> datetime | None:
+        """Parse time from lowercased natural language."""
         now = datetime.now()
-        text_lower = text.lower()
 
         # Duration patterns
-        duration_patterns = [
-            (r"in (\d+) minutes?", lambda m: now + timedelta(minutes=int(m))),
-            (r"in (\d+) hours?", lambda m: now + timedelta(hours=int(m))),
-            (r"in (\d+) days?", lambda m: now + timedelta(days=int(m))),
-            (r"in half an hour", lambda m: now + timedelta(minutes=30)),
-            (r"in an hour", lambda m: now + timedelta(hours=1)),
-        ]
-
-        for pattern, time_fn in duration_patterns:
-            if match := re.search(pattern, text_lower):
-                return time_fn(int(match.group(1)) if match.lastindex else 0)
+        for pattern, offset in DURATION_PATTERNS:
+            if match := pattern.search(text_lower):
+                return now + offset(int(match.group(1)) if match.lastindex else 0)
 
         # Specific times
         if "tomorrow" in text_lower:
@@ -133,17 +179,9 @@ class ReminderSkill(Skill):
             base = now
 
         # Parse time of day
-        time_match = re.search(r"at (\d{1,2})(?::(\d{2}))?\s*(am|pm)?", text_lower)
-        if time_match:
-            hour = int(time_match.group(1))
-            minute = int(time_match.group(2) or 0)
-            ampm = time_match.group(3)
-
-            if ampm == "pm" and hour < 12:
-                hour += 12
-            elif ampm == "am" and hour == 12:
-                hour = 0
-
+        clock = parse_clock(text_lower, AT_CLOCK_RE)
+        if clock:
+            hour, minute = clock
             return base.replace(hour=hour, minute=minute, second=0, microsecond=0)
 
         # Time of day words
@@ -159,28 +197,13 @@ class ReminderSkill(Skill):
         # Default to 1 hour from now if no time specified
         return now + timedelta(hours=1)
 
-    def _extract_message(self, text: str) -> str:
-        """Extract the reminder message from text."""
+    def _extract_message(self, text_lower: str) -> str:
+        """Extract the reminder message from lowercased text."""
         # Remove trigger phrases
-        message = text.lower()
-        remove_patterns = [
-            r"remind me (?:to |about )?",
-            r"set (?:a )?reminder (?:to |for |about )?",
-            r"(?:don't forget|remember) to ",
-            r"alert me (?:to |about )?",
-            r"in \d+ (?:minutes?|hours?|days?)",
-            r"at \d{1,2}(?::\d{2})?\s*(?:am|pm)?",
-            r"tomorrow",
-            r"today",
-            r"(?:this )?(?:morning|afternoon|evening|night)",
-            r"every (?:day|week|month)",
-        ]
-
-        for pattern in remove_patterns:
-            message = re.sub(pattern, "", message)
+        message = MESSAGE_NOISE_RE.sub("", text_lower)
 
         # Clean up
-        message = re.sub(r"\s+", " ", message).strip()
+        message = WHITESPACE_RE.sub(" ", message).strip()
         return message.capitalize() if message else "Reminder"
 
     async def execute(self, text: str, context: "ConversationContext") -> SkillResult:
@@ -189,26 +212,26 @@ class ReminderSkill(Skill):
         self._load_reminders()
 
         # Check for list intent
-        if any(word in text_lower for word in ["what are", "show", "list"]):
+        if LIST_RE.search(text_lower):
             return await self._list_reminders()
 
         # Check for delete intent
-        if any(word in text_lower for word in ["cancel", "delete", "remove", "clear"]):
-            return await self._delete_reminder(text)
+        if DELETE_RE.search(text_lower):
+            return await self._delete_reminder(text_lower)
 
         # Default: create reminder
-        return await self._create_reminder(text)
+        return await self._create_reminder(text_lower)
 
-    async def _create_reminder(self, text: str) -> SkillResult:
+    async def _create_reminder(self, text_lower: str) -> SkillResult:
         """Create a new reminder."""
-        trigger_time = self._parse_time(text)
+        now = datetime.now()
+        trigger_time = self._parse_time(text_lower)
         if not trigger_time:
-            trigger_time = datetime.now() + timedelta(hours=1)
+            trigger_time = now + timedelta(hours=1)
 
-        message = self._extract_message(text)
+        message = self._extract_message(text_lower)
 
         # Check for recurring
-        text_lower = text.lower()
         recurring = ""
         if "every day" in text_lower or "daily" in text_lower:
             recurring = "daily"
@@ -219,20 +242,23 @@ class ReminderSkill(Skill):
             id=str(uuid.uuid4()),
             message=message,
             trigger_time=trigger_time,
-            created_at=datetime.now(),
+            created_at=now,
             recurring=recurring,
         )
 
-        self._reminders.append(reminder)
+        self._reminders[reminder.id] = reminder
+        heapq.heappush(self._due, (reminder.trigger_time, reminder.id))
+        self._wake.set()
         self._save_reminders()
 
         # Format response
-        if trigger_time.date() == datetime.now().date():
-            time_str = f"today at {trigger_time.strftime('%I:%M %p')}"
-        elif trigger_time.date() == (datetime.now() + timedelta(days=1)).date():
-            time_str = f"tomorrow at {trigger_time.strftime('%I:%M %p')}"
+        today = now.date()
+        if trigger_time.date() == today:
+            time_str = f"today at {format_time(trigger_time)}"
+        elif trigger_time.date() == today + timedelta(days=1):
+            time_str = f"tomorrow at {format_time(trigger_time)}"
         else:
-            time_str = trigger_time.strftime("%A, %B %d at %I:%M %p")
+            time_str = f"{format_date(trigger_time)} at {format_time(trigger_time)}"
 
         recurring_str = f" ({recurring})" if recurring else ""
 
@@ -244,7 +270,7 @@ class ReminderSkill(Skill):
 
     async def _list_reminders(self) -> SkillResult:
         """List active reminders."""
-        active = [r for r in self._reminders if not r.completed]
+        active = [r for r in self._reminders.values() if not r.completed]
 
         if not active:
             return SkillResult(
@@ -255,29 +281,29 @@ class ReminderSkill(Skill):
         # Sort by trigger time
         active.sort(key=lambda r: r.trigger_time)
 
-        response = f"You have {len(active)} reminder{'s' if len(active) != 1 else ''}: "
+        parts = [f"You have {len(active)} reminder{'s' if len(active) != 1 else ''}: "]
         for reminder in active[:5]:  # Limit to 5
-            time_str = reminder.trigger_time.strftime("%I:%M %p on %A")
+            time_str = (
+                f"{format_time(reminder.trigger_time)} on {format_weekday(reminder.trigger_time)}"
+            )
             recurring_str = f" ({reminder.recurring})" if reminder.recurring else ""
-            response += f"'{reminder.message}' at {time_str}{recurring_str}. "
+            parts.append(f"'{reminder.message}' at {time_str}{recurring_str}. ")
 
         if len(active) > 5:
-            response += f"And {len(active) - 5} more."
+            parts.append(f"And {len(active) - 5} more.")
 
         return SkillResult(
             success=True,
-            response=response.strip(),
+            response="".join(parts).strip(),
             data={"reminders": [r.to_dict() for r in active]},
         )
 
-    async def _delete_reminder(self, text: str) -> SkillResult:
+    async def _delete_reminder(self, text_lower: str) -> SkillResult:
         """Delete a reminder."""
-        text_lower = text.lower()
-
         # Try to match by message content
-        for reminder in self._reminders:
+        for reminder in self._reminders.values():
             if reminder.message.lower() in text_lower or text_lower in reminder.message.lower():
-                self._reminders.remove(reminder)
+                del self._reminders[reminder.id]
                 self._save_reminders()
                 return SkillResult(
                     success=True,
@@ -288,6 +314,7 @@ class ReminderSkill(Skill):
         if "all" in text_lower:
             count = len(self._reminders)
             self._reminders.clear()
+            self._due.clear()
             self._save_reminders()
             return SkillResult(
                 success=True,
@@ -300,49 +327,74 @@ class ReminderSkill(Skill):
         )
 
     async def check_and_trigger(self) -> list[Reminder]:
-        """Check for due reminders and return those that should trigger."""
-        self._load_reminders()
+        """Check for due reminders and return those that should trigger.
+
+        Reminders are loaded when the background check starts, so nothing
+        is loaded here; with nothing due this is a single heap peek.
+        """
         now = datetime.now()
+        if not self._due or self._due[0][0] > now:
+            return []
+
         triggered = []
 
-        for reminder in self._reminders:
+        while self._due and self._due[0][0] <= now:
+            trigger_time, reminder_id = heapq.heappop(self._due)
+            reminder = self._reminders.get(reminder_id)
+            if reminder is None or reminder.trigger_time != trigger_time:
+                continue  # Deleted or rescheduled since it was queued
             if reminder.completed or reminder.notified:
                 continue
 
-            if reminder.trigger_time <= now:
-                triggered.append(reminder)
-                reminder.notified = True
-
-                if reminder.recurring:
-                    # Schedule next occurrence
-                    if reminder.recurring == "daily":
-                        reminder.trigger_time += timedelta(days=1)
-                    elif reminder.recurring == "weekly":
-                        reminder.trigger_time += timedelta(weeks=1)
-                    reminder.notified = False
-                else:
-                    reminder.completed = True
+            triggered.append(reminder)
+            reminder.notified = True
+
+            period = RECURRENCE_PERIODS.get(reminder.recurring)
+            if period:
+                # Schedule the next occurrence after now in one step, so a
+                # series missed while offline fires once rather than once
+                # per missed period
+                missed = (now - reminder.trigger_time) // period
+                reminder.trigger_time += period * (missed + 1)
+                reminder.notified = False
+                heapq.heappush(self._due, (reminder.trigger_time, reminder.id))
+            else:
+                reminder.completed = True
 
         if triggered:
             self._save_reminders()
 
         return triggered
 
+    def _next_check_delay(self) -> float:
+        """Seconds until the earliest queued reminder, clamped to the check interval."""
+        if not self._due:
+            return MAX_CHECK_INTERVAL
+        delay = (self._due[0][0] - datetime.now()).total_seconds()
+        return min(MAX_CHECK_INTERVAL, max(MIN_CHECK_INTERVAL, delay))
+
     async def start_background_check(self, callback: Any) -> None:
         """Start background task to check reminders periodically."""
+        self._load_reminders()
         self._running = True
 
         async def check_loop() -> None:
             while self._running:
+                self._wake.clear()
                 triggered = await self.check_and_trigger()
                 for reminder in triggered:
                     await callback(reminder)
-                await asyncio.sleep(30)  # Check every 30 seconds
+
+                # Sleep until the next reminder is due (at most 30 seconds),
+                # or until a new reminder is added
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wake.wait(), self._next_check_delay())
 
         self._check_task = asyncio.create_task(check_loop())
 
     async def close(self) -> None:
-        """Stop background task."""
+        """Stop background task and write pending changes."""
+        self._saver.flush()
         self._running = False
         if self._check_task:
             self._check_task.cancel()
@@ -0,0 +1,61 @@
+"""JSON file storage helpers for skills."""
+
+import asyncio
+import atexit
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+# Seconds to wait for further changes before writing
+SAVE_DELAY = 1.0
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Write data as indented JSON, replacing the file atomically.
+
+    Dataclasses and datetimes are serialized natively by orjson. Writes to a
+    temporary file first so a crash never leaves a partial file.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, path)
+
+
+class DebouncedSave:
+    """Coalesces saves made within a short delay into a single write.
+
+    Outside a running event loop, saves happen immediately. A pending save
+    is also written at interpreter exit, so a change made just before Ctrl-C
+    isn't lost when nothing calls flush.
+    """
+
+    def __init__(self, save: Callable[[], None], delay: float = SAVE_DELAY) -> None:
+        self._save = save
+        self._delay = delay
+        self._handle: asyncio.TimerHandle | None = None
+
+    def schedule(self) -> None:
+        """Request a save."""
+        if self._handle is not None:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._save()
+            return
+        self._handle = loop.call_later(self._delay, self.flush)
+        atexit.register(self.flush)
+
+    def flush(self) -> None:
+        """Write now if a save is pending."""
+        if self._handle is None:
+            return
+
+        self._handle.cancel()
+        self._handle = None
+        atexit.unregister(self.flush)
+        self._save()
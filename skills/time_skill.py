@@ -10,6 +10,20 @@ if TYPE_CHECKING:
     from core.context import ConversationContext
     from core.jarvis import Jarvis
 
+# Questions this skill answers, as one alternation so can_handle is a single scan
+QUERY_RE = re.compile("|".join(f"(?:{pattern})" for pattern in (
+    r"what(?:'s| is) the time",
+    r"what time is it",
+    r"tell me the time",
+    r"what(?:'s| is) the date",
+    r"what(?:'s| is) today(?:'s)? date",
+    r"what day is it",
+    r"what day of the week",
+)))
+# Every QUERY_RE match contains one of these; a plain substring check rules
+# out most unrelated utterances before the regex runs
+QUERY_WORDS = ("time", "date", "day")
+
 
 class TimeSkill(Skill):
     """Provides time and date information."""
@@ -20,20 +34,14 @@ class TimeSkill(Skill):
 
     def __init__(self, jarvis: "Jarvis") -> None:
         super().__init__(jarvis)
-        self._patterns = [
-            r"what(?:'s| is) the time",
-            r"what time is it",
-            r"tell me the time",
-            r"what(?:'s| is) the date",
-            r"what(?:'s| is) today(?:'s)? date",
-            r"what day is it",
-            r"what day of the week",
-        ]
 
     async def can_handle(self, text: str, context: "ConversationContext") -> bool:
         """Check if asking about time or date."""
         text_lower = text.lower()
-        return any(re.search(pattern, text_lower) for pattern in self._patterns)
+        for word in QUERY_WORDS:
+            if word in text_lower:
+                return QUERY_RE.search(text_lower) is not None
+        return False
 
     async def execute(self, text: str, context: "ConversationContext") -> SkillResult:
         """Return current time or date."""
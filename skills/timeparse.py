@@ -0,0 +1,45 @@
+"""Time-of-day and weekday parsing shared by the calendar and reminder skills."""
+
+import re
+
+from skills.formatting import WEEKDAYS
+
+# "3", "3:30", "3pm", "3:30 pm"
+CLOCK_PATTERN = r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)?"
+CLOCK_RE = re.compile(CLOCK_PATTERN)
+# Same, but only after "at" ("at 3:30 pm")
+AT_CLOCK_RE = re.compile(f"at {CLOCK_PATTERN}")
+# Lowercase weekday name -> datetime.weekday(), Monday first
+WEEKDAY_INDEX = {day.lower(): index for index, day in enumerate(WEEKDAYS)}
+
+
+def parse_clock(text_lower: str, pattern: re.Pattern[str] = CLOCK_RE) -> tuple[int, int] | None:
+    """Find a time of day in lowercased text.
+
+    Args:
+        text_lower: Lowercased text to search.
+        pattern: CLOCK_RE, AT_CLOCK_RE, or another pattern with the same
+            hour, minute and am/pm groups.
+
+    Returns:
+        (hour, minute) on a 24-hour clock, or None if no time was found.
+    """
+    match = pattern.search(text_lower)
+    if not match:
+        return None
+
+    hour_str, minute_str, ampm = match.groups()
+    hour = int(hour_str)
+    if ampm == "pm" and hour < 12:
+        hour += 12
+    elif ampm == "am" and hour == 12:
+        hour = 0
+    return hour, int(minute_str or 0)
+
+
+def parse_weekday(text_lower: str) -> int | None:
+    """Return the index of the first weekday (Monday first) named in the text."""
+    for day, index in WEEKDAY_INDEX.items():
+        if day in text_lower:
+            return index
+    return None
@@ -1,6 +1,7 @@
 """Weather skill - provides weather information."""
 
 import re
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
 
 import httpx
@@ -11,6 +12,49 @@ if TYPE_CHECKING:
     from core.context import ConversationContext
     from core.jarvis import Jarvis
 
+# Fail fast when Open-Meteo is unreachable; the shared client's default
+# timeout is sized for LLM responses
+REQUEST_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+# Words that mark a weather question. The phrasings this skill answers
+# ("what's the weather like", "will it rain", "is it cold outside") only add
+# optional words around these, so a substring check is all can_handle needs.
+QUERY_WORDS = (
+    "weather", "temperature", "forecast", "rain", "snow", "sunny", "cloudy",
+    "cold ", "hot ", "warm ",
+)
+# Number of geocoded locations to remember
+GEOCODE_CACHE_SIZE = 64
+LOCATION_RE = re.compile(r"(?:in|at|for) ([a-zA-Z\s,]+?)(?:\?|$|\.)")
+# Spoken names for the first forecast days; later days use their date
+FORECAST_DAY_NAMES = ("Today", "Tomorrow")
+# WMO weather interpretation codes -> spoken description
+WMO_CODES = {
+    0: "clear sky",
+    1: "mainly clear",
+    2: "partly cloudy",
+    3: "overcast",
+    45: "foggy",
+    48: "depositing rime fog",
+    51: "light drizzle",
+    53: "moderate drizzle",
+    55: "dense drizzle",
+    61: "slight rain",
+    63: "moderate rain",
+    65: "heavy rain",
+    71: "slight snow",
+    73: "moderate snow",
+    75: "heavy snow",
+    77: "snow grains",
+    80: "slight rain showers",
+    81: "moderate rain showers",
+    82: "violent rain showers",
+    85: "slight snow showers",
+    86: "heavy snow showers",
+    95: "thunderstorm",
+    96: "thunderstorm with slight hail",
+    99: "thunderstorm with heavy hail",
+}
+
 
 class WeatherSkill(Skill):
     """Provides current weather and forecasts.
@@ -24,16 +68,10 @@ class WeatherSkill(Skill):
 
     def __init__(self, jarvis: "Jarvis") -> None:
         super().__init__(jarvis)
-        self._patterns = [
-            r"(?:what(?:'s| is) the )?weather(?: like)?",
-            r"(?:what(?:'s| is) the )?temperature",
-            r"(?:is it |will it )?(rain|snow|sunny|cloudy)",
-            r"(?:what(?:'s| is) the )?forecast",
-            r"how(?:'s| is) the weather",
-            r"(?:is it |how )?(cold|hot|warm) (?:outside|today)?",
-        ]
-        self._location_pattern = r"(?:in|at|for) ([a-zA-Z\s,]+?)(?:\?|$|\.)"
-        self._client = httpx.AsyncClient(timeout=10.0)
+        self._client = jarvis.http_client
+        # Lowercased location -> (latitude, longitude, display name), so
+        # repeat questions about the same place skip the geocoding request
+        self._geocode_cache: OrderedDict[str, tuple[float, float, str]] = OrderedDict()
 
         # Default location (can be configured via web UI)
         self._default_location = "New York"
@@ -42,14 +80,23 @@ class WeatherSkill(Skill):
     async def can_handle(self, text: str, context: "ConversationContext") -> bool:
         """Check if asking about weather."""
         text_lower = text.lower()
-        return any(re.search(pattern, text_lower) for pattern in self._patterns)
+        for word in QUERY_WORDS:
+            if word in text_lower:
+                return True
+        return False
 
     async def _geocode(self, location: str) -> tuple[float, float, str] | None:
         """Convert location name to coordinates."""
+        key = location.lower()
+        if cached := self._geocode_cache.get(key):
+            self._geocode_cache.move_to_end(key)
+            return cached
+
         try:
             response = await self._client.get(
                 "https://geocoding-api.open-meteo.com/v1/search",
                 params={"name": location, "count": 1},
+                timeout=REQUEST_TIMEOUT,
             )
             response.raise_for_status()
             data = response.json()
@@ -59,7 +106,11 @@ class WeatherSkill(Skill):
                 name = result.get("name", location)
                 country = result.get("country", "")
                 full_name = f"{name}, {country}" if country else name
-                return (result["latitude"], result["longitude"], full_name)
+                geo = (result["latitude"], result["longitude"], full_name)
+                self._geocode_cache[key] = geo
+                if len(self._geocode_cache) > GEOCODE_CACHE_SIZE:
+                    self._geocode_cache.popitem(last=False)
+                return geo
         except Exception:
             pass
         return None
@@ -81,6 +132,7 @@ class WeatherSkill(Skill):
                     "timezone": "auto",
                     "forecast_days": 3,
                 },
+                timeout=REQUEST_TIMEOUT,
             )
             response.raise_for_status()
             return response.json()
@@ -89,39 +141,15 @@ class WeatherSkill(Skill):
 
     def _weather_code_to_description(self, code: int) -> str:
         """Convert WMO weather code to description."""
-        codes = {
-            0: "clear sky",
-            1: "mainly clear",
-            2: "partly cloudy",
-            3: "overcast",
-            45: "foggy",
-            48: "depositing rime fog",
-            51: "light drizzle",
-            53: "moderate drizzle",
-            55: "dense drizzle",
-            61: "slight rain",
-            63: "moderate rain",
-            65: "heavy rain",
-            71: "slight snow",
-            73: "moderate snow",
-            75: "heavy snow",
-            77: "snow grains",
-            80: "slight rain showers",
-            81: "moderate rain showers",
-            82: "violent rain showers",
-            85: "slight snow showers",
-            86: "heavy snow showers",
-            95: "thunderstorm",
-            96: "thunderstorm with slight hail",
-            99: "thunderstorm with heavy hail",
-        }
-        return codes.get(code, "unknown conditions")
+        return WMO_CODES.get(code, "unknown conditions")
 
     async def execute(self, text: str, context: "ConversationContext") -> SkillResult:
         """Get weather information."""
+        text_lower = text.lower()
+
         # Extract location from text
         location = self._default_location
-        if match := re.search(self._location_pattern, text.lower()):
+        if match := LOCATION_RE.search(text_lower):
             location = match.group(1).strip()
 
         # Geocode the location
@@ -152,32 +180,29 @@ class WeatherSkill(Skill):
         weather_code = current.get("weather_code", 0)
         conditions = self._weather_code_to_description(weather_code)
 
-        response = f"In {location_name}, it's currently {temp}°F with {conditions}. "
-        response += f"Humidity is {humidity}% and wind speed is {wind} mph."
+        parts = [
+            f"In {location_name}, it's currently {temp}°F with {conditions}. "
+            f"Humidity is {humidity}% and wind speed is {wind} mph."
+        ]
 
         # Add forecast if asked
-        text_lower = text.lower()
         if "forecast" in text_lower or "tomorrow" in text_lower or "week" in text_lower:
             if daily.get("time"):
-                response += " Here's the forecast: "
+                parts.append(" Here's the forecast: ")
                 for i, date in enumerate(daily["time"][:3]):
                     high = daily["temperature_2m_max"][i]
                     low = daily["temperature_2m_min"][i]
                     rain_chance = daily["precipitation_probability_max"][i]
                     day_conditions = self._weather_code_to_description(daily["weather_code"][i])
 
-                    day_name = "Today" if i == 0 else ("Tomorrow" if i == 1 else date)
-                    response += f"{day_name}: {day_conditions}, high of {high}°F, low of {low}°F"
-                    if rain_chance > 20:
-                        response += f", {rain_chance}% chance of rain"
-                    response += ". "
+                    day_name = FORECAST_DAY_NAMES[i] if i < len(FORECAST_DAY_NAMES) else date
+                    rain = f", {rain_chance}% chance of rain" if rain_chance > 20 else ""
+                    parts.append(
+                        f"{day_name}: {day_conditions}, high of {high}°F, low of {low}°F{rain}. "
+                    )
 
         return SkillResult(
             success=True,
-            response=response.strip(),
+            response="".join(parts).strip(),
             data={"weather": weather, "location": location_name},
         )
-
-    async def close(self) -> None:
-        """Cleanup."""
-        await self._client.aclose()
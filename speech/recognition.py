@@ -2,12 +2,21 @@
 
 import asyncio
 from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import numpy as np
 import sounddevice as sd
 
 from core.config import WhisperSettings
+from utils.audio import is_speech
+
+# Longest stretch of streamed audio sent to Whisper in one call (seconds)
+STREAM_WINDOW_SECONDS = 10.0
+
+# Audio carried across a forced cut at STREAM_WINDOW_SECONDS (seconds), so a
+# word spanning the cut is heard whole by the next window
+STREAM_OVERLAP_SECONDS = 2.0
 
 
 class SpeechRecognizer:
@@ -19,6 +28,9 @@ class SpeechRecognizer:
     def __init__(self, settings: WhisperSettings) -> None:
         self.settings = settings
         self._model: Any = None
+        # Inference runs on its own thread rather than the default pool, so
+        # the model's internal threads aren't competing with other work
+        self._executor: ThreadPoolExecutor | None = None
         self._sample_rate = 16000  # Whisper expects 16kHz
         self._chunk_duration = 2.0  # seconds per chunk
 
@@ -46,22 +58,34 @@ class SpeechRecognizer:
             )
         return self._model
 
-    async def transcribe(self, audio_data: bytes | np.ndarray) -> str:
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the Whisper inference thread, starting it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper")
+        return self._executor
+
+    async def preload(self) -> None:
+        """Load the Whisper model now rather than on first use."""
+        await asyncio.to_thread(self._load_model)
+
+    async def transcribe(self, audio_data: bytes | np.ndarray, skip_seconds: float = 0.0) -> str:
         """Transcribe audio data to text.
 
         Args:
             audio_data: Raw audio bytes or numpy array (16kHz, mono, float32)
+            skip_seconds: Drop words ending within this many seconds of the
+                start, such as audio already transcribed before a cut
 
         Returns:
             Transcribed text
         """
         model = self._load_model()
 
-        # Convert bytes to numpy if needed
+        # Convert bytes to numpy if needed; float32 arrays are used as-is
         if isinstance(audio_data, bytes):
             audio_array = np.frombuffer(audio_data, dtype=np.float32)
         else:
-            audio_array = audio_data.astype(np.float32)
+            audio_array = np.asarray(audio_data, dtype=np.float32)
 
         # Run transcription in thread pool to avoid blocking
         loop = asyncio.get_running_loop()
@@ -72,19 +96,36 @@ class SpeechRecognizer:
                 language=self.settings.language,
                 beam_size=5,
                 vad_filter=True,
+                word_timestamps=skip_seconds > 0,
             )
-            return " ".join(segment.text for segment in segments).strip()
-
-        result = await loop.run_in_executor(None, _transcribe)
+            if skip_seconds <= 0:
+                return " ".join(segment.text for segment in segments).strip()
+            # Words carry their own leading space
+            return "".join(
+                word.word
+                for segment in segments
+                for word in segment.words or ()
+                if word.end > skip_seconds
+            ).strip()
+
+        result = await loop.run_in_executor(self._get_executor(), _transcribe)
         return result
 
-    async def stream_audio(self) -> AsyncIterator[bytes]:
+    async def stream_audio(self, skip_silence: bool = False) -> AsyncIterator[np.ndarray]:
         """Stream audio from microphone.
 
-        Yields audio chunks suitable for transcription.
+        Args:
+            skip_silence: Drop silent chunks in the audio callback, keeping
+                only the first one after speech to mark where it ended and
+                the last one before speech as lookback, so a quiet room
+                never wakes the event loop.
+
+        Yields mono float32 chunks suitable for transcription.
         """
         chunk_samples = int(self._sample_rate * self._chunk_duration)
-        audio_queue: asyncio.Queue[bytes] = asyncio.Queue()
+        audio_queue: asyncio.Queue[np.ndarray] = asyncio.Queue()
+        in_speech = False
+        lookback: np.ndarray | None = None
 
         # Capture the event loop in the main thread
         loop = asyncio.get_running_loop()
@@ -93,12 +134,22 @@ class SpeechRecognizer:
             indata: np.ndarray, frames: int, time_info: Any, status: Any
         ) -> None:
             """Callback for sounddevice stream."""
+            nonlocal in_speech, lookback
             if status:
                 print(f"Audio status: {status}")
-            # Put audio data in queue using the captured loop
-            loop.call_soon_threadsafe(
-                audio_queue.put_nowait, indata.copy().astype(np.float32).tobytes()
-            )
+            if skip_silence:
+                was_speech = in_speech
+                in_speech = is_speech(indata[:, 0])
+                if not in_speech and not was_speech:
+                    # sounddevice reuses indata, so the lookback is a copy
+                    lookback = indata[:, 0].copy()
+                    return
+                if in_speech and lookback is not None:
+                    loop.call_soon_threadsafe(audio_queue.put_nowait, lookback)
+                    lookback = None
+            # Put audio data in queue using the captured loop. The stream is
+            # already float32; copy the channel because sounddevice reuses indata.
+            loop.call_soon_threadsafe(audio_queue.put_nowait, indata[:, 0].copy())
 
         # Start audio stream
         with sd.InputStream(
@@ -115,13 +166,57 @@ class SpeechRecognizer:
     async def transcribe_stream(self) -> AsyncIterator[str]:
         """Continuously transcribe from microphone.
 
+        Chunks are gathered into an utterance that is transcribed when a
+        silent chunk ends it or it reaches STREAM_WINDOW_SECONDS, so Whisper
+        sees whole phrases and is never called on silence alone. The silent
+        chunk before an utterance is prepended as pre-roll, and
+        STREAM_OVERLAP_SECONDS of audio is carried across a forced cut as
+        context, dropping the words in it that were already yielded.
+
         Yields transcribed text segments.
         """
-        async for chunk in self.stream_audio():
-            text = await self.transcribe(chunk)
+        max_chunks = max(1, int(STREAM_WINDOW_SECONDS / self._chunk_duration))
+        overlap_chunks = min(
+            max_chunks - 1, round(STREAM_OVERLAP_SECONDS / self._chunk_duration)
+        )
+        utterance: list[np.ndarray] = []
+        preroll: np.ndarray | None = None
+        carried = 0
+
+        async for chunk in self.stream_audio(skip_silence=True):
+            speech = is_speech(chunk)
+            if not utterance:
+                if not speech:
+                    # Hold the latest silent chunk as pre-roll so a quiet
+                    # onset below the speech threshold isn't clipped
+                    preroll = chunk
+                    continue
+                if preroll is not None:
+                    utterance.append(preroll)
+                    preroll = None
+
+            # A trailing silent chunk is kept so the last word isn't clipped
+            utterance.append(chunk)
+            if speech and len(utterance) < max_chunks:
+                continue
+
+            if not speech and len(utterance) <= carried + 1:
+                # Only the overlap already transcribed before the cut
+                utterance, carried = [], 0
+                continue
+
+            audio = np.concatenate(utterance)
+            # Words in the carried overlap were yielded with the last window
+            skip_seconds = carried * self._chunk_duration
+            utterance = utterance[-overlap_chunks:] if speech and overlap_chunks else []
+            carried = len(utterance)
+            text = await self.transcribe(audio, skip_seconds)
             if text:
                 yield text
 
     async def close(self) -> None:
         """Cleanup resources."""
         self._model = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -2,8 +2,11 @@
 
 import asyncio
 import io
+import platform
 import subprocess
 import tempfile
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +15,11 @@ import sounddevice as sd
 
 from core.config import TTSSettings
 
+# Sample rate of medium-quality Piper voices and the system TTS fallback
+DEFAULT_SAMPLE_RATE = 22050
+# Operating system, which decides the system TTS command
+SYSTEM = platform.system()
+
 
 class TextToSpeech:
     """Handles text-to-speech using Piper.
@@ -23,21 +31,44 @@ class TextToSpeech:
     def __init__(self, settings: TTSSettings) -> None:
         self.settings = settings
         self._piper_available: bool | None = None
-        self._sample_rate = 22050
+        self._voice: Any = None
+        self._sample_rate = DEFAULT_SAMPLE_RATE
+        # The voice is loaded and run on one thread, which also serializes
+        # concurrent synthesis calls
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the Piper inference thread, starting it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="piper")
+        return self._executor
+
+    def _load_voice(self) -> Any:
+        """Load the Piper voice once and keep it for the session.
 
-    def _check_piper(self) -> bool:
-        """Check if Piper is available."""
+        Returns:
+            The loaded PiperVoice, or None if Piper or the voice model is
+            unavailable
+        """
         if self._piper_available is None:
             try:
-                result = subprocess.run(
-                    ["piper", "--version"],
-                    capture_output=True,
-                    timeout=5,
-                )
-                self._piper_available = result.returncode == 0
-            except (FileNotFoundError, subprocess.TimeoutExpired):
+                from piper import PiperVoice
+
+                model_path = Path(self.settings.voice)
+                if not model_path.exists():
+                    # Same lookup as the piper CLI: <voice>.onnx in the working directory
+                    model_path = Path(f"{self.settings.voice}.onnx")
+                self._voice = PiperVoice.load(model_path)
+                self._sample_rate = self._voice.config.sample_rate
+                self._piper_available = True
+            except Exception:
                 self._piper_available = False
-        return self._piper_available
+        return self._voice
+
+    async def preload(self) -> None:
+        """Load the Piper voice now rather than on first use."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._get_executor(), self._load_voice)
 
     async def synthesize(self, text: str) -> bytes:
         """Convert text to audio bytes.
@@ -46,59 +77,38 @@ class TextToSpeech:
             text: Text to synthesize
 
         Returns:
-            Raw audio bytes (22050Hz, mono, int16)
+            Raw audio bytes (mono, int16, at the voice's sample rate)
         """
-        if self._check_piper():
-            return await self._synthesize_piper(text)
+        if self._piper_available is not False:
+            audio = await self._synthesize_piper(text)
+            if audio is not None:
+                return audio
         return await self._synthesize_system(text)
 
-    async def _synthesize_piper(self, text: str) -> bytes:
-        """Synthesize using Piper TTS."""
+    async def _synthesize_piper(self, text: str) -> bytes | None:
+        """Synthesize using the loaded Piper voice, or None if unavailable."""
         loop = asyncio.get_running_loop()
 
-        def run_piper() -> bytes:
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                output_path = f.name
-
-            try:
-                subprocess.run(
-                    [
-                        "piper",
-                        "--model",
-                        self.settings.voice,
-                        "--output_file",
-                        output_path,
-                    ],
-                    input=text.encode(),
-                    capture_output=True,
-                    check=True,
-                )
-
-                # Read the wav file
-                import wave
+        def run_piper() -> bytes | None:
+            voice = self._load_voice()
+            if voice is None:
+                return None
+            if hasattr(voice, "synthesize_stream_raw"):  # piper-tts < 1.3
+                return b"".join(voice.synthesize_stream_raw(text))
+            return b"".join(chunk.audio_int16_bytes for chunk in voice.synthesize(text))
 
-                with wave.open(output_path, "rb") as wf:
-                    return wf.readframes(wf.getnframes())
-            finally:
-                Path(output_path).unlink(missing_ok=True)
-
-        return await loop.run_in_executor(None, run_piper)
+        return await loop.run_in_executor(self._get_executor(), run_piper)
 
     async def _synthesize_system(self, text: str) -> bytes:
         """Fallback to system TTS (macOS say, espeak, etc.)."""
         loop = asyncio.get_running_loop()
 
         def run_system_tts() -> bytes:
-            import platform
-            import wave
-
             with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
                 output_path = f.name
 
             try:
-                system = platform.system()
-
-                if system == "Darwin":  # macOS
+                if SYSTEM == "Darwin":  # macOS
                     # Convert to AIFF first, then to WAV
                     aiff_path = output_path.replace(".wav", ".aiff")
                     subprocess.run(
@@ -112,14 +122,14 @@ class TextToSpeech:
                         capture_output=True,
                     )
                     Path(aiff_path).unlink(missing_ok=True)
-                elif system == "Linux":
+                elif SYSTEM == "Linux":
                     subprocess.run(
                         ["espeak", "-w", output_path, text],
                         check=True,
                         capture_output=True,
                     )
                 else:
-                    raise RuntimeError(f"No TTS available for {system}")
+                    raise RuntimeError(f"No TTS available for {SYSTEM}")
 
                 with wave.open(output_path, "rb") as wf:
                     return wf.readframes(wf.getnframes())
@@ -132,8 +142,8 @@ class TextToSpeech:
         """Synthesize and play text through speakers."""
         audio_data = await self.synthesize(text)
 
-        # Convert to numpy array and play
-        audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+        # sounddevice plays int16 natively, so hand it the samples unconverted
+        audio_array = np.frombuffer(audio_data, dtype=np.int16)
 
         # Play audio
         loop = asyncio.get_running_loop()
@@ -144,4 +154,8 @@ class TextToSpeech:
 
     async def close(self) -> None:
         """Cleanup resources."""
-        pass
+        self._voice = None
+        self._piper_available = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
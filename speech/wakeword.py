@@ -2,6 +2,7 @@
 
 import asyncio
 from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
@@ -10,6 +11,11 @@ import sounddevice as sd
 
 from core.config import Settings
 
+# Chunks captured after a detection for transcription (~1.6 seconds)
+POST_DETECTION_CHUNKS = 20
+# Scales int16 samples to float32 in [-1, 1)
+INT16_SCALE = np.float32(1 / 32768)
+
 
 @dataclass
 class WakeWordDetection:
@@ -31,6 +37,12 @@ class WakeWordDetector:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
         self._model: Any = None
+        # Prediction names that refer to the configured wake word, found
+        # from the model's first prediction
+        self._wake_word_keys: frozenset[str] | None = None
+        # Inference runs on its own thread rather than the default pool, so
+        # the model's internal threads aren't competing with other work
+        self._executor: ThreadPoolExecutor | None = None
         self._sample_rate = 16000
         self._chunk_size = 1280  # 80ms at 16kHz - required by OpenWakeWord
         self._threshold = 0.5
@@ -49,11 +61,22 @@ class WakeWordDetector:
             )
         return self._model
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the OpenWakeWord inference thread, starting it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wakeword")
+        return self._executor
+
+    async def preload(self) -> None:
+        """Load the OpenWakeWord model now rather than on first use."""
+        await asyncio.to_thread(self._load_model)
+
     async def detect_once(self, audio: np.ndarray) -> WakeWordDetection:
         """Check if wake word is present in audio chunk.
 
         Args:
-            audio: Audio data as float32 numpy array (16kHz, mono)
+            audio: Audio data as int16 (as captured by listen) or float32
+                numpy array (16kHz, mono)
 
         Returns:
             WakeWordDetection with results
@@ -64,22 +87,32 @@ class WakeWordDetector:
 
         def run_detection() -> dict[str, float]:
             # OpenWakeWord expects int16 audio
-            audio_int16 = (audio * 32767).astype(np.int16)
+            if audio.dtype == np.int16:
+                audio_int16 = audio
+            else:
+                audio_int16 = (audio * 32767).astype(np.int16)
             prediction = model.predict(audio_int16)
             return prediction
 
-        predictions = await loop.run_in_executor(None, run_detection)
+        predictions = await loop.run_in_executor(self._get_executor(), run_detection)
+
+        # Prediction names are the same on every chunk, so they are matched
+        # against the wake word once
+        wake_word_keys = self._wake_word_keys
+        if wake_word_keys is None:
+            wake_word = self.settings.wake_word
+            wake_word_keys = self._wake_word_keys = frozenset(
+                word for word in predictions if self._matches_wake_word(word, wake_word)
+            )
 
         # Check for any wake word above threshold
         # Also check for variations of our configured wake word
-        wake_word = self.settings.wake_word.lower()
         best_match = ""
         best_score = 0.0
 
         for word, score in predictions.items():
             # Check if this matches our wake word (fuzzy match)
-            word_lower = word.lower().replace("_", " ")
-            if wake_word in word_lower or word_lower in wake_word:
+            if word in wake_word_keys:
                 if score > best_score:
                     best_score = score
                     best_match = word
@@ -94,16 +127,24 @@ class WakeWordDetector:
             wake_word=best_match,
         )
 
+    @staticmethod
+    def _matches_wake_word(word: str, wake_word: str) -> bool:
+        """Check if a model's prediction name refers to the wake word."""
+        word_lower = word.lower().replace("_", " ")
+        wake_word = wake_word.lower()
+        return wake_word in word_lower or word_lower in wake_word
+
     async def listen(self) -> AsyncIterator[WakeWordDetection]:
         """Continuously listen for wake word.
 
         Yields WakeWordDetection when wake word is detected.
         Buffers audio after detection for immediate transcription.
+
+        Audio is captured as int16, the format OpenWakeWord takes, and only
+        the post-detection audio is converted to float32 for Whisper.
         """
         self._running = True
         audio_queue: asyncio.Queue[np.ndarray] = asyncio.Queue()
-        post_detection_buffer: list[np.ndarray] = []
-        detection_cooldown = 0
 
         # Capture event loop in main thread
         loop = asyncio.get_running_loop()
@@ -113,48 +154,37 @@ class WakeWordDetector:
         ) -> None:
             if status:
                 print(f"Audio status: {status}")
-            loop.call_soon_threadsafe(
-                audio_queue.put_nowait,
-                indata.copy().astype(np.float32).flatten(),
-            )
+            # Copy the channel because sounddevice reuses indata
+            loop.call_soon_threadsafe(audio_queue.put_nowait, indata[:, 0].copy())
 
         with sd.InputStream(
             samplerate=self._sample_rate,
             channels=1,
-            dtype=np.float32,
+            dtype=np.int16,
             blocksize=self._chunk_size,
             callback=audio_callback,
         ):
             while self._running:
                 chunk = await audio_queue.get()
 
-                # Cooldown after detection to prevent rapid re-triggers
-                if detection_cooldown > 0:
-                    post_detection_buffer.append(chunk)
-                    detection_cooldown -= 1
-                    if detection_cooldown == 0:
-                        # Yield with buffered audio
-                        pass
-                    continue
-
                 detection = await self.detect_once(chunk)
 
                 if detection.detected:
-                    # Start collecting post-detection audio
-                    detection_cooldown = 20  # ~1.6 seconds of audio
-                    post_detection_buffer = [chunk]
+                    # Collect post-detection audio straight into one float32
+                    # buffer in [-1, 1) for Whisper, one row per chunk
+                    audio_after = np.empty(
+                        (POST_DETECTION_CHUNKS + 1, self._chunk_size), dtype=np.float32
+                    )
+                    np.multiply(chunk, INT16_SCALE, out=audio_after[0])
+                    filled = 1
 
                     # Wait for buffer to fill
-                    for _ in range(detection_cooldown):
-                        if not self._running:
-                            break
+                    while filled <= POST_DETECTION_CHUNKS and self._running:
                         post_chunk = await audio_queue.get()
-                        post_detection_buffer.append(post_chunk)
+                        np.multiply(post_chunk, INT16_SCALE, out=audio_after[filled])
+                        filled += 1
 
-                    # Combine buffered audio
-                    detection.audio_after = np.concatenate(post_detection_buffer)
-                    post_detection_buffer = []
-                    detection_cooldown = 0
+                    detection.audio_after = audio_after[:filled].reshape(-1)
 
                     yield detection
 
@@ -171,3 +201,7 @@ class WakeWordDetector:
         """Cleanup resources."""
         self.stop()
         self._model = None
+        self._wake_word_keys = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -0,0 +1,44 @@
+"""Tests for response caching."""
+
+from core.cache import ResponseCache, normalize_utterance
+
+
+def test_normalize_utterance() -> None:
+    assert normalize_utterance("  What time  is it? ") == "what time is it"
+
+
+def test_response_cache_hit_and_eviction() -> None:
+    cache = ResponseCache(max_size=2)
+    cache.put("What time is it?", "Noon.")
+    cache.put("Tell me a joke", "No.")
+
+    assert cache.get("what time is it") == "Noon."
+
+    cache.put("How are you", "Fine.")
+    assert cache.get("Tell me a joke") is None
+    assert cache.get("What time is it?") == "Noon."
+
+
+def test_response_cache_disabled() -> None:
+    cache = ResponseCache(ttl=0)
+    cache.put("Hello", "Hi")
+
+    assert not cache.enabled
+    assert cache.get("Hello") is None
+
+
+def test_response_cache_keyed_on_history() -> None:
+    cache = ResponseCache()
+    first = [
+        {"role": "user", "content": "Is it raining?"},
+        {"role": "assistant", "content": "No."},
+    ]
+    second = [
+        {"role": "user", "content": "Do I have meetings?"},
+        {"role": "assistant", "content": "Two."},
+    ]
+    cache.put("Why?", "Clear skies.", first)
+
+    assert cache.get("why", first) == "Clear skies."
+    assert cache.get("Why?", second) is None
+    assert cache.get("Why?") is None
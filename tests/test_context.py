@@ -57,3 +57,31 @@ def test_last_messages() -> None:
     assert ctx.last_user_message.content == "Second"
     assert ctx.last_assistant_message is not None
     assert ctx.last_assistant_message.content == "Response 1"
+
+
+def test_last_messages_after_eviction() -> None:
+    ctx = ConversationContext(max_messages=2)
+    ctx.add_assistant_message("Welcome")
+    ctx.add_user_message("First")
+    ctx.add_user_message("Second")
+
+    assert ctx.last_assistant_message is None
+    assert ctx.last_user_message is not None
+    assert ctx.last_user_message.content == "Second"
+
+    ctx.clear()
+    assert ctx.last_user_message is None
+
+
+def test_messages_for_llm_reused_until_changed() -> None:
+    ctx = ConversationContext()
+    ctx.add_user_message("Hello")
+
+    first = ctx.get_messages_for_llm()
+    assert ctx.get_messages_for_llm() is first
+
+    ctx.add_assistant_message("Hi there!")
+    second = ctx.get_messages_for_llm()
+    assert second is not first
+    assert first == [{"role": "user", "content": "Hello"}]
+    assert len(second) == 2
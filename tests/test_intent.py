@@ -1,5 +1,9 @@
 """Tests for intent parsing."""
 
+import dataclasses
+
+import pytest
+
 from brain.intent import IntentParser, IntentType
 
 
@@ -22,6 +26,25 @@ def test_home_control_turn_off() -> None:
     assert intent.parameters["state"] == "off"
 
 
+def test_home_control_parameters_lowercased() -> None:
+    parser = IntentParser()
+    intent = parser.parse("TURN OFF the Kitchen Light")
+
+    assert intent.type == IntentType.HOME_CONTROL
+    assert intent.parameters["state"] == "off"
+    assert intent.parameters["device"] == "kitchen light"
+    assert intent.raw_text == "TURN OFF the Kitchen Light"
+
+
+def test_home_control_pattern_priority() -> None:
+    parser = IntentParser()
+    # Earlier patterns win even when a later one matches further left
+    intent = parser.parse("Dim the hall light and turn on the fan")
+
+    assert intent.action == "power"
+    assert intent.parameters["device"] == "fan"
+
+
 def test_home_control_set_level() -> None:
     parser = IntentParser()
     intent = parser.parse("Set the bedroom light to 50%")
@@ -71,4 +94,41 @@ def test_is_question() -> None:
     assert parser.is_question("What is the capital of France?")
     assert parser.is_question("How does this work")
     assert parser.is_question("Is it raining?")
+    assert parser.is_question("  does this work")
+    assert parser.is_question("Turn on the lights?  ")
     assert not parser.is_question("Turn on the lights")
+
+
+def test_parse_cache_returns_fresh_intents() -> None:
+    parser = IntentParser()
+    parser.clear_cache()
+
+    first = parser.parse("Turn on the porch light")
+    first.parameters["device"] = "changed"
+    second = parser.parse("  Turn on the porch light ")
+
+    assert second.parameters["device"] == "porch light"
+    assert second.raw_text == "  Turn on the porch light "
+
+
+def test_intent_is_immutable() -> None:
+    parser = IntentParser()
+    intent = parser.parse("Turn off the porch light")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        intent.action = "power"  # type: ignore[misc]
+
+    assert intent.params == (("state", "off"), ("device", "porch light"))
+    assert hash(intent) == hash(parser.parse("Turn off the porch light"))
+
+
+def test_trigger_prefilter_covers_patterns() -> None:
+    parser = IntentParser()
+    categories = (parser.HOME_PATTERNS, parser.SYSTEM_PATTERNS, parser.VISION_PATTERNS)
+
+    for patterns in categories:
+        for pattern, _, _ in patterns:
+            assert parser.TRIGGER_RE.search(pattern), pattern
+
+    intent = parser.parse("Tell me a story about dragons")
+    assert intent.type == IntentType.CONVERSATION
@@ -0,0 +1,58 @@
+"""Tests for streaming speech recognition."""
+
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+import pytest
+
+from core.config import WhisperSettings
+
+try:
+    from speech.recognition import SpeechRecognizer
+except OSError:  # sounddevice raises this when PortAudio is missing
+    pytest.skip("PortAudio is not installed", allow_module_level=True)
+
+SAMPLE_RATE = 16000
+CHUNK_SECONDS = 2.0
+
+
+class FakeWhisperModel:
+    """Hears one word per chunk, named by the chunk's sample value."""
+
+    def transcribe(self, audio: np.ndarray, **kwargs: Any) -> tuple[list[Any], None]:
+        chunk_samples = int(SAMPLE_RATE * CHUNK_SECONDS)
+        words = []
+        for i in range(0, audio.size, chunk_samples):
+            level = round(float(audio[i]) * 1000)
+            if level:
+                start = i / SAMPLE_RATE
+                words.append(SimpleNamespace(
+                    word=f" w{level}", start=start, end=start + CHUNK_SECONDS - 0.1
+                ))
+        text = "".join(word.word for word in words)
+        words_out = words if kwargs.get("word_timestamps") else None
+        return [SimpleNamespace(text=text, words=words_out)], None
+
+
+async def test_transcribe_stream_does_not_repeat_overlap() -> None:
+    recognizer = SpeechRecognizer(WhisperSettings())
+    recognizer._model = FakeWhisperModel()
+    chunk_samples = int(SAMPLE_RATE * CHUNK_SECONDS)
+
+    async def fake_stream(skip_silence: bool = False) -> AsyncIterator[np.ndarray]:
+        # 14 s of continuous speech, then the silent chunk that ends it
+        for level in range(1, 8):
+            yield np.full(chunk_samples, level / 1000 + 0.1, dtype=np.float32)
+        yield np.zeros(chunk_samples, dtype=np.float32)
+
+    recognizer.stream_audio = fake_stream  # type: ignore[method-assign]
+    try:
+        texts = [text async for text in recognizer.transcribe_stream()]
+    finally:
+        await recognizer.close()
+
+    words = " ".join(texts).split()
+    assert len(texts) == 2
+    assert words == [f"w{level}" for level in range(101, 108)]
@@ -1,5 +1,5 @@
 """Shared utilities."""
 
-from utils.audio import AudioBuffer
+from utils.audio import AudioBuffer, is_speech
 
-__all__ = ["AudioBuffer"]
+__all__ = ["AudioBuffer", "is_speech"]
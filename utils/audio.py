@@ -2,6 +2,19 @@
 
 import numpy as np
 
+# RMS level below which audio is treated as silence
+SILENCE_THRESHOLD = 0.01
+
+
+def is_speech(audio: np.ndarray, threshold: float = SILENCE_THRESHOLD) -> bool:
+    """Detect if audio contains speech based on energy.
+
+    Compares the sum of squares against the squared RMS threshold, which
+    is one dot product instead of a squared temporary, a mean and a sqrt.
+    """
+    samples = audio.ravel()
+    return float(np.dot(samples, samples)) > threshold**2 * samples.size
+
 
 class AudioBuffer:
     """Ring buffer for audio data with voice activity detection."""
@@ -10,39 +23,46 @@ class AudioBuffer:
         self,
         sample_rate: int = 16000,
         buffer_seconds: float = 30.0,
-        silence_threshold: float = 0.01,
+        silence_threshold: float = SILENCE_THRESHOLD,
     ) -> None:
         self.sample_rate = sample_rate
         self.buffer_size = int(sample_rate * buffer_seconds)
         self.silence_threshold = silence_threshold
-        self._buffer = np.zeros(self.buffer_size, dtype=np.float32)
+        # Every sample is stored twice, at i and i + buffer_size, so any
+        # window of up to buffer_size samples is one contiguous slice
+        self._buffer = np.zeros(self.buffer_size * 2, dtype=np.float32)
         self._write_pos = 0
         self._speech_start: int | None = None
 
     def write(self, audio: np.ndarray) -> None:
         """Write audio data to buffer."""
-        audio = audio.flatten()
+        audio = audio.ravel()
         n = len(audio)
+        size = self.buffer_size
 
-        if n >= self.buffer_size:
+        if n >= size:
             # Audio larger than buffer, keep last buffer_size samples
-            self._buffer[:] = audio[-self.buffer_size :]
+            self._buffer[:size] = audio[-size:]
+            self._buffer[size:] = audio[-size:]
             self._write_pos = 0
-        elif self._write_pos + n <= self.buffer_size:
+            return
+
+        start = self._write_pos
+        end = start + n
+        self._buffer[start:end] = audio
+        if end <= size:
             # Fits without wrap
-            self._buffer[self._write_pos : self._write_pos + n] = audio
-            self._write_pos += n
+            self._buffer[start + size : end + size] = audio
         else:
-            # Wrap around
-            first_part = self.buffer_size - self._write_pos
-            self._buffer[self._write_pos :] = audio[:first_part]
-            self._buffer[: n - first_part] = audio[first_part:]
-            self._write_pos = n - first_part
+            # Wrap around: the tail landed in the mirror half, copy it to the front
+            first_part = size - start
+            self._buffer[start + size :] = audio[:first_part]
+            self._buffer[: end - size] = audio[first_part:]
+        self._write_pos = end % size
 
     def is_speech(self, audio: np.ndarray) -> bool:
         """Detect if audio contains speech based on energy."""
-        energy = np.sqrt(np.mean(audio**2))
-        return energy > self.silence_threshold
+        return is_speech(audio, self.silence_threshold)
 
     def get_speech_segment(self, min_duration: float = 0.5) -> np.ndarray | None:
         """Get the current speech segment if one is complete.
@@ -54,19 +74,12 @@ class AudioBuffer:
         if self._speech_start is not None:
             segment_len = (self._write_pos - self._speech_start) % self.buffer_size
             if segment_len >= min_samples:
+                # Windows ending at the write position, read from the mirror half
+                end = self._write_pos + self.buffer_size
                 # Check if recent audio is silence (speech ended)
-                recent = self._buffer[max(0, self._write_pos - 1600) : self._write_pos]
+                recent = self._buffer[end - min(1600, self.buffer_size) : end]
                 if not self.is_speech(recent):
-                    # Extract segment
-                    if self._speech_start < self._write_pos:
-                        segment = self._buffer[self._speech_start : self._write_pos].copy()
-                    else:
-                        segment = np.concatenate(
-                            [
-                                self._buffer[self._speech_start :],
-                                self._buffer[: self._write_pos],
-                            ]
-                        )
+                    segment = self._buffer[end - segment_len : end].copy()
                     self._speech_start = None
                     return segment
 
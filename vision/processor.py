@@ -1,8 +1,14 @@
 """Computer vision processing using OpenCV and YOLO."""
 
 import asyncio
-from collections.abc import AsyncIterator
+import re
+import sys
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 import cv2
@@ -10,8 +16,28 @@ import numpy as np
 
 from core.config import VisionSettings
 
-
-@dataclass
+# Largest YOLO downsampling stride; tensor inputs must be a multiple of it
+MODEL_STRIDE = 32
+# Hash bits (of 64) that must differ for a streamed frame to be re-analyzed
+CHANGED_FRAME_BITS = 5
+# Whether this OpenCV build can open GStreamer pipelines (pip wheels can't)
+GSTREAMER_AVAILABLE = bool(re.search(r"GStreamer:\s*YES", cv2.getBuildInformation()))
+# Jetson boards, whose nvv4l2decoder decodes MJPEG in hardware
+IS_JETSON = Path("/etc/nv_tegra_release").exists()
+# GStreamer capture pipelines that decode the camera's MJPEG stream and keep
+# only the newest frame
+CAMERA_PIPELINE = (
+    "v4l2src device=/dev/video{index} ! image/jpeg,width=640,height=480 ! "
+    "jpegdec ! videoconvert ! video/x-raw,format=BGR ! appsink drop=1 max-buffers=1"
+)
+JETSON_CAMERA_PIPELINE = (
+    "v4l2src device=/dev/video{index} ! image/jpeg,width=640,height=480 ! "
+    "nvv4l2decoder mjpeg=1 ! nvvidconv ! video/x-raw,format=BGRx ! "
+    "videoconvert ! video/x-raw,format=BGR ! appsink drop=1 max-buffers=1"
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Detection:
     """A detected object in an image."""
 
@@ -21,7 +47,7 @@ class Detection:
     center: tuple[int, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameAnalysis:
     """Analysis results for a video frame."""
 
@@ -30,6 +56,19 @@ class FrameAnalysis:
     timestamp: float
 
 
+def frame_hash(frame: np.ndarray) -> int:
+    """Compute a 64-bit difference hash (dHash) of a frame.
+
+    Each bit says whether a pixel of a 9x8 grayscale thumbnail is brighter
+    than its left neighbour, so similar frames differ in only a few bits.
+    """
+    if frame.ndim == 3:
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    thumbnail = cv2.resize(frame, (9, 8), interpolation=cv2.INTER_AREA)
+    bits = thumbnail[:, 1:] > thumbnail[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
 class VisionProcessor:
     """Handles computer vision tasks using YOLO for object detection.
 
@@ -39,34 +78,190 @@ class VisionProcessor:
     def __init__(self, settings: VisionSettings) -> None:
         self.settings = settings
         self._model: Any = None
+        # Second engine on a Jetson DLA core, run alongside the GPU one
+        self._dla_model: Any = None
         self._camera: cv2.VideoCapture | None = None
+        # Whether the camera only ever holds its newest frame
+        self._camera_drops_stale = False
+        # Inference and camera reads each run on their own thread, so YOLO
+        # keeps one thread for its state and a frame can be read while the
+        # previous one is being analyzed
+        self._executor: ThreadPoolExecutor | None = None
+        self._dla_executor: ThreadPoolExecutor | None = None
+        self._capture_executor: ThreadPoolExecutor | None = None
 
     def _load_model(self) -> Any:
-        """Lazy load the YOLO model."""
+        """Lazy load the YOLO model, exported for speed unless precision is fp32."""
         if self._model is None:
             from ultralytics import YOLO
 
-            self._model = YOLO(self.settings.model)
+            precision = self.settings.precision
+            if precision == "fp32":
+                self._model = YOLO(self.settings.model)
+            else:
+                self._model = YOLO(str(self._export_model(precision)))
         return self._model
 
+    def _load_dla_model(self) -> Any:
+        """Lazy load the YOLO engine built for DLA core 0."""
+        if self._dla_model is None:
+            from ultralytics import YOLO
+
+            self._dla_model = YOLO(str(self._export_model(self.settings.precision, dla=True)))
+        return self._dla_model
+
+    @property
+    def _use_dla(self) -> bool:
+        """Whether frames are shared between the GPU and a DLA core."""
+        return self.settings.use_dla and IS_JETSON and self.settings.precision != "fp32"
+
+    def _export_model(self, precision: str, dla: bool = False) -> Path:
+        """Export the model for faster inference, unless already exported.
+
+        With CUDA this builds a TensorRT engine, using fp16 for int8 when no
+        calibration data is configured. Without CUDA, where TensorRT can't
+        run, it exports fp32 ONNX for ONNX Runtime instead. Exports take
+        minutes, so they are kept next to the weights as
+        <model>.<precision>[.dla0].<engine|onnx> and reused on later runs.
+
+        Args:
+            precision: fp16 or int8
+            dla: Build the engine for Jetson DLA core 0 instead of the GPU
+        """
+        import torch
+        from ultralytics import YOLO
+
+        if not torch.cuda.is_available():
+            export_format, precision = "onnx", "fp32"
+        else:
+            export_format = "engine"
+            if precision == "int8" and not Path(self.settings.calibration_data).is_file():
+                precision = "fp16"
+        target = ".dla0" if dla else ""
+        print(f"Using {precision} {export_format}{target} vision model")
+
+        export_path = Path(self.settings.model).with_suffix(
+            f".{precision}{target}.{export_format}"
+        )
+        if not export_path.exists():
+            exported = YOLO(self.settings.model).export(
+                format=export_format,
+                half=precision == "fp16",
+                int8=precision == "int8",
+                data=self.settings.calibration_data or None,
+                workspace=4 if export_format == "engine" else None,
+                device="dla:0" if dla else None,
+            )
+            Path(exported).replace(export_path)
+        return export_path
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the YOLO inference thread, starting it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yolo")
+        return self._executor
+
+    def _get_dla_executor(self) -> ThreadPoolExecutor:
+        """Get the DLA inference thread, starting it on first use."""
+        if self._dla_executor is None:
+            self._dla_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yolo-dla")
+        return self._dla_executor
+
+    def _get_capture_executor(self) -> ThreadPoolExecutor:
+        """Get the camera capture thread, starting it on first use."""
+        if self._capture_executor is None:
+            self._capture_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="camera"
+            )
+        return self._capture_executor
+
+    async def preload(self) -> None:
+        """Load the YOLO model now rather than on first use."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._get_executor(), self._load_model)
+        if self._use_dla:
+            await loop.run_in_executor(self._get_dla_executor(), self._load_dla_model)
+
     def _get_camera(self) -> cv2.VideoCapture:
         """Get or create camera capture."""
         if self._camera is None or not self._camera.isOpened():
+            if self._open_pipeline():
+                return self._camera
+
+            self._camera_drops_stale = False
             self._camera = cv2.VideoCapture(self.settings.camera_index)
             self._camera.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
             self._camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+            # Hold one frame at most, so a read is never several frames behind
+            self._camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
         return self._camera
 
-    async def capture_frame(self) -> np.ndarray | None:
-        """Capture a single frame from the camera."""
+    def _open_pipeline(self) -> bool:
+        """Open the camera through a GStreamer decode pipeline, if possible.
+
+        The default V4L2 backend decodes MJPEG on the CPU; GStreamer can use
+        the hardware decoder on Jetson. Returns False when GStreamer isn't
+        available or the camera can't deliver 640x480 MJPEG.
+        """
+        if not GSTREAMER_AVAILABLE or not sys.platform.startswith("linux"):
+            return False
+
+        pipeline = JETSON_CAMERA_PIPELINE if IS_JETSON else CAMERA_PIPELINE
+        camera = cv2.VideoCapture(
+            pipeline.format(index=self.settings.camera_index), cv2.CAP_GSTREAMER
+        )
+        if not camera.isOpened():
+            camera.release()
+            return False
+
+        self._camera = camera
+        self._camera_drops_stale = True
+        return True
+
+    async def capture_frame(self, latest: bool = True) -> np.ndarray | None:
+        """Capture a single frame from the camera.
+
+        Args:
+            latest: Discard the frame the driver buffered since the last
+                read, which may be from long ago, and wait for a new one.
+                Not needed when reading frames back to back.
+        """
         loop = asyncio.get_running_loop()
 
         def capture() -> np.ndarray | None:
             camera = self._get_camera()
+            if latest and not self._camera_drops_stale:
+                camera.grab()
             ret, frame = camera.read()
             return frame if ret else None
 
-        return await loop.run_in_executor(None, capture)
+        return await loop.run_in_executor(self._get_capture_executor(), capture)
+
+    def _prepare_frames(self, frames: list[np.ndarray]) -> Any:
+        """Convert frames to a normalized RGB batch on the GPU when possible.
+
+        Given arrays, Ultralytics converts, scales and transposes each frame
+        on the CPU; given a BCHW float tensor, it uses it as-is. The tensor
+        skips letterboxing, so it is only built for PyTorch weights on CUDA
+        when the frames already fit the model stride.
+        """
+        import torch
+
+        if self.settings.precision != "fp32" or not torch.cuda.is_available():
+            return frames
+
+        shape = frames[0].shape
+        if (
+            len(shape) != 3
+            or shape[0] % MODEL_STRIDE
+            or shape[1] % MODEL_STRIDE
+            or any(frame.shape != shape for frame in frames)
+        ):
+            return frames
+
+        batch = torch.from_numpy(np.stack(frames)).to("cuda")
+        # BGR -> RGB, BHWC -> BCHW, uint8 -> float in [0, 1]
+        return batch.flip(-1).permute(0, 3, 1, 2).float().div_(255)
 
     async def detect_objects(
         self, frame: np.ndarray, confidence_threshold: float | None = None
@@ -80,35 +275,94 @@ class VisionProcessor:
         Returns:
             List of detected objects
         """
-        threshold = confidence_threshold or self.settings.confidence_threshold
-        model = self._load_model()
+        return (await self.detect_objects_batch([frame], confidence_threshold))[0]
 
-        loop = asyncio.get_running_loop()
+    async def detect_objects_batch(
+        self, frames: list[np.ndarray], confidence_threshold: float | None = None
+    ) -> list[list[Detection]]:
+        """Detect objects in several frames at once.
 
-        def run_detection() -> list[Detection]:
-            results = model(frame, verbose=False)[0]
-            detections = []
+        PyTorch weights take the frames as one batch. With use_dla on a
+        Jetson, alternate frames go to the GPU and DLA engines, which run in
+        parallel.
 
-            for box in results.boxes:
-                conf = float(box.conf[0])
-                if conf < threshold:
-                    continue
+        Args:
+            frames: Images as numpy arrays (BGR format from OpenCV)
+            confidence_threshold: Minimum confidence for detections
 
-                x1, y1, x2, y2 = map(int, box.xyxy[0])
-                label = results.names[int(box.cls[0])]
+        Returns:
+            List of detected objects for each frame
+        """
+        threshold = confidence_threshold or self.settings.confidence_threshold
+        if not self._use_dla or len(frames) < 2:
+            return await self._run_model(
+                self._load_model, self._get_executor(), frames, threshold
+            )
+
+        gpu_detections, dla_detections = await asyncio.gather(
+            self._run_model(self._load_model, self._get_executor(), frames[0::2], threshold),
+            self._run_model(
+                self._load_dla_model, self._get_dla_executor(), frames[1::2], threshold
+            ),
+        )
+        batch_detections: list[list[Detection]] = [[] for _ in frames]
+        batch_detections[0::2] = gpu_detections
+        batch_detections[1::2] = dla_detections
+        return batch_detections
+
+    async def _run_model(
+        self,
+        load_model: Callable[[], Any],
+        executor: ThreadPoolExecutor,
+        frames: list[np.ndarray],
+        threshold: float,
+    ) -> list[list[Detection]]:
+        """Run a model over frames on its inference thread.
+
+        Exported engines are built for one frame, so they are run on each
+        frame in turn.
+        """
+        loop = asyncio.get_running_loop()
 
-                detections.append(
-                    Detection(
-                        label=label,
-                        confidence=conf,
-                        bbox=(x1, y1, x2, y2),
-                        center=((x1 + x2) // 2, (y1 + y2) // 2),
-                    )
+        def run_detection() -> list[list[Detection]]:
+            model = load_model()
+            if self.settings.precision == "fp32":
+                batch_results = model(self._prepare_frames(frames), verbose=False)
+            else:
+                batch_results = [model(frame, verbose=False)[0] for frame in frames]
+            batch_detections = []
+
+            for results in batch_results:
+                # Copy each box array to the host once rather than per box
+                boxes = results.boxes
+                conf = boxes.conf.cpu().numpy()
+                keep = conf >= threshold
+                xyxy = boxes.xyxy.cpu().numpy()[keep].astype(np.int32)
+                cls = boxes.cls.cpu().numpy()[keep].astype(np.int32)
+                centers = (xyxy[:, :2] + xyxy[:, 2:]) // 2
+                names = results.names
+
+                batch_detections.append(
+                    [
+                        Detection(
+                            label=names[label_index],
+                            confidence=confidence,
+                            bbox=tuple(bbox),
+                            center=tuple(center),
+                        )
+                        for bbox, center, confidence, label_index in zip(
+                            xyxy.tolist(),
+                            centers.tolist(),
+                            conf[keep].tolist(),
+                            cls.tolist(),
+                            strict=True,
+                        )
+                    ]
                 )
 
-            return detections
+            return batch_detections
 
-        return await loop.run_in_executor(None, run_detection)
+        return await loop.run_in_executor(executor, run_detection)
 
     async def analyze_frame(self, frame: np.ndarray | None = None) -> FrameAnalysis:
         """Analyze a frame or capture and analyze.
@@ -119,8 +373,6 @@ class VisionProcessor:
         Returns:
             FrameAnalysis with detections and frame
         """
-        import time
-
         if frame is None:
             frame = await self.capture_frame()
             if frame is None:
@@ -134,19 +386,75 @@ class VisionProcessor:
             timestamp=time.time(),
         )
 
-    async def stream_analysis(self, interval: float = 0.5) -> AsyncIterator[FrameAnalysis]:
+    async def _capture_frames(self, count: int) -> list[np.ndarray]:
+        """Capture frames back to back from the camera."""
+        frames = []
+        for index in range(count):
+            frame = await self.capture_frame(latest=index == 0)
+            if frame is None:
+                raise RuntimeError("Failed to capture frame")
+            frames.append(frame)
+        return frames
+
+    async def stream_analysis(
+        self, interval: float = 0.5, batch_size: int = 1
+    ) -> AsyncIterator[FrameAnalysis]:
         """Continuously analyze camera frames.
 
+        Frames that look the same as the last analyzed frame (by frame_hash)
+        reuse its detections instead of running the model, so a still scene
+        costs almost nothing.
+
         Args:
             interval: Seconds between analyses
+            batch_size: Frames captured and analyzed together. Larger batches
+                keep a GPU busier with PyTorch weights; with use_dla, 2 or
+                more lets the GPU and DLA engines share the frames.
 
         Yields:
             FrameAnalysis for each processed frame
         """
+        last_hash: int | None = None
+        last_detections: list[Detection] = []
+
         while True:
             try:
-                analysis = await self.analyze_frame()
-                yield analysis
+                frames = await self._capture_frames(batch_size)
+
+                # Index into changed_frames of the frame whose detections each
+                # frame uses; -1 means the last analyzed frame before the batch
+                sources = []
+                changed_frames = []
+                reference_hash = last_hash
+                for frame in frames:
+                    current_hash = frame_hash(frame)
+                    if (
+                        reference_hash is None
+                        or (current_hash ^ reference_hash).bit_count() >= CHANGED_FRAME_BITS
+                    ):
+                        reference_hash = current_hash
+                        changed_frames.append(frame)
+                    sources.append(len(changed_frames) - 1)
+
+                batch_detections = []
+                if changed_frames:
+                    batch_detections = await self.detect_objects_batch(changed_frames)
+                timestamp = time.time()
+
+                analyses = [
+                    FrameAnalysis(
+                        detections=batch_detections[source] if source >= 0 else last_detections,
+                        frame=frame,
+                        timestamp=timestamp,
+                    )
+                    for frame, source in zip(frames, sources, strict=True)
+                ]
+                last_hash = reference_hash
+                if batch_detections:
+                    last_detections = batch_detections[-1]
+
+                for analysis in analyses:
+                    yield analysis
                 await asyncio.sleep(interval)
             except RuntimeError:
                 # Camera error, wait and retry
@@ -157,18 +465,14 @@ class VisionProcessor:
         if not detections:
             return "I don't see anything notable."
 
-        # Count objects by type
-        counts: dict[str, int] = {}
-        for det in detections:
-            counts[det.label] = counts.get(det.label, 0) + 1
+        # Count objects by type, most common first (ties in order seen)
+        counts = Counter(det.label for det in detections)
 
         # Build description
-        parts = []
-        for label, count in sorted(counts.items(), key=lambda x: -x[1]):
-            if count == 1:
-                parts.append(f"a {label}")
-            else:
-                parts.append(f"{count} {label}s")
+        parts = [
+            f"a {label}" if count == 1 else f"{count} {label}s"
+            for label, count in counts.most_common()
+        ]
 
         if len(parts) == 1:
             return f"I see {parts[0]}."
@@ -182,3 +486,9 @@ class VisionProcessor:
         if self._camera is not None:
             self._camera.release()
             self._camera = None
+        for executor in (self._executor, self._dla_executor, self._capture_executor):
+            if executor is not None:
+                executor.shutdown(wait=False)
+        self._executor = None
+        self._dla_executor = None
+        self._capture_executor = None
@@ -1,18 +1,30 @@
 """FastAPI web server for J.A.R.V.I.S. configuration UI."""
 
-import json
+import time
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
 import asyncio
 
+import numpy as np
+import orjson
 from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
+from brain.providers.base import create_http_client
 from core.config import LLMProvider, Settings
+from skills.storage import write_json
+
+# States the core display can show
+CORE_STATES = frozenset({"standby", "listening", "thinking", "speaking"})
+# Seconds to wait when testing a service connection
+TEST_CONNECTION_TIMEOUT = 5.0
+# First byte of binary core display messages, saying what follows
+VISUALIZER_MESSAGE = b"\x02"  # One byte (0-255) per visualizer level
 
 
 class SettingsUpdate(BaseModel):
@@ -69,20 +81,30 @@ class SettingsManager:
         self.data_dir = data_dir
         self.settings_path = data_dir / "settings.json"
         self._settings: dict[str, Any] = {}
+        # Bumped on every save; with the instance token, identifies the
+        # current settings across restarts
+        self._version = 0
+        self._instance = time.time_ns()
         self._load()
 
     def _load(self) -> None:
         """Load settings from disk."""
         if self.settings_path.exists():
             try:
-                self._settings = json.loads(self.settings_path.read_text())
+                self._settings = orjson.loads(self.settings_path.read_bytes())
             except Exception:
                 self._settings = {}
 
     def _save(self) -> None:
         """Save settings to disk."""
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.settings_path.write_text(json.dumps(self._settings, indent=2))
+        write_json(self.settings_path, self._settings)
+        self._version += 1
+
+    @property
+    def etag(self) -> str:
+        """Weak ETag that changes whenever the settings are saved."""
+        return f'W/"{self._instance}-{self._version}"'
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a setting value."""
@@ -192,22 +214,34 @@ class CoreStateManager:
         if websocket in self.connections:
             self.connections.remove(websocket)
 
+    async def _send_all(self, send: Callable[[WebSocket], Awaitable[None]]) -> None:
+        """Send to all connected clients at once, dropping any that fail.
+
+        Sends run concurrently so one slow client doesn't hold up the rest.
+        """
+        connections = self.connections[:]
+        results = await asyncio.gather(
+            *(send(connection) for connection in connections), return_exceptions=True
+        )
+        for connection, result in zip(connections, results, strict=True):
+            if isinstance(result, Exception):
+                self.disconnect(connection)
+
     async def broadcast_state(self, state: str) -> None:
         """Broadcast state change to all connected clients."""
         self.current_state = state
-        for connection in self.connections:
-            try:
-                await connection.send_json({"state": state})
-            except Exception:
-                pass
+        message = orjson.dumps({"state": state}).decode()
+        await self._send_all(lambda connection: connection.send_text(message))
 
     async def broadcast_visualizer(self, data: list[int]) -> None:
-        """Broadcast visualizer data to all connected clients."""
-        for connection in self.connections:
-            try:
-                await connection.send_json({"visualizer": data})
-            except Exception:
-                pass
+        """Broadcast visualizer levels (0-255) to all connected clients.
+
+        Sent at audio rate, so levels go out as a binary message of one
+        byte each rather than as JSON.
+        """
+        levels = np.clip(data, 0, 255).astype(np.uint8)
+        message = VISUALIZER_MESSAGE + levels.tobytes()
+        await self._send_all(lambda connection: connection.send_bytes(message))
 
 
 # Global state manager for core display
@@ -225,7 +259,10 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         """Lifespan context manager for startup/shutdown."""
+        # One connection pool for all outgoing requests
+        app.state.http = create_http_client()
         yield
+        await app.state.http.aclose()
         # Shutdown: clean up WebSocket connections
         for ws in core_state_manager.connections[:]:
             try:
@@ -246,21 +283,32 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     if static_dir.exists():
         app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
+    # Pages are read once and served from memory
+    templates_dir = Path(__file__).parent / "templates"
+
+    def read_page(name: str) -> bytes | None:
+        """Read a page template, or None if it is missing."""
+        path = templates_dir / name
+        return path.read_bytes() if path.exists() else None
+
+    index_html = read_page("index.html")
+    core_html = read_page("core.html")
+
+    def page_response(content: bytes | None) -> HTMLResponse:
+        """Serve a page read at startup."""
+        if content is None:
+            return HTMLResponse(content="<h1>Template not found</h1>", status_code=500)
+        return HTMLResponse(content=content)
+
     @app.get("/", response_class=HTMLResponse)
     async def index(request: Request) -> HTMLResponse:
         """Serve the main configuration page."""
-        template_path = Path(__file__).parent / "templates" / "index.html"
-        if template_path.exists():
-            return HTMLResponse(content=template_path.read_text())
-        return HTMLResponse(content="<h1>Template not found</h1>", status_code=500)
+        return page_response(index_html)
 
     @app.get("/core", response_class=HTMLResponse)
     async def core_display(request: Request) -> HTMLResponse:
         """Serve the power core visualization page."""
-        template_path = Path(__file__).parent / "templates" / "core.html"
-        if template_path.exists():
-            return HTMLResponse(content=template_path.read_text())
-        return HTMLResponse(content="<h1>Template not found</h1>", status_code=500)
+        return page_response(core_html)
 
     @app.websocket("/ws/core")
     async def core_websocket(websocket: WebSocket) -> None:
@@ -272,18 +320,44 @@ def create_app(settings: Settings | None = None) -> FastAPI:
                 data = await websocket.receive_text()
                 # Client can send state updates (e.g., from voice activity)
                 try:
-                    msg = json.loads(data)
-                    if "state" in msg:
-                        await core_state_manager.broadcast_state(msg["state"])
-                except json.JSONDecodeError:
-                    pass
+                    msg = orjson.loads(data)
+                except orjson.JSONDecodeError:
+                    continue
+                if not isinstance(msg, dict):
+                    continue
+                state = msg.get("state")
+                # Lists and objects are unhashable, so check the type first
+                if isinstance(state, str) and state in CORE_STATES:
+                    await core_state_manager.broadcast_state(state)
         except (WebSocketDisconnect, RuntimeError):
             # RuntimeError can occur if WebSocket disconnects between accept and receive
             core_state_manager.disconnect(websocket)
 
+    # Encoded settings response and the ETag it was built for
+    settings_response: tuple[str, bytes] | None = None
+
     @app.get("/api/settings")
-    async def get_settings() -> dict[str, Any]:
-        """Get current settings."""
+    async def get_settings(request: Request) -> Response:
+        """Get current settings.
+
+        The encoded response is reused until settings are saved, and clients
+        that send the current ETag get a 304 instead.
+        """
+        nonlocal settings_response
+        etag = settings_manager.etag
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        if settings_response is None or settings_response[0] != etag:
+            settings_response = (etag, orjson.dumps(_settings_view()))
+        return Response(
+            content=settings_response[1],
+            media_type="application/json",
+            headers={"ETag": etag},
+        )
+
+    def _settings_view() -> dict[str, Any]:
+        """Build the settings shown in the UI from stored values and defaults."""
         stored = settings_manager.get_all()
 
         # Merge with defaults, masking sensitive values
@@ -381,37 +455,34 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         """Test connection to a service."""
         service = data.get("service")
 
-        if service == "ollama":
-            import httpx
+        client = app.state.http
 
+        if service == "ollama":
             try:
-                async with httpx.AsyncClient(timeout=5.0) as client:
-                    url = data.get("url", "http://localhost:11434")
-                    response = await client.get(f"{url}/api/tags")
-                    if response.status_code == 200:
-                        models = response.json().get("models", [])
-                        return {
-                            "success": True,
-                            "message": f"Connected! Found {len(models)} models.",
-                            "models": [m["name"] for m in models],
-                        }
+                url = data.get("url", "http://localhost:11434")
+                response = await client.get(f"{url}/api/tags", timeout=TEST_CONNECTION_TIMEOUT)
+                if response.status_code == 200:
+                    models = response.json().get("models", [])
+                    return {
+                        "success": True,
+                        "message": f"Connected! Found {len(models)} models.",
+                        "models": [m["name"] for m in models],
+                    }
             except Exception as e:
                 return {"success": False, "message": str(e)}
 
         elif service == "home_assistant":
-            import httpx
-
             try:
-                async with httpx.AsyncClient(timeout=5.0) as client:
-                    url = data.get("url", "")
-                    token = data.get("token", "")
-                    response = await client.get(
-                        f"{url}/api/",
-                        headers={"Authorization": f"Bearer {token}"},
-                    )
-                    if response.status_code == 200:
-                        return {"success": True, "message": "Connected to Home Assistant!"}
-                    return {"success": False, "message": f"HTTP {response.status_code}"}
+                url = data.get("url", "")
+                token = data.get("token", "")
+                response = await client.get(
+                    f"{url}/api/",
+                    headers={"Authorization": f"Bearer {token}"},
+                    timeout=TEST_CONNECTION_TIMEOUT,
+                )
+                if response.status_code == 200:
+                    return {"success": True, "message": "Connected to Home Assistant!"}
+                return {"success": False, "message": f"HTTP {response.status_code}"}
             except Exception as e:
                 return {"success": False, "message": str(e)}
 